@@ -0,0 +1,61 @@
+"""Span extraction and the `Parser` rules with each installed regex engine.
+
+Usage: python -m benchmarks.bench_backends
+"""
+
+import importlib
+import time
+
+from dateparser_tw import parser
+from dateparser_tw.backend import compile_pattern
+from dateparser_tw.helpers.corpus import generate_corpus
+from dateparser_tw.normalizer import extract_span_positions, sanitize_date
+from dateparser_tw.resource.pattern import r as PATTERN_SOURCE
+
+ENGINES = ["re", "regex", "re2"]
+MESSAGES = 300
+
+
+def rule_sources():
+    rules = [value for name, value in vars(parser).items() if name.startswith("RE_")]
+    return [rule.pattern for rule in [*rules, *parser.PREP_RULES.values()]]
+
+
+def main():
+    corpus = [sanitize_date(message) for message in generate_corpus(MESSAGES, seed=3)]
+    characters = sum(map(len, corpus))
+    print(f"{MESSAGES} messages, {characters} characters")
+    print(f"{'engine':<8}{'compile ms':>12}{'extract ms':>12}{'rules ms':>10}")
+
+    for name in ENGINES:
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            print(f"{name:<8}{'not installed':>12}")
+            continue
+
+        start = time.perf_counter()
+        pattern = compile_pattern(PATTERN_SOURCE, module=module)
+        rules = [compile_pattern(source, module=module) for source in rule_sources()]
+        compiled = time.perf_counter()
+
+        spans = [
+            text[start:end]
+            for text in corpus
+            for start, end in extract_span_positions(text, pattern)
+        ]
+        extracted = time.perf_counter()
+
+        for span in spans:
+            for rule in rules:
+                rule.search(span)
+        searched = time.perf_counter()
+
+        print(
+            f"{name:<8}{(compiled - start) * 1e3:>12.1f}"
+            f"{(extracted - compiled) * 1e3:>12.1f}{(searched - extracted) * 1e3:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
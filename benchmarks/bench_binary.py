@@ -0,0 +1,44 @@
+"""Size and speed of the binary encoding of parse results, compared with
+pickling the models and with JSON from `model_dump`.
+
+Usage: python -m benchmarks.bench_binary
+"""
+
+import json
+import pickle
+import timeit
+
+from dateparser_tw.binary import decode_batch, encode_batch
+from dateparser_tw.dataclasses import TimePoint
+from dateparser_tw.normalizer import DateParser
+
+TEXTS = ["明天下午三點", "下週五晚上", "上個月", "2024年5月3日", "三天後", "去年"]
+NUMBER = 20
+
+
+def main():
+    tps = DateParser().parse_batch(TEXTS * 500, "2024-07-15 10:00:00")
+    methods = {
+        "binary": (encode_batch, decode_batch),
+        "pickle": (pickle.dumps, pickle.loads),
+        "json": (
+            lambda tps: json.dumps([tp.model_dump(mode="json") for tp in tps]),
+            lambda data: [TimePoint(**fields) for fields in json.loads(data)],
+        ),
+    }
+
+    print(f"{len(tps)} results")
+    print(f"{'method':<8}{'bytes/result':>14}{'encode µs':>12}{'decode µs':>12}")
+    for name, (dumps, loads) in methods.items():
+        data = dumps(tps)
+        assert loads(data) == tps
+        encode = timeit.timeit(lambda: dumps(tps), number=NUMBER) / NUMBER
+        decode = timeit.timeit(lambda: loads(data), number=NUMBER) / NUMBER
+        print(
+            f"{name:<8}{len(data) / len(tps):>14.1f}"
+            f"{encode / len(tps) * 1e6:>12.2f}{decode / len(tps) * 1e6:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
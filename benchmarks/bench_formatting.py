@@ -0,0 +1,33 @@
+"""Compare `str(TimePoint)` with the precompiled templates of `formatting.py`.
+
+Usage: python -m benchmarks.bench_formatting
+"""
+
+import time
+
+from dateparser_tw import DateParser
+from dateparser_tw.formatting import format_batch, format_timepoint
+
+TARGETS = ["2024年5月", "明天", "明天晚上", "下午3點", "12點12分57秒", "上週五"]
+COPIES = 20000
+
+
+def timed(label: str, func, n: int):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<26}{elapsed / n * 1e6:>8.2f} µs/result")
+
+
+def main():
+    tps = DateParser().parse_batch(TARGETS, basetime="2024-07-15") * COPIES
+    n = len(tps)
+
+    timed("str(tp)", lambda: [str(tp) for tp in tps], n)
+    timed("format_timepoint(tp)", lambda: [format_timepoint(tp) for tp in tps], n)
+    timed("format_batch(zh)", lambda: format_batch(tps), n)
+    timed("format_batch(iso)", lambda: format_batch(tps, "iso"), n)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Parse with a process pool, the workers writing into shared-memory columns
+(`parse_parallel`), compared with `ProcessPoolExecutor.map` pickling every
+`TimePoint` back to the parent.
+
+With the result cache of the workers, parsing the repeated texts is cheap and
+the cost of moving the results back dominates.
+
+Usage: python -m benchmarks.bench_parallel [workers]
+"""
+
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import arrow
+
+from dateparser_tw.normalizer import DateParser
+from dateparser_tw.parallel import ROW_BYTES, parse_parallel
+
+PHRASES = [
+    "明天下午三點",
+    "下週五",
+    "上個月",
+    "2024年5月3日",
+    "三天後",
+    "晚上8點半",
+    "去年",
+    "沒有時間",
+]
+TEXTS = [PHRASES[i % len(PHRASES)] for i in range(200_000)]
+BASETIME = "2024-07-15 10:00:00"
+CHUNK_SIZE = 2048
+CACHE_SIZE = 1024
+
+_parser = _basetime = None
+
+
+def _init():
+    global _parser, _basetime
+    _parser = DateParser(cache_size=CACHE_SIZE)
+    _basetime = arrow.get(BASETIME, tzinfo=_parser.tz)
+
+
+def _parse(text):
+    try:
+        return _parser.parse(text, _basetime)
+    except (ValueError, KeyError, IndexError):
+        return None
+
+
+def pickled(workers, texts):
+    with ProcessPoolExecutor(workers, initializer=_init) as pool:
+        return list(pool.map(_parse, texts, chunksize=CHUNK_SIZE))
+
+
+def shared(workers, texts):
+    return parse_parallel(
+        texts,
+        BASETIME,
+        workers=workers,
+        chunk_size=CHUNK_SIZE,
+        cache_size=CACHE_SIZE,
+    )
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    print(f"{len(TEXTS)} texts, {len(PHRASES)} distinct, workers={workers}")
+    for name, func in [("pickled map", pickled), ("shared columns", shared)]:
+        start = time.perf_counter()
+        results = func(workers, TEXTS)
+        elapsed = time.perf_counter() - start
+        if name == "pickled map":
+            size = len(pickle.dumps(results))
+        else:
+            size = len(TEXTS) * ROW_BYTES
+            results.close()
+        print(
+            f"{name:<16}{elapsed:>8.3f}s{len(TEXTS) / elapsed:>12.0f} texts/s"
+            f"{size:>12} bytes of results"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Size of `PATTERN` and the cost of extraction on text mixing full-width,
+simplified and variant characters, which `sanitize_date` canonicalizes before
+matching.
+
+Usage: python -m benchmarks.bench_pattern
+"""
+
+import timeit
+
+from dateparser_tw.helpers.str_common import canonicalize
+from dateparser_tw.normalizer import extract_spans, sanitize_date
+from dateparser_tw.resource.pattern import PATTERN, r
+
+TEXTS = [
+    "下周三下午３：３０開會",
+    "明天早上9点到公司",
+    "国庆节前两天",
+    "上個禮拜五晚上八點",
+    "２０２４年５月３日",
+    "三天后的下午",
+    "去年圣诞节",
+    "這週日中午12點",
+]
+NUMBER = 200
+
+
+def main():
+    print(f"pattern: {len(r)} characters, {r.count('|') + 1} alternatives")
+
+    corpus = "，".join(TEXTS * 10)
+    canonical = timeit.timeit(lambda: canonicalize(corpus), number=NUMBER)
+    sanitize = timeit.timeit(lambda: sanitize_date(corpus), number=NUMBER)
+    sanitized = sanitize_date(corpus)
+    extract = timeit.timeit(lambda: extract_spans(sanitized, PATTERN), number=NUMBER)
+
+    print(f"corpus: {len(corpus)} characters")
+    print(f"{'canonicalize µs':<20}{canonical / NUMBER * 1e6:>10.1f}")
+    print(f"{'sanitize_date µs':<20}{sanitize / NUMBER * 1e6:>10.1f}")
+    print(f"{'extract_spans µs':<20}{extract / NUMBER * 1e6:>10.1f}")
+    print(f"spans: {len(extract_spans(sanitized, PATTERN))}")
+
+
+if __name__ == "__main__":
+    main()
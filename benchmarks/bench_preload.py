@@ -0,0 +1,71 @@
+"""First request of a forked worker, with and without `preload` in the parent:
+its latency, and the memory it stops sharing with the parent.
+
+Usage: python -m benchmarks.bench_preload [runs]
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+import textwrap
+
+# a worker forked after an optional `preload`, reporting its first request
+WORKER = textwrap.dedent("""
+    import gc, json, os, sys, time
+
+    import dateparser_tw
+
+    if sys.argv[1] == "preload":
+        dateparser_tw.preload()
+    parser = dateparser_tw.DateParser()
+
+
+    def private_kb():
+        with open("/proc/self/smaps_rollup") as f:
+            return sum(
+                int(line.split()[1])
+                for line in f
+                if line.startswith(("Private_Clean", "Private_Dirty"))
+            )
+
+
+    r, w = os.pipe()
+    if os.fork() == 0:
+        before = private_kb()
+        start = time.perf_counter()
+        parser.parse("下週5晚上8點", "2024-07-15 10:00:00")
+        latency = time.perf_counter() - start
+        gc.collect()
+        report = {"latency": latency, "private_kb": private_kb() - before}
+        os.write(w, json.dumps(report).encode())
+        os._exit(0)
+    os.wait()
+    print(os.read(r, 1024).decode())
+    """)
+
+
+def fork_worker(mode: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", WORKER, mode],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        check=True,
+        text=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"{runs} forked workers per mode, medians")
+    print(f"{'mode':<10}{'first parse ms':>16}{'private kB':>12}")
+    for mode in ["cold", "preload"]:
+        reports = [fork_worker(mode) for _ in range(runs)]
+        latency = statistics.median(report["latency"] for report in reports)
+        private_kb = statistics.median(report["private_kb"] for report in reports)
+        print(f"{mode:<10}{latency * 1000:>16.2f}{private_kb:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
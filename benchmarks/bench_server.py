@@ -0,0 +1,70 @@
+"""Compare in-process parsing with calls to the parsing daemon.
+
+Usage: python -m benchmarks.bench_server
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+
+from dateparser_tw import DateParser
+from dateparser_tw.client import ParseClient
+from dateparser_tw.helpers.corpus import generate_corpus
+from dateparser_tw.server import ParseServer
+
+BASETIME = "2024-07-15 10:00:00"
+
+
+def start_server(path: str):
+    loop = asyncio.new_event_loop()
+    server = ParseServer()
+    loop.run_until_complete(server.start_unix(path))
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+
+
+def timed(label: str, func, n: int):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28}{elapsed / n * 1e6:>10.1f} µs/text{n / elapsed:>10.0f} texts/s")
+
+
+def main():
+    texts = generate_corpus(2000, length=20, density=0.3, seed=0)
+    path = os.path.join(tempfile.mkdtemp(), "dateparser-tw.sock")
+    start_server(path)
+
+    parser = DateParser()
+    client = ParseClient(path)
+
+    def in_process():
+        for text in texts:
+            try:
+                parser.parse(text, basetime=BASETIME)
+            except Exception:
+                pass
+
+    def sequential():
+        for text in texts:
+            try:
+                client.parse(text, basetime=BASETIME)
+            except ValueError:
+                pass
+
+    def pipelined():
+        for start in range(0, len(texts), 256):
+            try:
+                client.parse_many(texts[start : start + 256], basetime=BASETIME)
+            except ValueError:
+                pass
+
+    in_process()  # warm up
+    timed("in-process", in_process, len(texts))
+    timed("daemon, one at a time", sequential, len(texts))
+    timed("daemon, pipelined x256", pipelined, len(texts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Parse a text column inside SQLite with the `tw_*` functions, compared with
+fetching the rows, calling `DateParser.parse` and writing the results back.
+
+Usage: python -m benchmarks.bench_sqlite
+"""
+
+import sqlite3
+import time
+
+from dateparser_tw.formatting import format_timepoint
+from dateparser_tw.normalizer import DateParser
+from dateparser_tw.sqlite import register
+
+PHRASES = [
+    "明天下午三點",
+    "下週五",
+    "上個月",
+    "2024年5月3日",
+    "三天後",
+    "晚上8點半",
+    "去年",
+    "沒有時間",
+]
+ROWS = 50_000
+BASETIME = "2024-07-15 10:00:00"
+
+
+def create():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE tickets (body TEXT, parsed TEXT)")
+    connection.executemany(
+        "INSERT INTO tickets (body) VALUES (?)",
+        ((PHRASES[i % len(PHRASES)],) for i in range(ROWS)),
+    )
+    return connection
+
+
+def in_python(connection):
+    parser = DateParser()
+    rows = connection.execute("SELECT rowid, body FROM tickets").fetchall()
+    results = []
+    for rowid, body in rows:
+        try:
+            results.append(
+                (format_timepoint(parser.parse(body, BASETIME), "iso"), rowid)
+            )
+        except (ValueError, KeyError, IndexError):
+            results.append((None, rowid))
+    connection.executemany("UPDATE tickets SET parsed = ? WHERE rowid = ?", results)
+
+
+def in_database(connection):
+    register(connection)
+    connection.execute("UPDATE tickets SET parsed = tw_parse(body, ?)", (BASETIME,))
+
+
+def main():
+    print(f"{ROWS} rows, {len(PHRASES)} distinct texts")
+    for name, func in [("fetch + parse", in_python), ("tw_parse", in_database)]:
+        connection = create()
+        start = time.perf_counter()
+        func(connection)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<16}{elapsed:>8.3f}s{ROWS / elapsed:>12.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Drive `DateParser.parse` with a synthetic corpus and report latency as JSON.
+
+Usage:
+    python -m benchmarks.loadtest --requests 20000 --concurrency 4
+    python -m benchmarks.loadtest --rate 500 --duration 30 --length 80 --density 0.5
+    python -m benchmarks.loadtest --mode batch --batch-size 256 --concurrency 4
+    python -m benchmarks.loadtest --mode parallel --requests 200 --concurrency 4
+
+`--mode batch` makes every request a `parse_batch` call of `--batch-size`
+texts. `--mode parallel` makes it a `parse_parallel` call over
+`--concurrency` worker processes, the requests being sent one after the other.
+
+With `--rate`, requests are scheduled at a fixed rate (open loop) and latency
+is measured from the scheduled time, so queueing delay is included. Without it,
+each worker sends its next request as soon as the previous one returns.
+"""
+
+import argparse
+import gc
+import itertools
+import json
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from dateparser_tw import DateParser
+from dateparser_tw.helpers.corpus import generate_corpus
+from dateparser_tw.parallel import FAILED, NOT_FOUND, parse_parallel
+
+BASETIME = "2024-07-15 10:00:00"
+
+
+def rss_bytes() -> int:
+    """Current RSS from /proc, or the peak RSS where /proc is not available."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+
+        # peak RSS, in KiB on Linux and bytes on macOS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class GCMonitor:
+    def __init__(self):
+        self.pauses = []
+        self._start = None
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter()
+        elif self._start is not None:
+            self.pauses.append(time.perf_counter() - self._start)
+            self._start = None
+
+    def __enter__(self):
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        gc.callbacks.remove(self)
+
+
+def percentile(values, q: float) -> float:
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def batch(corpus, i: int, size: int) -> list:
+    start = i * size
+    return [corpus[j % len(corpus)] for j in range(start, start + size)]
+
+
+def send(args, parser: DateParser, corpus, i: int, errors: Counter):
+    if args.mode == "parse":
+        try:
+            parser.parse(corpus[i % len(corpus)], basetime=BASETIME)
+        except Exception as e:
+            errors[type(e).__name__] += 1
+    elif args.mode == "batch":
+        results = parser.parse_batch(batch(corpus, i, args.batch_size), BASETIME)
+        errors["unparsed"] += results.count(None)
+    else:
+        texts = batch(corpus, i, args.batch_size)
+        with parse_parallel(texts, BASETIME, workers=args.concurrency) as columns:
+            status = columns["status"]
+            errors["not_found"] += status.tolist().count(NOT_FOUND)
+            errors["failed"] += status.tolist().count(FAILED)
+
+
+def run(args) -> dict:
+    corpus = generate_corpus(args.corpus, args.length, args.density, args.seed)
+    # the processes of `parse_parallel` are the concurrency, not the threads
+    threads = 1 if args.mode == "parallel" else args.concurrency
+    texts_per_request = 1 if args.mode == "parse" else args.batch_size
+    local = threading.local()
+    counter = itertools.count()
+    lock = threading.Lock()
+    latencies, errors = [], Counter()
+
+    total = args.requests if args.rate <= 0 else int(args.rate * args.duration)
+    start = time.perf_counter()
+
+    def worker():
+        local.parser = DateParser()
+        own_latencies, own_errors = [], Counter()
+
+        while (i := next(counter)) < total:
+            scheduled = start + i / args.rate if args.rate > 0 else time.perf_counter()
+            if (delay := scheduled - time.perf_counter()) > 0:
+                time.sleep(delay)
+            send(args, local.parser, corpus, i, own_errors)
+            own_latencies.append(time.perf_counter() - scheduled)
+
+        with lock:
+            latencies.extend(own_latencies)
+            errors.update(own_errors)
+
+    rss_before = rss_bytes()
+    with GCMonitor() as monitor, ThreadPoolExecutor(threads) as executor:
+        futures = [executor.submit(worker) for _ in range(threads)]
+        for future in futures:
+            future.result()
+    elapsed = time.perf_counter() - start
+    rss_after = rss_bytes()
+
+    latencies.sort()
+    ms = 1000
+
+    return {
+        "config": vars(args),
+        "requests": len(latencies),
+        "texts": len(latencies) * texts_per_request,
+        "errors": {name: count for name, count in errors.items() if count},
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "throughput_texts_per_s": round(
+            len(latencies) * texts_per_request / elapsed, 1
+        ),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.50) * ms, 3),
+            "p95": round(percentile(latencies, 0.95) * ms, 3),
+            "p99": round(percentile(latencies, 0.99) * ms, 3),
+            "max": round(latencies[-1] * ms, 3) if latencies else 0.0,
+        },
+        "rss_bytes": {
+            "before": rss_before,
+            "after": rss_after,
+            "growth": rss_after - rss_before,
+        },
+        "gc": {
+            "collections": len(monitor.pauses),
+            "pause_total_ms": round(sum(monitor.pauses) * ms, 3),
+            "pause_max_ms": round(max(monitor.pauses, default=0.0) * ms, 3),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--mode", choices=["parse", "batch", "parallel"], default="parse"
+    )
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--rate", type=float, default=0, help="requests per second")
+    parser.add_argument(
+        "--duration", type=float, default=10, help="seconds, with --rate"
+    )
+    parser.add_argument("--corpus", type=int, default=1000, help="distinct messages")
+    parser.add_argument("--length", type=int, default=40, help="characters per message")
+    parser.add_argument("--density", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--batch-size", type=int, default=256, help="texts per request, batch modes"
+    )
+
+    print(json.dumps(run(parser.parse_args()), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ import sys
 from loguru import logger
 
 from .normalizer import DateParser
+from .preload import preload
 
 logger.remove()
 logger_format = (
@@ -14,4 +15,4 @@ logger_format = (
 default_logger = logger.add(sys.stdout, format=logger_format, level="INFO")
 
 
-__all__ = ["DateParser"]
+__all__ = ["DateParser", "preload"]
@@ -0,0 +1,180 @@
+"""Allocations of one parse, stage by stage, measured with `tracemalloc`.
+
+    python -m dateparser_tw.allocations 上週五下午三點 "2024-07-15 10:00:00"
+
+The real `DateParser.parse` runs with a `Recorder` as its metrics registry:
+every stage the pipeline reports, through `fast_path_total` or `stage_seconds`,
+ends where it is reported, and gets
+
+- `peak`, the high-water mark of the traced memory above the end of the
+  previous stage, which counts the intermediate strings and objects freed
+  before it ends, eg. the substitutions of `sanitize_date`;
+- `retained`, the bytes still allocated when the stage ends;
+- `blocks`, the memory blocks still allocated when the stage ends.
+
+The first stage is `basetime`, up to the start of the pipeline (`cache`
+instead, with a result cache). `tracemalloc` only sees live memory, so
+short-lived allocations show up in `peak` alone. Stages running once per span
+add up, with the largest `peak`. The whole `DateParser.parse`, with metrics
+off, is measured as `total`.
+"""
+
+import sys
+import tracemalloc
+from typing import Dict, NamedTuple, Optional, Union
+
+import arrow
+
+from . import metrics
+from .dataclasses import TimePoint
+from .dataclasses.timepoint import Granularity
+from .metrics import Counter, Histogram, MetricsRegistry
+from .normalizer import DateParser
+
+# the counters reporting the end of a stage, the others end none
+COUNTER_STAGES = {"parses_total": "basetime", "cache_total": "cache"}
+
+
+class StageAllocations(NamedTuple):
+    peak: int
+    retained: int
+    blocks: int
+    calls: int = 1
+
+    def __add__(self, other: "StageAllocations") -> "StageAllocations":
+        return StageAllocations(
+            max(self.peak, other.peak),
+            self.retained + other.retained,
+            self.blocks + other.blocks,
+            self.calls + other.calls,
+        )
+
+
+class AllocationProfile(NamedTuple):
+    result: Optional[TimePoint]
+    stages: Dict[str, StageAllocations]
+    total: StageAllocations
+
+
+def traced_blocks() -> int:
+    return sum(
+        stat.count for stat in tracemalloc.take_snapshot().statistics("filename")
+    )
+
+
+class Recorder(MetricsRegistry):
+    """A metrics registry splitting the traced memory into consecutive stages:
+    a counter or histogram of a stage ends it, and starts the next one."""
+
+    def __init__(self):
+        super().__init__()
+        self.stages: Dict[str, StageAllocations] = {}
+        # handed out for every report, so that reporting allocates nothing
+        self._counter, self._histogram = Counter(), Histogram()
+        self.mark(None)
+
+    def mark(self, stage: Optional[str]):
+        """End `stage`, or only restart the count when it is `None`."""
+        current, peak = tracemalloc.get_traced_memory()
+        blocks = traced_blocks()
+        if stage is not None:
+            allocations = StageAllocations(
+                peak - self.current, current - self.current, blocks - self.blocks
+            )
+            previous = self.stages.get(stage)
+            self.stages[stage] = (
+                allocations if previous is None else previous + allocations
+            )
+
+        self.blocks = blocks
+        # the snapshot counting the blocks is freed by now
+        self.current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def counter(self, name: str, **labels: str) -> Counter:
+        if name == "fast_path_total":
+            self.mark(labels["path"])
+        else:
+            self.mark(COUNTER_STAGES.get(name))
+        return self._counter
+
+    def histogram(self, name: str, buckets=None, **labels: str) -> Histogram:
+        self.mark(labels.get("stage"))
+        return self._histogram
+
+
+def _measure(parser: DateParser, *args) -> Optional[TimePoint]:
+    try:
+        return parser.parse(*args)
+    except (IndexError, ValueError, KeyError):
+        return None
+
+
+def _recorded(parser: DateParser, *args) -> AllocationProfile:
+    """Parse with metrics reported to a `Recorder`, then put metrics back."""
+    enabled, registry = metrics.enabled, metrics.get_registry()
+    recorder = Recorder()
+    metrics.enable(recorder)
+    try:
+        recorder.mark(None)
+        result = _measure(parser, *args)
+    finally:
+        metrics.enable(registry)
+        if not enabled:
+            metrics.disable()
+    return result, recorder.stages
+
+
+def profile_allocations(
+    text: str,
+    basetime: Union[arrow.Arrow, str] = None,
+    tz: str = "Asia/Taipei",
+    warm_up: bool = True,
+    max_granularity: Union[Granularity, str] = None,
+    cache_size: int = 0,
+) -> AllocationProfile:
+    """Allocations of parsing `text`, with the options of `DateParser`. With
+    `warm_up`, the text is parsed once before, so that lazily built state
+    (caches, compiled patterns) is left out. Tracing is stopped afterwards
+    unless it was already on."""
+    basetime = arrow.now(tz) if basetime is None else basetime
+    parser = DateParser(tz, cache_size=cache_size)
+    args = (text, basetime, max_granularity)
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        if warm_up:
+            _recorded(parser, *args)
+            _measure(parser, *args)
+
+        result, stages = _recorded(parser, *args)
+
+        total = Recorder()
+        _measure(parser, *args)
+        total.mark("total")
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    return AllocationProfile(result, stages, total.stages["total"])
+
+
+def format_profile(profile: AllocationProfile) -> str:
+    rows = [f"{'stage':<28}{'calls':>6}{'peak':>10}{'retained':>10}{'blocks':>8}"]
+    for stage, allocations in [*profile.stages.items(), ("total", profile.total)]:
+        calls, peak, retained, blocks = (
+            allocations.calls,
+            allocations.peak,
+            allocations.retained,
+            allocations.blocks,
+        )
+        rows.append(f"{stage:<28}{calls:>6}{peak:>10}{retained:>10}{blocks:>8}")
+    return "\n".join(rows)
+
+
+if __name__ == "__main__":
+    text, *basetime = sys.argv[1:]
+    profile = profile_allocations(text, *basetime)
+    print(f"{text} -> {profile.result!r}")
+    print(format_profile(profile))
@@ -0,0 +1,56 @@
+"""Regex engine of the hot patterns: `PATTERN`, the rules of `Parser` and the
+shapes of `handlers.py`.
+
+With `DATEPARSER_TW_REGEX=auto` (the default) the `regex` module is used when
+it is installed, and the stdlib `re` otherwise. `regex`, `re2` (an RE2
+binding, linear in the length of the text, but slower than `re` through its
+Python wrapper) or `re` pick one explicitly. The engine is chosen at import,
+before the patterns are compiled. A pattern the engine can't compile, eg. a
+lookbehind with RE2, falls back to `re`, so results are the same whatever the
+engine.
+"""
+
+import importlib
+import os
+import re
+from types import ModuleType
+from typing import Pattern
+
+from loguru import logger
+
+ENV = "DATEPARSER_TW_REGEX"
+PREFERENCE = ("regex",)
+
+# lookarounds and backreferences, which RE2 rejects (and logs to stderr)
+RE2_UNSUPPORTED = re.compile(r"\(\?<?[=!]|\(\?P=|\\[1-9]")
+
+
+def load_engine(name: str = None) -> ModuleType:
+    """The module named `name` (or by `DATEPARSER_TW_REGEX`), `re` if it is not
+    installed."""
+    name = name or os.environ.get(ENV, "auto")
+    for candidate in PREFERENCE if name == "auto" else (name,):
+        if candidate == "re":
+            return re
+        try:
+            return importlib.import_module(candidate)
+        except ImportError:
+            if name != "auto":
+                logger.warning(f"Regex engine {candidate} is not installed, using re")
+    return re
+
+
+engine = load_engine()
+
+
+def compile_pattern(pattern: str, flags: int = 0, module: ModuleType = None) -> Pattern:
+    """Compile with `module`, by default the engine chosen at import."""
+    module = engine if module is None else module
+    if module.__name__ == "re2" and RE2_UNSUPPORTED.search(pattern):
+        module = re
+    if module is not re:
+        try:
+            return module.compile(pattern, flags)
+        except Exception as e:  # each binding has its own error type
+            logger.debug(f"{module.__name__} can't compile {pattern[:40]}: {e!r}")
+    return re.compile(pattern, flags)
@@ -0,0 +1,125 @@
+"""Fixed-width binary encoding of time points, for IPC and cache storage.
+
+A record is 12 bytes, little-endian:
+
+    version      u8
+    granularity  u8   0 for `None`, else 1 + `GRANULARITY_RANK`
+    period       u8   0 for `None`, else 1 + the index in `PERIODS`
+    nulls        u8   a bit per field left `None` (`FIELDS` order), and
+                      `NULL_RECORD` for a missing result
+    year         i16
+    month, day, hour, minute, second   u8 each
+    reserved     u8
+
+Batches are records laid end to end, eg. the results of
+`DateParser.parse_batch` with `None` for failed parses.
+"""
+
+import struct
+from typing import Iterable, List, Optional, Union
+
+from .dataclasses import TimePoint
+from .dataclasses.timepoint import GRANULARITY_RANK
+
+VERSION = 1
+
+RECORD = struct.Struct("<BBBBhBBBBBx")
+SIZE = RECORD.size
+
+FIELDS = ("year", "month", "day", "hour", "minute", "second")
+NULL_RECORD = 0x80
+
+
+# the periods of day `Parser.norm_hour_notation` can set, frozen for the wire
+# format: new words go at the end, any other change needs a new `VERSION`
+# fmt: off
+PERIODS = (
+    "凌晨", "清晨", "早上", "早晨", "早間", "晨間", "今早", "上午", "白天",
+    "am", "AM", "a.m.", "a.m", "A.M.", "A.M",
+    "下午", "中午", "午後", "晚上", "夜間", "夜裡", "今晚",
+    "pm", "PM", "p.m.", "p.m", "P.M.", "P.M",
+)
+# fmt: on
+PERIOD_CODES = {period: code for code, period in enumerate(PERIODS, 1)}
+
+GRANULARITIES = sorted(GRANULARITY_RANK, key=GRANULARITY_RANK.get)
+GRANULARITY_CODES = {value: code for code, value in enumerate(GRANULARITIES, 1)}
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def _pack_into(buffer: bytearray, offset: int, tp: Optional[TimePoint]):
+    if tp is None:
+        RECORD.pack_into(buffer, offset, VERSION, 0, 0, NULL_RECORD, 0, 0, 0, 0, 0, 0)
+        return
+
+    values, nulls = [], 0
+    for bit, name in enumerate(FIELDS):
+        value = getattr(tp, name)
+        if value is None:
+            nulls |= 1 << bit
+            value = 0
+        values.append(value)
+
+    if tp.period_of_day is None:
+        period = 0
+    elif tp.period_of_day in PERIOD_CODES:
+        period = PERIOD_CODES[tp.period_of_day]
+    else:
+        raise ValueError(f"Unknown period of day: {tp.period_of_day}")
+
+    granularity = 0 if tp.granularity is None else GRANULARITY_CODES[tp.granularity]
+    try:
+        RECORD.pack_into(buffer, offset, VERSION, granularity, period, nulls, *values)
+    except struct.error as e:
+        raise ValueError(f"Can't encode {tp!r}: {e}")
+
+
+def _unpack(record: tuple) -> Optional[TimePoint]:
+    version, granularity, period, nulls, *values = record
+    if version != VERSION:
+        raise ValueError(f"Unsupported version: {version}, expected {VERSION}")
+    if nulls & NULL_RECORD:
+        return None
+
+    year, month, day, hour, minute, second = values
+    if nulls:
+        year, month, day, hour, minute, second = (
+            None if nulls >> bit & 1 else value for bit, value in enumerate(values)
+        )
+    return TimePoint(
+        year=year,
+        month=month,
+        day=day,
+        period_of_day=PERIODS[period - 1] if period else None,
+        hour=hour,
+        minute=minute,
+        second=second,
+        granularity=GRANULARITIES[granularity - 1] if granularity else None,
+    )
+
+
+def encode(tp: Optional[TimePoint]) -> bytes:
+    buffer = bytearray(SIZE)
+    _pack_into(buffer, 0, tp)
+    return bytes(buffer)
+
+
+def decode(data: Buffer) -> Optional[TimePoint]:
+    if len(data) != SIZE:
+        raise ValueError(f"Expected {SIZE} bytes, got {len(data)}")
+    return _unpack(RECORD.unpack(data))
+
+
+def encode_batch(tps: Iterable[Optional[TimePoint]]) -> bytes:
+    tps = list(tps)
+    buffer = bytearray(SIZE * len(tps))
+    for i, tp in enumerate(tps):
+        _pack_into(buffer, i * SIZE, tp)
+    return bytes(buffer)
+
+
+def decode_batch(data: Buffer) -> List[Optional[TimePoint]]:
+    if len(data) % SIZE:
+        raise ValueError(f"Expected a multiple of {SIZE} bytes, got {len(data)}")
+    return [_unpack(record) for record in RECORD.iter_unpack(data)]
@@ -0,0 +1,160 @@
+"""Half-open `[start, end)` epoch bounds of time points.
+
+A `TimePoint` stands for the whole interval of its granularity, eg. a
+`YearMonth` for the whole month. Bounds are epoch seconds computed from the
+fields directly, with the UTC offsets of the timezone cached per local day,
+so no `Arrow` object is built per time point.
+"""
+
+import datetime
+from array import array
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple, Union
+
+from arrow.parser import TzinfoParser
+
+from .dataclasses import TimePoint
+from .dataclasses.timepoint import Granularity
+
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+DAY = 86400
+HOUR = 3600
+
+# hours covered by a period of day, see `RE_AM`/`RE_PM` in `parser.py`
+PERIOD_HOURS = {
+    "凌晨": (0, 6),
+    "清晨": (5, 8),
+    "早上": (6, 12),
+    "早晨": (6, 12),
+    "早間": (6, 12),
+    "晨間": (6, 12),
+    "今早": (6, 12),
+    "上午": (6, 12),
+    "白天": (6, 18),
+    "中午": (11, 14),
+    "下午": (12, 18),
+    "午後": (12, 18),
+    "晚上": (18, 24),
+    "夜間": (18, 24),
+    "夜裡": (18, 24),
+    "今晚": (18, 24),
+}
+AM_HOURS, PM_HOURS = (0, 12), (12, 24)
+
+# offsets of days with a transition are computed for every instant
+VARIES = object()
+
+
+class LocalClock:
+    """Converts local wall times of `tz` to epoch seconds."""
+
+    max_cached_days = 100_000
+
+    def __init__(self, tz: Union[str, datetime.tzinfo]):
+        self.tzinfo = TzinfoParser.parse(tz) if isinstance(tz, str) else tz
+        self._offsets = {}
+
+    def _offset(self, ordinal: int, seconds: int) -> int:
+        offset = self._offsets.get(ordinal)
+        if offset is None:
+            if len(self._offsets) >= self.max_cached_days:
+                self._offsets.clear()
+            day = datetime.datetime.fromordinal(ordinal)
+            first = day.replace(tzinfo=self.tzinfo).utcoffset()
+            last = (day + datetime.timedelta(seconds=DAY - 1)).replace(
+                tzinfo=self.tzinfo
+            )
+            if first == last.utcoffset():
+                offset = int(first.total_seconds())
+            else:
+                offset = VARIES
+            self._offsets[ordinal] = offset
+
+        if offset is VARIES:
+            moment = datetime.datetime.fromordinal(ordinal) + datetime.timedelta(
+                seconds=seconds
+            )
+            return int(moment.replace(tzinfo=self.tzinfo).utcoffset().total_seconds())
+        return offset
+
+    def epoch(self, ordinal: int, seconds: int = 0) -> int:
+        """Epoch seconds of `seconds` after the local midnight of day `ordinal`."""
+        ordinal, seconds = ordinal + seconds // DAY, seconds % DAY
+        return (
+            (ordinal - EPOCH_ORDINAL) * DAY + seconds - self._offset(ordinal, seconds)
+        )
+
+
+@lru_cache(maxsize=None)
+def get_clock(tz: str) -> LocalClock:
+    return LocalClock(tz)
+
+
+def clock_bounds(tp: TimePoint, clock: LocalClock) -> Tuple[int, int]:
+    """`epoch_bounds` with a clock from `get_clock`, for callers bounding many
+    time points in one time zone."""
+    if tp.year is None:
+        raise ValueError("year is required")
+
+    granularity = tp.granularity
+    if granularity == Granularity.Year:
+        start = datetime.date(tp.year, 1, 1).toordinal()
+        end = datetime.date(tp.year + 1, 1, 1).toordinal()
+        return clock.epoch(start), clock.epoch(end)
+
+    if granularity == Granularity.YearMonth:
+        start = datetime.date(tp.year, tp.month, 1).toordinal()
+        if tp.month == 12:
+            end = datetime.date(tp.year + 1, 1, 1).toordinal()
+        else:
+            end = datetime.date(tp.year, tp.month + 1, 1).toordinal()
+        return clock.epoch(start), clock.epoch(end)
+
+    day = datetime.date(tp.year, tp.month, tp.day).toordinal()
+    if granularity == Granularity.Date:
+        return clock.epoch(day), clock.epoch(day + 1)
+
+    if granularity == Granularity.DateWithPeriod:
+        period = tp.period_of_day or ""
+        if period in PERIOD_HOURS:
+            first, last = PERIOD_HOURS[period]
+        else:
+            first, last = AM_HOURS if period.lower().startswith("a") else PM_HOURS
+        return clock.epoch(day, first * HOUR), clock.epoch(day, last * HOUR)
+
+    if granularity == Granularity.DateHour:
+        start = tp.hour * HOUR
+        return clock.epoch(day, start), clock.epoch(day, start + HOUR)
+
+    if granularity == Granularity.DateTime:
+        # the whole minute, `fill_empty_fields` sets unspecified seconds to 0
+        start = tp.hour * HOUR + (tp.minute or 0) * 60
+        if not tp.second:
+            return clock.epoch(day, start), clock.epoch(day, start + 60)
+        start += tp.second
+        return clock.epoch(day, start), clock.epoch(day, start + 1)
+
+    raise ValueError("granularity is required")
+
+
+def epoch_bounds(tp: TimePoint, tz: str = "Asia/Taipei") -> Tuple[int, int]:
+    """`[start, end)` in epoch seconds of the interval `tp` stands for."""
+    return clock_bounds(tp, get_clock(tz))
+
+
+def epoch_bounds_batch(
+    tps: Iterable[Optional[TimePoint]], tz: str = "Asia/Taipei"
+) -> Tuple[array, array]:
+    """Bounds of many time points as two int64 arrays of starts and ends. `None`,
+    eg. a failed parse from `DateParser.parse_batch`, and points without a year
+    give the empty `[0, 0)`."""
+    clock = get_clock(tz)
+    starts, ends = array("q"), array("q")
+    for tp in tps:
+        if tp is None or tp.year is None:
+            start, end = 0, 0
+        else:
+            start, end = clock_bounds(tp, clock)
+        starts.append(start)
+        ends.append(end)
+    return starts, ends
@@ -0,0 +1,224 @@
+"""Taiwan business days, following the calendar of the DGPA (人事行政總處).
+
+Working days are precomputed per year into a bitmap, with cumulative counts
+and the list of working days, so that counting or shifting by N business days
+is a constant-time lookup instead of a day by day loop.
+
+The data file lists the solar national holidays, and per year the solar dates
+of the lunar months used by `holiday.lunar`, the date of 清明, and the days
+off (調整放假) and make-up workdays (補班) decided for that year. Substitute
+days off are derived from the rules below.
+
+Past the years of the data file, only weekends are days off, with a warning.
+"""
+
+import datetime
+import json
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Set, Union
+
+from arrow import Arrow
+from loguru import logger
+
+from .resource import holiday
+
+DATA_FILE = Path(__file__).parent / "resource" / "business_days.json"
+
+SATURDAY, SUNDAY = 5, 6
+
+SPRING_FESTIVAL = ("除夕", "春節", "初2節", "初3節")
+
+
+def parse_date(year: int, month_day: str) -> datetime.date:
+    month, day = map(int, month_day.split("-"))
+    return datetime.date(year, month, day)
+
+
+def lunar_to_solar(year: int, lunar_date: str, lunar_months: Dict[str, str]):
+    month, day = map(int, lunar_date.split("-"))
+    first = parse_date(year, lunar_months[str(month)])
+    return first + datetime.timedelta(days=day - 1)
+
+
+def substitute(day: datetime.date, off: Set[datetime.date]) -> datetime.date:
+    """A holiday on a Saturday is taken the working day before, on a Sunday the
+    working day after."""
+    if day.weekday() < SATURDAY:
+        return day
+    step = datetime.timedelta(days=-1 if day.weekday() == SATURDAY else 1)
+    day += step
+    while day in off or day.weekday() >= SATURDAY:
+        day += step
+    return day
+
+
+def days_off(year: int, data: dict) -> Set[datetime.date]:
+    """Days off of `year` other than weekends, make-up workdays excluded."""
+    config = data["years"][str(year)]
+    lunar_months = config["lunar_months"]
+    off = set()
+
+    # spring festival from its eves, weekend days of it are made up right after it
+    new_year = lunar_to_solar(year, holiday.lunar["春節"], lunar_months)
+    eves = [
+        eve["days_before"]
+        for eve in data.get("eves", {}).values()
+        if eve["since"] <= year
+    ]
+    block = [
+        new_year - datetime.timedelta(days=days)
+        for days in sorted(set(eves) | {1}, reverse=True)
+    ] + [
+        lunar_to_solar(year, holiday.lunar[name], lunar_months)
+        for name in SPRING_FESTIVAL[1:]
+    ]
+    off.update(block)
+    day = block[-1]
+    for _ in range(sum(date.weekday() >= SATURDAY for date in block)):
+        day += datetime.timedelta(days=1)
+        while day.weekday() >= SATURDAY:
+            day += datetime.timedelta(days=1)
+        off.add(day)
+
+    holidays = [
+        lunar_to_solar(year, holiday.lunar[name], lunar_months)
+        for name in data["lunar"]
+        if name not in SPRING_FESTIVAL
+    ]
+    qingming = parse_date(year, config["qingming"])
+    holidays.append(qingming)
+
+    for name, solar in data["solar"].items():
+        if solar["since"] > year:
+            continue
+        day = parse_date(year, solar["date"])
+        if name == "兒童節" and day == qingming:
+            # the day before, or the day after when that is a Thursday
+            shift = 1 if day.weekday() == 3 else -1
+            holidays.append(day + datetime.timedelta(days=shift))
+        else:
+            holidays.append(day)
+
+    # substitutes skip the days already off, eg. 兒童節 on the Sunday before 清明
+    off.update(day for day in holidays if day.weekday() < SATURDAY)
+    for day in sorted(day for day in holidays if day.weekday() >= SATURDAY):
+        off.add(substitute(day, off))
+
+    off.update(parse_date(year, day) for day in config["adjusted"])
+    return off
+
+
+class BusinessCalendar:
+    def __init__(self, years: Iterable[int], data: dict):
+        years = sorted(years)
+        if not years or years != list(range(years[0], years[-1] + 1)):
+            raise ValueError(f"Years must be consecutive: {years}")
+
+        self.start = datetime.date(years[0], 1, 1)
+        self.end = datetime.date(years[-1] + 1, 1, 1)
+        size = (self.end - self.start).days
+
+        off, makeup = set(), set()
+        for year in years:
+            off |= days_off(year, data)
+            makeup |= {
+                parse_date(year, day) for day in data["years"][str(year)]["makeup"]
+            }
+
+        self.bitmap = bytearray((size + 7) // 8)
+        self.counts = array("I", [0])  # business days before each day
+        self.days = array("I")  # indices of the business days
+        for i in range(size):
+            day = self.start + datetime.timedelta(days=i)
+            if day in makeup or (day.weekday() < SATURDAY and day not in off):
+                self.bitmap[i >> 3] |= 1 << (i & 7)
+                self.days.append(i)
+            self.counts.append(len(self.days))
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path] = DATA_FILE):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(map(int, data["years"]), data)
+
+    def covers(self, day: datetime.date) -> bool:
+        return self.start <= day < self.end
+
+    def _index(self, day: datetime.date) -> int:
+        return (day - self.start).days
+
+    def is_business_day(self, day: datetime.date) -> bool:
+        if not self.covers(day):
+            log_uncovered(day.year, self.start, self.end)
+            return day.weekday() < SATURDAY
+        i = self._index(day)
+        return bool(self.bitmap[i >> 3] >> (i & 7) & 1)
+
+    def count(self, start: datetime.date, end: datetime.date) -> int:
+        """Business days in `[start, end)`."""
+        if start >= end:
+            return 0
+        if not (self.covers(start) and self.covers(end - datetime.timedelta(days=1))):
+            return sum(
+                self.is_business_day(start + datetime.timedelta(days=i))
+                for i in range((end - start).days)
+            )
+        return self.counts[self._index(end - datetime.timedelta(days=1)) + 1] - (
+            self.counts[self._index(start)]
+        )
+
+    def shift(self, day: datetime.date, n: int) -> datetime.date:
+        """The `n`th business day after `day` (before it if `n` is negative),
+        `day` itself not counted."""
+        if n == 0:
+            return day
+
+        if self.covers(day):
+            i = self._index(day)
+            k = self.counts[i + 1] + n - 1 if n > 0 else self.counts[i] + n
+            if 0 <= k < len(self.days):
+                return self.start + datetime.timedelta(days=self.days[k])
+
+        # off the calendar, day by day
+        step = datetime.timedelta(days=1 if n > 0 else -1)
+        for _ in range(abs(n)):
+            day += step
+            while not self.is_business_day(day):
+                day += step
+        return day
+
+
+@lru_cache(maxsize=None)
+def log_uncovered(year: int, start: datetime.date, end: datetime.date):
+    """Once per year, at debug level: years outside the calendar are common (in
+    differential and load-test runs) and the default sink is stdout."""
+    logger.debug(
+        f"No business day calendar for {year}, available from {start} to {end}; "
+        f"only weekends are days off, update {DATA_FILE.name}"
+    )
+
+
+@lru_cache(maxsize=None)
+def load_calendar(path: Union[str, Path] = DATA_FILE) -> BusinessCalendar:
+    return BusinessCalendar.from_file(path)
+
+
+calendar: BusinessCalendar = None
+
+
+def get_calendar() -> BusinessCalendar:
+    """The calendar used by `Parser`, loaded from `DATA_FILE` on first use."""
+    return load_calendar() if calendar is None else calendar
+
+
+def set_calendar(custom_calendar: BusinessCalendar = None):
+    """Use another calendar, eg. `BusinessCalendar.from_file(path)`; `None` resets."""
+    global calendar
+    calendar = custom_calendar
+
+
+def shift_business_days(moment: Arrow, n: int) -> Arrow:
+    day = get_calendar().shift(moment.date(), n)
+    return moment.replace(year=day.year, month=day.month, day=day.day)
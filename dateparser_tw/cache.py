@@ -0,0 +1,84 @@
+"""Result cache of `DateParser`, bucketed by the local day of the basetime.
+
+With the basetime almost always "now", most texts (`明天下午三點`, `下週一`)
+resolve the same for every request of a day, so their results are keyed by
+the text alone and kept until the local date of the basetime changes. Texts
+whose result depends on the time of day too, eg. `3小時後`, are keyed by the
+text and the time of the basetime to the second. The whole cache is cleared
+when a request falls on another day, so it suits a basetime moving forward;
+basetimes jumping between days only thrash it.
+"""
+
+import datetime
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from .dataclasses import TimePoint
+from .handlers import classify
+from .parser import PREP_RULES, RE_ABSOLUTE_TIME
+from .resource.phrase_table import PHRASES
+
+# units of offsets that keep the time of day of the basetime
+TIME_UNITS = ("hour", "minute", "second")
+SHAPES_WITH_CLOCK = (
+    "relative_day_time",
+    "relative_week_time",
+    "clock_time",
+    "absolute_date_time",
+)
+
+
+def resolves_by_date(span: str) -> bool:
+    """Whether the result of `span` only depends on the date of the basetime,
+    judged from its shape; unknown shapes count as depending on the time."""
+    if span in PHRASES:
+        return True
+
+    shape = classify(span)
+    if shape is None:
+        return False
+    if shape == "prep_offset":
+        # `3天半後` is 3 days and 12 hours later
+        return "半" not in span and not any(
+            PREP_RULES[unit].search(span) for unit in TIME_UNITS
+        )
+    if shape in SHAPES_WITH_CLOCK:
+        # a zero hour (or minute) counts as missing, and is filled from the
+        # basetime when minutes (or seconds) are given, eg. `凌晨12點半`
+        match = RE_ABSOLUTE_TIME.search(span)
+        hour, minute, second = match.group("hour", "minute", "second")
+        if int(hour) % 12 == 0 or (second is not None and int(minute) == 0):
+            return False
+    return True
+
+
+class ResultCache:
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.day: Optional[datetime.date] = None
+        self._entries: OrderedDict = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def roll(self, day: datetime.date):
+        """Start the bucket of `day`, dropping every entry of another day."""
+        if day != self.day:
+            self._entries.clear()
+            self.day = day
+
+    def get(self, key: Hashable) -> Optional[TimePoint]:
+        tp = self._entries.get(key)
+        if tp is not None:
+            self._entries.move_to_end(key)
+        return tp
+
+    def put(self, key: Hashable, tp: TimePoint):
+        self._entries[key] = tp
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.day = None
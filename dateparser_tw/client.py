@@ -0,0 +1,83 @@
+import json
+import socket
+from typing import Iterable, List, Optional, Union
+
+import arrow
+
+from .dataclasses import TimePoint
+from .server import HEADER, encode_frame
+
+
+class ParseClient:
+    """Blocking client for `dateparser_tw.server`.
+
+    Errors reported by the server are raised as `ValueError`.
+    """
+
+    def __init__(
+        self, path: str = None, host: str = "127.0.0.1", port: int = 8765, timeout=10
+    ):
+        if path is not None:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.connect(path)
+        else:
+            self.sock = socket.create_connection((host, port))
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.settimeout(timeout)
+        self.file = self.sock.makefile("rb")
+        self.next_id = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+    def parse(self, text: str, basetime: Union[arrow.Arrow, str] = None) -> TimePoint:
+        return self.parse_many([text], basetime)[0]
+
+    def parse_many(
+        self, texts: Iterable[str], basetime: Union[arrow.Arrow, str] = None
+    ) -> List[TimePoint]:
+        """Send all requests before reading the responses, so that the server can
+        parse them in batches."""
+        if isinstance(basetime, arrow.Arrow):
+            basetime = basetime.isoformat()
+
+        ids = []
+        frames = []
+        for text in texts:
+            self.next_id += 1
+            ids.append(self.next_id)
+            frames.append(
+                encode_frame({"id": self.next_id, "text": text, "basetime": basetime})
+            )
+        self.sock.sendall(b"".join(frames))
+
+        responses = {}
+        while len(responses) < len(ids):
+            response = self._receive()
+            responses[response["id"]] = response
+
+        return [self._result(responses[i]) for i in ids]
+
+    def stats(self) -> dict:
+        self.next_id += 1
+        self.sock.sendall(encode_frame({"id": self.next_id, "op": "stats"}))
+        return self._receive()
+
+    def _receive(self) -> dict:
+        header = self.file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ConnectionError("Connection closed by the server")
+        (size,) = HEADER.unpack(header)
+        return json.loads(self.file.read(size))
+
+    def _result(self, response: dict) -> Optional[TimePoint]:
+        if "error" in response:
+            raise ValueError(response["error"])
+        return TimePoint.model_validate(response["result"])
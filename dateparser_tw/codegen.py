@@ -0,0 +1,156 @@
+"""Generate `handlers.py`: specialized handlers for the most common span shapes.
+
+Every shape is built from the rules of `Parser` and lists the only stages that
+can match a span of that shape, so its handler skips all the others. Run
+`make handlers` (or `python -m dateparser_tw.codegen`) after changing the rules.
+"""
+
+import re
+from pathlib import Path
+from typing import List, NamedTuple
+
+from . import parser
+
+RE_NAMED_GROUP = re.compile(r"\(\?P<\w+>")
+
+OUTPUT = Path(__file__).with_name("handlers.py")
+
+
+class Shape(NamedTuple):
+    name: str
+    pattern: str
+    stages: List[str]
+
+
+def strip_names(pattern: str) -> str:
+    """Turn named groups into non-capturing ones, so rules can be combined."""
+    return RE_NAMED_GROUP.sub("(?:", pattern)
+
+
+period = rf"(?:{strip_names(parser.RE_AM.pattern)}|{strip_names(parser.RE_PM.pattern)})"
+clock = rf"(?:{strip_names(parser.RE_ABSOLUTE_TIME.pattern)})"
+absolute_date = (
+    rf"(?:{strip_names(parser.RE_YEAR.pattern)})?"
+    rf"(?:{strip_names(parser.RE_MONTH.pattern)})?"
+    rf"(?:{strip_names(parser.RE_DAY.pattern)})?"
+)
+relative_year = strip_names(parser.RE_YEAR_RELATIVE.pattern)
+relative_month = strip_names(parser.RE_MONTH_RELATIVE.pattern)
+relative_day = strip_names(parser.RE_DAY_RELATIVE.pattern)
+relative_week = strip_names(parser.RE_WEEK_RELATIVE.pattern)
+prep_offset = "|".join(
+    strip_names(pattern.pattern) for pattern in parser.PREP_RULES.values()
+)
+
+SHAPES = [
+    Shape("relative_day", relative_day, ["norm_relative_expression"]),
+    Shape(
+        "relative_day_period",
+        rf"{relative_day}{period}",
+        ["norm_hour_notation", "norm_relative_expression"],
+    ),
+    Shape(
+        "relative_day_time",
+        rf"{relative_day}{period}?{clock}",
+        ["norm_absolute_time", "norm_hour_notation", "norm_relative_expression"],
+    ),
+    Shape("relative_week", relative_week, ["norm_relative_expression"]),
+    Shape(
+        "relative_week_time",
+        rf"{relative_week}{period}?{clock}",
+        ["norm_absolute_time", "norm_hour_notation", "norm_relative_expression"],
+    ),
+    Shape("relative_month", relative_month, ["norm_relative_expression"]),
+    Shape("relative_year", relative_year, ["norm_relative_expression"]),
+    Shape(
+        "clock_time", rf"{period}?{clock}", ["norm_absolute_time", "norm_hour_notation"]
+    ),
+    Shape("period", period, ["norm_hour_notation"]),
+    Shape("absolute_date", rf"(?=.){absolute_date}", ["norm_absolute_date"]),
+    Shape(
+        "absolute_date_time",
+        rf"{absolute_date}{period}?{clock}",
+        ["norm_absolute_date", "norm_absolute_time", "norm_hour_notation"],
+    ),
+    Shape("prep_offset", rf"(?:{prep_offset})", ["norm_prep_related"]),
+]
+
+HEADER = """\
+# Generated by `python -m dateparser_tw.codegen`, do not edit by hand.
+from typing import Optional
+
+import arrow
+
+from .backend import compile_pattern
+from .dataclasses import Setting, TimePoint
+from .parser import Parser
+"""
+
+TEMPLATE = """
+
+STAGES_{constant} = ({stages})
+
+
+def parse_{name}(
+    date_string: str, basetime: arrow.Arrow, settings: Setting = None
+) -> TimePoint:
+    return Parser.parse(date_string, basetime, settings, STAGES_{constant})
+"""
+
+FOOTER = '''
+
+HANDLERS = {{
+{handlers}
+}}
+
+SHAPE_STAGES = {{
+{shape_stages}
+}}
+
+
+def classify(date_string: str) -> Optional[str]:
+    """Name of the shape `date_string` fully matches, if any."""
+    if match := RE_SHAPE.fullmatch(date_string):
+        return match.lastgroup
+    return None
+
+
+def dispatch(
+    date_string: str, basetime: arrow.Arrow, settings: Setting = None
+) -> Optional[TimePoint]:
+    """Parse with the specialized handler, `None` if the span has no known shape."""
+    if (shape := classify(date_string)) is None:
+        return None
+    return HANDLERS[shape](date_string, basetime, settings)
+'''
+
+
+def render(shapes: List[Shape] = SHAPES) -> str:
+    alternatives = "\n".join(
+        f'    r"{"" if i == 0 else "|"}(?P<{shape.name}>{shape.pattern})"'
+        for i, shape in enumerate(shapes)
+    )
+    code = HEADER
+    code += f"\nRE_SHAPE = compile_pattern(\n{alternatives}\n)\n"
+
+    for shape in shapes:
+        if len(shape.stages) == 1:
+            stages = f"Parser.{shape.stages[0]},"
+        else:
+            stages = "".join(f"\n    Parser.{stage}," for stage in shape.stages) + "\n"
+        code += TEMPLATE.format(
+            name=shape.name, constant=shape.name.upper(), stages=stages
+        )
+
+    handlers = "\n".join(f'    "{shape.name}": parse_{shape.name},' for shape in shapes)
+    shape_stages = "\n".join(
+        f'    "{shape.name}": STAGES_{shape.name.upper()},' for shape in shapes
+    )
+    code += FOOTER.format(handlers=handlers, shape_stages=shape_stages)
+
+    return code
+
+
+if __name__ == "__main__":
+    OUTPUT.write_text(render(), encoding="utf-8")
+    print(f"Wrote {OUTPUT}")
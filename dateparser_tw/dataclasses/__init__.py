@@ -1,5 +1,15 @@
+from .interval import Interval
 from .settings import Setting
+from .span import Span
 from .target import Target
-from .timepoint import TimePoint, get_granularity
+from .timepoint import TimePoint, get_granularity, truncate
 
-__all__ = ["Setting", "Target", "TimePoint", "get_granularity"]
+__all__ = [
+    "Interval",
+    "Setting",
+    "Span",
+    "Target",
+    "TimePoint",
+    "get_granularity",
+    "truncate",
+]
@@ -0,0 +1,21 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from .timepoint import TimePoint
+
+
+class Interval(BaseModel):
+    """A recognized time, `end` is set for ranges like `週六3點到5點`."""
+
+    start: TimePoint
+    end: Optional[TimePoint] = None
+
+    def __str__(self):
+        if self.end is None:
+            return str(self.start)
+        return f"{self.start} ~ {self.end}"
+
+    @property
+    def is_range(self) -> bool:
+        return self.end is not None
@@ -0,0 +1,13 @@
+from typing import NamedTuple, Optional
+
+from .timepoint import TimePoint
+
+
+class Span(NamedTuple):
+    """A recognized span; `start`/`end` are offsets into the original text and
+    `text` is the sanitized span that was parsed."""
+
+    start: int
+    end: int
+    text: str
+    result: Optional[TimePoint] = None
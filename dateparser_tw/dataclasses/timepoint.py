@@ -15,6 +15,17 @@ class Granularity(str, Enum):
     DateTime = "datetime"
 
 
+# from coarsest to finest
+GRANULARITY_RANK = {
+    Granularity.Year: 0,
+    Granularity.YearMonth: 1,
+    Granularity.Date: 2,
+    Granularity.DateWithPeriod: 3,
+    Granularity.DateHour: 4,
+    Granularity.DateTime: 5,
+}
+
+
 class TimePoint(BaseModel):
     year: Optional[int] = None
     month: Optional[int] = None
@@ -95,3 +106,30 @@ def get_granularity(tp: TimePoint) -> Granularity:
         return Granularity.Year
 
     raise ValueError("year is required")
+
+
+def truncate(tp: TimePoint, granularity: Granularity) -> TimePoint:
+    """Project a resolved time point onto a coarser granularity, the fields below
+    it are reset the same way `Parser.fill_empty_fields` fills them."""
+    if GRANULARITY_RANK[tp.granularity] <= GRANULARITY_RANK[granularity]:
+        return tp
+
+    if granularity == Granularity.DateWithPeriod and tp.period_of_day is None:
+        granularity = Granularity.Date
+
+    rank = GRANULARITY_RANK[granularity]
+    # the fields come from a validated point, skip validating them again
+    return TimePoint.model_construct(
+        year=tp.year,
+        month=tp.month if rank >= GRANULARITY_RANK[Granularity.YearMonth] else 1,
+        day=tp.day if rank >= GRANULARITY_RANK[Granularity.Date] else 1,
+        period_of_day=(
+            tp.period_of_day
+            if rank >= GRANULARITY_RANK[Granularity.DateWithPeriod]
+            else None
+        ),
+        hour=tp.hour if rank >= GRANULARITY_RANK[Granularity.DateHour] else 0,
+        minute=0,
+        second=0,
+        granularity=granularity,
+    )
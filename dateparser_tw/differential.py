@@ -0,0 +1,223 @@
+"""Differential testing of alternative engines against the reference pipeline.
+
+An engine is any callable `(text, basetime) -> TimePoint`. Random inputs are
+built from the parser vocabulary and run through both engines with random
+basetimes around month, year and leap-day edges; every disagreement (in the
+result, or in the type of exception raised) is shrunk to a minimal example.
+Machine-formatted dates, eg. `2024-07-15` or `14:30`, are resolved by the
+numeric fast path of `DateParser` and make the reference raise, these are the
+intended differences of `fast_path_difference`.
+
+    mismatches = differential(DateParser().parse, budget=5.0)
+"""
+
+import random
+import time
+from typing import Callable, List, NamedTuple, Optional, Union
+
+import arrow
+from arrow import Arrow
+
+from .dataclasses import TimePoint
+from .helpers.corpus import (
+    DEMONSTRATIVES,
+    HOLIDAYS,
+    LITERALS,
+    PERIODS,
+    RELATIVE_DAYS,
+    RELATIVE_YEARS,
+    UNITS,
+    WEEKDAYS,
+    WEEKS,
+    date_phrase,
+)
+from .helpers.str_common import DIGIT_MAP, PLACE_MAP
+from .normalizer import extract_spans, sanitize_date
+from .numeric import numeric_prefix, parse_numeric
+from .parser import Parser
+from .resource.pattern import PATTERN
+
+Engine = Callable[[str, Arrow], TimePoint]
+Outcome = Union[TimePoint, str]
+
+TOKENS = sorted(
+    {
+        *LITERALS,
+        *HOLIDAYS,
+        *DIGIT_MAP,
+        *PLACE_MAP,
+        *PERIODS,
+        *RELATIVE_DAYS,
+        *RELATIVE_YEARS,
+        *DEMONSTRATIVES,
+        *UNITS,
+        *WEEKDAYS,
+        *WEEKS,
+        *"0123456789",
+        *"年月日號點時分秒半前後個的 :-/.T",
+    }
+)
+
+
+class Case(NamedTuple):
+    text: str
+    basetime: Arrow
+
+
+class Mismatch(NamedTuple):
+    text: str
+    basetime: Arrow
+    expected: Outcome
+    actual: Outcome
+
+
+def reference_engine(text: str, basetime: Arrow) -> TimePoint:
+    """`DateParser.extract` without any fast path, every span goes through `Parser`."""
+    spans = extract_spans(sanitize_date(text), PATTERN)
+    return [Parser.parse(span, basetime) for span in spans][0]
+
+
+def outcome(engine: Engine, case: Case) -> Outcome:
+    """The result of an engine, or the name of the exception it raised."""
+    try:
+        return engine(case.text, case.basetime)
+    except Exception as e:
+        return type(e).__name__
+
+
+def numeric_phrase(rng: random.Random) -> str:
+    """A machine-formatted date and/or time, with out of range fields now and
+    then, eg. `2024/7/15`, `20240715`, `2024-07-15T14:30:05`, `14:30`."""
+    year = rng.randint(1990, 2040)
+    month = rng.choice([rng.randint(1, 12), 13])
+    day = rng.choice([rng.randint(1, 28), 29, 30, 31, 32])
+    hour, minute = rng.choice([rng.randint(0, 23), 24]), rng.randint(0, 59)
+    clock = f"{hour}:{minute:02}" + rng.choice(["", f":{rng.randint(0, 59):02}"])
+
+    kind = rng.randrange(3)
+    if kind == 0:
+        return clock
+    if kind == 1:
+        date = f"{year}{month:02}{day:02}"
+    else:
+        sep = rng.choice("-/.")
+        date = f"{year}{sep}{month}{sep}{day}"
+    return date + rng.choice(["", " " + clock, "T" + clock])
+
+
+def random_text(rng: random.Random) -> str:
+    choice = rng.random()
+    if choice < 0.4:
+        return date_phrase(rng)
+    if choice < 0.6:
+        return numeric_phrase(rng) + rng.choice(["", " ", "下午3點", date_phrase(rng)])
+    return "".join(rng.choice(TOKENS) for _ in range(rng.randint(1, 6)))
+
+
+def random_basetime(rng: random.Random, tz: str = "Asia/Taipei") -> Arrow:
+    year = rng.choice([2023, 2024, 2025, rng.randint(1990, 2040)])
+    kind = rng.randrange(5)
+    if kind == 0:  # leap day, or the day before it
+        year = rng.choice([2020, 2024, 2028])
+        month, day = 2, rng.choice([28, 29])
+    elif kind == 1:  # end of a month
+        month = rng.randint(1, 12)
+        day = arrow.Arrow(year, month, 1).ceil("month").day
+    elif kind == 2:  # start of a month
+        month, day = rng.randint(1, 12), 1
+    elif kind == 3:  # end or start of a year
+        month, day = rng.choice([(12, 31), (1, 1)])
+    else:
+        month, day = rng.randint(1, 12), rng.randint(1, 28)
+
+    hour, minute, second = rng.choice(
+        [(0, 0, 0), (23, 59, 59), (12, 0, 0), (11, 59, 59)]
+        + [(rng.randint(0, 23), rng.randint(0, 59), rng.randint(0, 59))] * 4
+    )
+    return arrow.Arrow(year, month, day, hour, minute, second, tzinfo=tz)
+
+
+def fast_path_difference(case: Case, actual: Outcome) -> bool:
+    """Whether the candidate resolved a machine-formatted date or time, the whole
+    text or the start of its first span, as `parse_numeric` does. The reference
+    has no numeric path, it raises or only reads the words around the date."""
+    if isinstance(actual, str):
+        return False
+    numeric = parse_numeric(case.text, case.basetime)
+    if numeric is not None:
+        return actual == numeric
+    spans = extract_spans(sanitize_date(case.text), PATTERN)
+    if not spans:
+        return False
+    prefix = numeric_prefix(spans[0])
+    numeric = parse_numeric(spans[0][: prefix or None], case.basetime)
+    if numeric is None:
+        return False
+    if not prefix:
+        return actual == numeric
+    # the words after the date only add to it, eg. `2024/7/15下午3點`
+    return (actual.year, actual.month, actual.day) == (
+        numeric.year,
+        numeric.month,
+        numeric.day,
+    )
+
+
+def disagree(candidate: Engine, reference: Engine, case: Case) -> Optional[Mismatch]:
+    expected, actual = outcome(reference, case), outcome(candidate, case)
+    if expected == actual or fast_path_difference(case, actual):
+        return None
+    return Mismatch(case.text, case.basetime, expected, actual)
+
+
+def shrink(candidate: Engine, reference: Engine, mismatch: Mismatch) -> Mismatch:
+    """Remove characters from the text, then simplify the basetime, as long as
+    the engines keep disagreeing."""
+    current = mismatch
+
+    size = max(len(current.text) // 2, 1)
+    while size >= 1:
+        position, reduced = 0, False
+        while position < len(current.text):
+            text = current.text[:position] + current.text[position + size :]
+            if text and (
+                found := disagree(candidate, reference, Case(text, current.basetime))
+            ):
+                current, reduced = found, True
+            else:
+                position += size
+        if not reduced:
+            size //= 2
+
+    for simpler in (
+        current.basetime.replace(hour=0, minute=0, second=0),
+        current.basetime.replace(day=1, hour=0, minute=0, second=0),
+    ):
+        if found := disagree(candidate, reference, Case(current.text, simpler)):
+            current = found
+
+    return current
+
+
+def differential(
+    candidate: Engine,
+    reference: Engine = reference_engine,
+    budget: float = 1.0,
+    seed: int = 0,
+    max_cases: int = None,
+) -> List[Mismatch]:
+    """Compare `candidate` with `reference` on random cases for `budget` seconds
+    (or `max_cases` cases), returns the shrunk mismatches, one per minimal text."""
+    rng = random.Random(seed)
+    deadline = time.monotonic() + budget
+    mismatches = {}
+
+    count = 0
+    while time.monotonic() < deadline and (max_cases is None or count < max_cases):
+        count += 1
+        case = Case(random_text(rng), random_basetime(rng))
+        if found := disagree(candidate, reference, case):
+            found = shrink(candidate, reference, found)
+            mismatches.setdefault(found.text, found)
+
+    return list(mismatches.values())
@@ -0,0 +1,118 @@
+"""Durations, eg. `三個半小時`, `兩週` or `一年半`, as integers.
+
+A duration is `(months, seconds)`: years and months have no fixed length, so
+they are kept in months, and every other unit is counted in seconds. Halves
+follow `HALF_NUMBERS` of the parser (half a year is 6 months, half a month 15
+days), a fraction of a month is counted as a fraction of 30 days, and no date
+is ever built.
+"""
+
+import re
+from array import array
+from typing import Iterable, NamedTuple, Tuple
+
+from .helpers.str_common import canonicalize, convert_chinese_numeral
+
+DAY = 86400
+
+# seconds per unit, `None` for the calendar units counted in months
+UNITS = {
+    "年": None,
+    "月": None,
+    "週": 7 * DAY,
+    "天": DAY,
+    "小時": 3600,
+    "分": 60,
+    "秒": 1,
+}
+MONTHS = {"年": 12, "月": 1}
+MONTH = 30 * DAY
+
+RE_SPACES = re.compile(r"\s+")
+RE_DURATION = re.compile(
+    r"(?P<value>\d+(?:\.\d+)?)?(?P<half>個?半)?個?"
+    r"(?P<unit>年|月|週|星期|禮拜|天|小時|鐘頭|分鐘|分|秒鐘|秒)(?P<half_after>半)?"
+)
+UNIT_NAMES = {
+    "星期": "週",
+    "禮拜": "週",
+    "鐘頭": "小時",
+    "分鐘": "分",
+    "秒鐘": "秒",
+}
+
+
+class Duration(NamedTuple):
+    months: int
+    seconds: int
+
+    @property
+    def is_exact(self) -> bool:
+        """Without calendar units, `seconds` is the whole duration."""
+        return self.months == 0
+
+
+def sanitize_duration(text: str) -> str:
+    return convert_chinese_numeral(RE_SPACES.sub("", canonicalize(text)))
+
+
+def _duration(text: str) -> Tuple[int, int]:
+    months = seconds = 0
+    found = False
+    for match in RE_DURATION.finditer(sanitize_duration(text)):
+        value, half, unit, half_after = match.group(
+            "value", "half", "unit", "half_after"
+        )
+        if value is None and half is None:
+            continue
+
+        # `3月` is March, a number of months needs `個`, eg. `3個月`, `3個半月`
+        if unit == "月" and "個" not in match.group():
+            continue
+
+        # a four-digit number of years is a year, eg. `2024年`
+        if unit == "年" and value is not None and len(value) == 4 and value.isdigit():
+            continue
+
+        # the amount as `numerator / denominator`, eg. `1.5` is 15 / 10
+        integer, _, fraction = (value or "0").partition(".")
+        denominator = 10 ** len(fraction)
+        numerator = int(integer + fraction)
+        if half or half_after:
+            numerator, denominator = 2 * numerator + denominator, 2 * denominator
+
+        unit = UNIT_NAMES.get(unit, unit)
+        if unit in MONTHS:
+            whole, rest = divmod(numerator * MONTHS[unit], denominator)
+            months += whole
+            seconds += rest * MONTH // denominator
+        else:
+            seconds += numerator * UNITS[unit] // denominator
+        found = True
+
+    if not found:
+        raise ValueError(f"No duration found in {text}")
+    return months, seconds
+
+
+def parse_duration(text: str) -> Duration:
+    """The sum of the durations in `text`, eg. `1小時30分鐘` is 5400 seconds."""
+    return Duration(*_duration(text))
+
+
+def parse_duration_batch(texts: Iterable[str]) -> Tuple[array, array, array]:
+    """Durations of many texts as int64 arrays of months and seconds, and a
+    byte array flagging the texts in which a duration was found (the others
+    give 0 months and 0 seconds)."""
+    months, seconds, found = array("q"), array("q"), array("B")
+    for text in texts:
+        try:
+            m, s = _duration(text)
+        except ValueError:
+            m, s, ok = 0, 0, 0
+        else:
+            ok = 1
+        months.append(m)
+        seconds.append(s)
+        found.append(ok)
+    return months, seconds, found
@@ -0,0 +1,76 @@
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .dataclasses.timepoint import Granularity, TimePoint
+
+# positional fields: year, month, day, period_of_day, hour, minute, second
+ZH_TEMPLATES = {
+    Granularity.Year: "{0}年",
+    Granularity.YearMonth: "{0}年{1}月",
+    Granularity.Date: "{0:04d}年{1:02d}月{2:02d}日",
+    Granularity.DateWithPeriod: "{0:04d}年{1:02d}月{2:02d}日{3}",
+    Granularity.DateHour: "{0:04d}年{1:02d}月{2:02d}日{4:02d}點",
+    Granularity.DateTime: "{0:04d}年{1:02d}月{2:02d}日{4:02d}點{5:02d}分{6:02d}秒",
+}
+ISO_TEMPLATES = {
+    Granularity.Year: "{0:04d}",
+    Granularity.YearMonth: "{0:04d}-{1:02d}",
+    Granularity.Date: "{0:04d}-{1:02d}-{2:02d}",
+    Granularity.DateWithPeriod: "{0:04d}-{1:02d}-{2:02d}",
+    Granularity.DateHour: "{0:04d}-{1:02d}-{2:02d}T{4:02d}",
+    Granularity.DateTime: "{0:04d}-{1:02d}-{2:02d}T{4:02d}:{5:02d}:{6:02d}",
+}
+
+# `DateTime` without seconds
+ZH_MINUTES = "{0:04d}年{1:02d}月{2:02d}日{4:02d}點{5:02d}分"
+ISO_MINUTES = "{0:04d}-{1:02d}-{2:02d}T{4:02d}:{5:02d}"
+
+
+def compile_templates(templates: Dict[Granularity, str], minutes: str):
+    """Bind the templates once, returns `(by_granularity, datetime_minutes)`."""
+    return {key: value.format for key, value in templates.items()}, minutes.format
+
+
+FORMATTERS = {
+    "zh": compile_templates(ZH_TEMPLATES, ZH_MINUTES),
+    "iso": compile_templates(ISO_TEMPLATES, ISO_MINUTES),
+}
+
+
+def get_formatters(style: str):
+    try:
+        return FORMATTERS[style]
+    except KeyError:
+        raise ValueError(f"Unknown style: {style}, expected one of {list(FORMATTERS)}")
+
+
+def format_with(
+    tp: TimePoint, by_granularity: Dict[Granularity, Callable], minutes
+) -> str:
+    """`format_timepoint` with the formatters from `get_formatters`, for callers
+    formatting many time points in one style."""
+    if tp.granularity is None:
+        raise ValueError("granularity is required")
+
+    if tp.granularity == Granularity.DateTime and tp.second is None:
+        func = minutes
+    else:
+        func = by_granularity[tp.granularity]
+
+    return func(
+        tp.year, tp.month, tp.day, tp.period_of_day, tp.hour, tp.minute, tp.second
+    )
+
+
+def format_timepoint(tp: TimePoint, style: str = "zh") -> str:
+    """Format without building a datetime, `zh` gives the same text as `str(tp)`."""
+    return format_with(tp, *get_formatters(style))
+
+
+def format_batch(
+    tps: Iterable[Optional[TimePoint]], style: str = "zh"
+) -> List[Optional[str]]:
+    """Format many results, eg. from `DateParser.parse_batch`; `None` stays `None`."""
+    by_granularity, minutes = get_formatters(style)
+    return [
+        None if tp is None else format_with(tp, by_granularity, minutes) for tp in tps
+    ]
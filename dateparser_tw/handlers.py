@@ -0,0 +1,196 @@
+# Generated by `python -m dateparser_tw.codegen`, do not edit by hand.
+from typing import Optional
+
+import arrow
+
+from .backend import compile_pattern
+from .dataclasses import Setting, TimePoint
+from .parser import Parser
+
+RE_SHAPE = compile_pattern(
+    r"(?P<relative_day>(大*前|[昨今本明隔次]|大*後)[天日])"
+    r"|(?P<relative_day_period>(大*前|[昨今本明隔次]|大*後)[天日](?:(凌晨|清晨|早上|早晨|早間|晨間|今早|上午|白天|am|AM|a\.m\.|a\.m|A\.M\.|A\.M)|(下午|中午|午後|晚上|夜間|夜裡|夜間|今晚|pm|PM|p\.m\.|p\.m|P\.M\.|P\.M)))"
+    r"|(?P<relative_day_time>(大*前|[昨今本明隔次]|大*後)[天日](?:(凌晨|清晨|早上|早晨|早間|晨間|今早|上午|白天|am|AM|a\.m\.|a\.m|A\.M\.|A\.M)|(下午|中午|午後|晚上|夜間|夜裡|夜間|今晚|pm|PM|p\.m\.|p\.m|P\.M\.|P\.M))?(?:(?:[0-2]?[0-9])[點時](?:半)?(?:(?:[0-5]?[0-9])[分鐘](?:半)?(?:(?:[0-5]?[0-9])[秒]?)?)?))"
+    r"|(?P<relative_week>(?:上+個?|下+個?|這個?|本)?(?:周|週|星期|禮拜)(?:[1-7]?))"
+    r"|(?P<relative_week_time>(?:上+個?|下+個?|這個?|本)?(?:周|週|星期|禮拜)(?:[1-7]?)(?:(凌晨|清晨|早上|早晨|早間|晨間|今早|上午|白天|am|AM|a\.m\.|a\.m|A\.M\.|A\.M)|(下午|中午|午後|晚上|夜間|夜裡|夜間|今晚|pm|PM|p\.m\.|p\.m|P\.M\.|P\.M))?(?:(?:[0-2]?[0-9])[點時](?:半)?(?:(?:[0-5]?[0-9])[分鐘](?:半)?(?:(?:[0-5]?[0-9])[秒]?)?)?))"
+    r"|(?P<relative_month>(上+個|下+個|這個|本)月)"
+    r"|(?P<relative_year>(大*前|[去今本明隔次]|大*後)年)"
+    r"|(?P<clock_time>(?:(凌晨|清晨|早上|早晨|早間|晨間|今早|上午|白天|am|AM|a\.m\.|a\.m|A\.M\.|A\.M)|(下午|中午|午後|晚上|夜間|夜裡|夜間|今晚|pm|PM|p\.m\.|p\.m|P\.M\.|P\.M))?(?:(?:[0-2]?[0-9])[點時](?:半)?(?:(?:[0-5]?[0-9])[分鐘](?:半)?(?:(?:[0-5]?[0-9])[秒]?)?)?))"
+    r"|(?P<period>(?:(凌晨|清晨|早上|早晨|早間|晨間|今早|上午|白天|am|AM|a\.m\.|a\.m|A\.M\.|A\.M)|(下午|中午|午後|晚上|夜間|夜裡|夜間|今晚|pm|PM|p\.m\.|p\.m|P\.M\.|P\.M)))"
+    r"|(?P<absolute_date>(?=.)(?:(?:\d{4})年)?(?:(?:10|11|12|[1-9])月)?(?:(?:[0-3][0-9]|[1-9])[日號])?)"
+    r"|(?P<absolute_date_time>(?:(?:\d{4})年)?(?:(?:10|11|12|[1-9])月)?(?:(?:[0-3][0-9]|[1-9])[日號])?(?:(凌晨|清晨|早上|早晨|早間|晨間|今早|上午|白天|am|AM|a\.m\.|a\.m|A\.M\.|A\.M)|(下午|中午|午後|晚上|夜間|夜裡|夜間|今晚|pm|PM|p\.m\.|p\.m|P\.M\.|P\.M))?(?:(?:[0-2]?[0-9])[點時](?:半)?(?:(?:[0-5]?[0-9])[分鐘](?:半)?(?:(?:[0-5]?[0-9])[秒]?)?)?))"
+    r"|(?P<prep_offset>(?:(?:(?:\d+)?(?:個?半)?)(?:年)(?:半)?(?:[以之]?(?:[前後]))|(?:(?:\d+)?(?:個?半)?)(?:個?月)(?:半)?(?:[以之]?(?:[前後]))|(?:(?:\d+)?(?:個?半)?)(?:(?<!工作)天)(?:半)?(?:[以之]?(?:[前後]))|(?:(?:\d+)?(?:個?半)?)(?:個?(?:周|週|星期|禮拜))(?:半)?(?:[以之]?(?:[前後]))|(?:(?:\d+)?(?:個?半)?)(?:個?工作[日天])(?:半)?(?:[以之]?(?:[前後]))|(?:(?:\d+)?(?:個?半)?)(?:個?(?:小時|鐘頭))(?:半)?(?:[以之]?(?:[前後]))|(?:(?:\d+)?(?:個?半)?)(?:(?:分|分鐘))(?:半)?(?:[以之]?(?:[前後]))|(?:(?:\d+)?(?:個?半)?)(?:(?:分|秒鐘))(?:半)?(?:[以之]?(?:[前後]))))"
+)
+
+
+STAGES_RELATIVE_DAY = (Parser.norm_relative_expression,)
+
+
+def parse_relative_day(
+    date_string: str, basetime: arrow.Arrow, settings: Setting = None
+) -> TimePoint:
+    return Parser.parse(date_string, basetime, settings, STAGES_RELATIVE_DAY)
+
+
+STAGES_RELATIVE_DAY_PERIOD = (
+    Parser.norm_hour_notation,
+    Parser.norm_relative_expression,
+)
+
+
+def parse_relative_day_period(
+    date_string: str, basetime: arrow.Arrow, settings: Setting = None
+) -> TimePoint:
+    return Parser.parse(date_string, basetime, settings, STAGES_RELATIVE_DAY_PERIOD)
+
+
+STAGES_RELATIVE_DAY_TIME = (
+    Parser.norm_absolute_time,
+    Parser.norm_hour_notation,
+    Parser.norm_relative_expression,
+)
+
+
+def parse_relative_day_time(
+    date_string: str, basetime: arrow.Arrow, settings: Setting = None
+) -> TimePoint:
+    return Parser.parse(date_string, basetime, settings, STAGES_RELATIVE_DAY_TIME)
+
+
+STAGES_RELATIVE_WEEK = (Parser.norm_relative_expression,)
+
+
+def parse_relative_week(
+    date_string: str, basetime: arrow.Arrow, settings: Setting = None
+) -> TimePoint:
+    return Parser.parse(date_string, basetime, settings, STAGES_RELATIVE_WEEK)
+
+
+STAGES_RELATIVE_WEEK_TIME = (
+    Parser.norm_absolute_time,
+    Parser.norm_hour_notation,
+    Parser.norm_relative_expression,
+)
+
+
+def parse_relative_week_time(
+    date_string: str, basetime: arrow.Arrow, settings: Setting = None
+) -> TimePoint:
+    return Parser.parse(date_string, basetime, settings, STAGES_RELATIVE_WEEK_TIME)
+
+
+STAGES_RELATIVE_MONTH = (Parser.norm_relative_expression,)
+
+
+def parse_relative_month(
+    date_string: str, basetime: arrow.Arrow, settings: Setting = None
+) -> TimePoint:
+    return Parser.parse(date_string, basetime, settings, STAGES_RELATIVE_MONTH)
+
+
+STAGES_RELATIVE_YEAR = (Parser.norm_relative_expression,)
+
+
+def parse_relative_year(
+    date_string: str, basetime: arrow.Arrow, settings: Setting = None
+) -> TimePoint:
+    return Parser.parse(date_string, basetime, settings, STAGES_RELATIVE_YEAR)
+
+
+STAGES_CLOCK_TIME = (
+    Parser.norm_absolute_time,
+    Parser.norm_hour_notation,
+)
+
+
+def parse_clock_time(
+    date_string: str, basetime: arrow.Arrow, settings: Setting = None
+) -> TimePoint:
+    return Parser.parse(date_string, basetime, settings, STAGES_CLOCK_TIME)
+
+
+STAGES_PERIOD = (Parser.norm_hour_notation,)
+
+
+def parse_period(
+    date_string: str, basetime: arrow.Arrow, settings: Setting = None
+) -> TimePoint:
+    return Parser.parse(date_string, basetime, settings, STAGES_PERIOD)
+
+
+STAGES_ABSOLUTE_DATE = (Parser.norm_absolute_date,)
+
+
+def parse_absolute_date(
+    date_string: str, basetime: arrow.Arrow, settings: Setting = None
+) -> TimePoint:
+    return Parser.parse(date_string, basetime, settings, STAGES_ABSOLUTE_DATE)
+
+
+STAGES_ABSOLUTE_DATE_TIME = (
+    Parser.norm_absolute_date,
+    Parser.norm_absolute_time,
+    Parser.norm_hour_notation,
+)
+
+
+def parse_absolute_date_time(
+    date_string: str, basetime: arrow.Arrow, settings: Setting = None
+) -> TimePoint:
+    return Parser.parse(date_string, basetime, settings, STAGES_ABSOLUTE_DATE_TIME)
+
+
+STAGES_PREP_OFFSET = (Parser.norm_prep_related,)
+
+
+def parse_prep_offset(
+    date_string: str, basetime: arrow.Arrow, settings: Setting = None
+) -> TimePoint:
+    return Parser.parse(date_string, basetime, settings, STAGES_PREP_OFFSET)
+
+
+HANDLERS = {
+    "relative_day": parse_relative_day,
+    "relative_day_period": parse_relative_day_period,
+    "relative_day_time": parse_relative_day_time,
+    "relative_week": parse_relative_week,
+    "relative_week_time": parse_relative_week_time,
+    "relative_month": parse_relative_month,
+    "relative_year": parse_relative_year,
+    "clock_time": parse_clock_time,
+    "period": parse_period,
+    "absolute_date": parse_absolute_date,
+    "absolute_date_time": parse_absolute_date_time,
+    "prep_offset": parse_prep_offset,
+}
+
+SHAPE_STAGES = {
+    "relative_day": STAGES_RELATIVE_DAY,
+    "relative_day_period": STAGES_RELATIVE_DAY_PERIOD,
+    "relative_day_time": STAGES_RELATIVE_DAY_TIME,
+    "relative_week": STAGES_RELATIVE_WEEK,
+    "relative_week_time": STAGES_RELATIVE_WEEK_TIME,
+    "relative_month": STAGES_RELATIVE_MONTH,
+    "relative_year": STAGES_RELATIVE_YEAR,
+    "clock_time": STAGES_CLOCK_TIME,
+    "period": STAGES_PERIOD,
+    "absolute_date": STAGES_ABSOLUTE_DATE,
+    "absolute_date_time": STAGES_ABSOLUTE_DATE_TIME,
+    "prep_offset": STAGES_PREP_OFFSET,
+}
+
+
+def classify(date_string: str) -> Optional[str]:
+    """Name of the shape `date_string` fully matches, if any."""
+    if match := RE_SHAPE.fullmatch(date_string):
+        return match.lastgroup
+    return None
+
+
+def dispatch(
+    date_string: str, basetime: arrow.Arrow, settings: Setting = None
+) -> Optional[TimePoint]:
+    """Parse with the specialized handler, `None` if the span has no known shape."""
+    if (shape := classify(date_string)) is None:
+        return None
+    return HANDLERS[shape](date_string, basetime, settings)
@@ -0,0 +1,141 @@
+import random
+import re
+from typing import List, Sequence
+
+from ..normalizer import DateParser
+from ..resource import holiday
+from ..resource.pattern import r as PATTERN_SOURCE
+from .str_common import DIGIT_MAP
+
+# whole words listed as alternatives of `PATTERN`, eg. `(明天)`, `(上個月)`
+RE_LITERAL = re.compile(r"\(([一-鿿]{2,})\)")
+
+
+def parses(phrase: str) -> bool:
+    try:
+        DateParser().parse(phrase, "2024-07-15 10:00:00")
+    except Exception:
+        return False
+    return True
+
+
+# many alternatives, eg. `時期`, `以前`, are only parts of a longer expression
+LITERALS = [
+    literal
+    for literal in sorted(set(RE_LITERAL.findall(PATTERN_SOURCE)))
+    if parses(literal)
+]
+# a holiday needs a year, eg. `明年春節`
+HOLIDAYS = sorted({*holiday.lunar, *holiday.solar})
+
+NUMERALS = [key for key in DIGIT_MAP if key != "零"]
+# `大前天` and `大後天` are not understood by the parser
+RELATIVE_DAYS = ["前天", "昨天", "今天", "明天", "後天", "隔天"]
+RELATIVE_YEARS = ["前年", "去年", "今年", "明年", "後年"]
+MONTHS = ["上個月", "下個月", "這個月", "本月", "下下個月"]
+DEMONSTRATIVES = ["上", "上個", "下", "下個", "這", "本", "下下"]
+WEEKS = ["週", "星期", "禮拜"]
+WEEKDAYS = ["一", "二", "三", "四", "五", "六", "日", "天"]
+PERIODS = ["凌晨", "早上", "上午", "中午", "下午", "晚上"]
+# offsets that resolve without a time of day, `週` does not take a half
+UNITS = ["年", "個月", "天", "星期", "個星期"]
+
+FILLERS = [
+    "我們",
+    "記得",
+    "開會",
+    "提醒你",
+    "要交報告",
+    "一起吃飯",
+    "去看電影",
+    "到台北",
+    "，",
+    "。",
+    "好的",
+    "沒問題",
+    "請準時出席",
+    "的那個案子",
+]
+
+
+def chinese_number(n: int) -> str:
+    """Write 0-99 with Chinese numerals, eg. `23` -> `二十三`."""
+    digits = "零一二三四五六七八九"
+    if n < 10:
+        return digits[n]
+    tens, ones = divmod(n, 10)
+    return (digits[tens] if tens > 1 else "") + "十" + (digits[ones] if ones else "")
+
+
+def number(rng: random.Random, low: int, high: int) -> str:
+    n = rng.randint(low, high)
+    return str(n) if rng.random() < 0.5 else chinese_number(n)
+
+
+def clock(rng: random.Random, periods: Sequence[str] = ("", *PERIODS)) -> str:
+    text = rng.choice(periods) + number(rng, 1, 12) + "點"
+    choice = rng.random()
+    if choice < 0.3:
+        text += "半"
+    elif choice < 0.6:
+        text += number(rng, 1, 59) + "分"
+    return text
+
+
+def date_phrase(rng: random.Random) -> str:
+    """A random time expression built from the parser vocabulary."""
+    kind = rng.randrange(9)
+    if kind == 0:
+        return rng.choice(RELATIVE_DAYS) + rng.choice(["", clock(rng)])
+    if kind == 1:
+        return rng.choice(RELATIVE_YEARS)
+    if kind == 2:
+        return rng.choice(MONTHS)
+    if kind == 3:
+        # a period keeps the hour apart from the weekday, eg. `週六下午五點`
+        return (
+            rng.choice(DEMONSTRATIVES)
+            + rng.choice(WEEKS)
+            + rng.choice(WEEKDAYS)
+            + rng.choice(["", clock(rng, PERIODS)])
+        )
+    if kind == 4:
+        year = f"{rng.randint(1990, 2030)}年" if rng.random() < 0.5 else ""
+        return f"{year}{number(rng, 1, 12)}月{number(rng, 1, 28)}號"
+    if kind == 5:
+        half = rng.choice(["", "個半", "半"]) if rng.random() < 0.3 else ""
+        return number(rng, 1, 12) + half + rng.choice(UNITS) + rng.choice("前後")
+    if kind == 6:
+        return clock(rng)
+    if kind == 7:
+        return rng.choice(RELATIVE_YEARS) + rng.choice(HOLIDAYS)
+    return rng.choice(LITERALS)
+
+
+def generate_message(rng: random.Random, length: int = 40, density: float = 0.3) -> str:
+    """A message of about `length` characters, `density` is the probability of
+    each segment being a time expression rather than filler text. Every message
+    contains at least one time expression. Adjacent time expressions are
+    separated by a comma, they would otherwise merge into one, eg. `今天後年`."""
+    segments = [(date_phrase(rng), True)]
+    size = len(segments[0][0])
+    while size < length:
+        if rng.random() < density:
+            segment = (date_phrase(rng), True)
+        else:
+            segment = (rng.choice(FILLERS), False)
+        segments.append(segment)
+        size += len(segment[0])
+
+    rng.shuffle(segments)
+    message = segments[0][0]
+    for (_, after_phrase), (segment, is_phrase) in zip(segments, segments[1:]):
+        message += ("，" if after_phrase and is_phrase else "") + segment
+    return message
+
+
+def generate_corpus(
+    size: int, length: int = 40, density: float = 0.3, seed: int = 0
+) -> List[str]:
+    rng = random.Random(seed)
+    return [generate_message(rng, length, density) for _ in range(size)]
@@ -2,6 +2,7 @@ import re
 
 from loguru import logger
 
+from ..resource.variants import CANONICAL
 from .utils import replace_spans
 
 DIGIT_MAP = {
@@ -21,6 +22,15 @@ DIGIT_MAP = {
 PLACE_MAP = {"十": 10, "百": 100, "千": 1000, "萬": 10000, "億": 100000000}
 
 RE_NUMERAL = re.compile(r"([零一二兩三四五六七八九十百千萬億]+)")
+RE_WEEKDAY_SUNDAY = re.compile(r"(周|週|星期|禮拜)([天日])")
+
+CANONICAL_TABLE = str.maketrans(CANONICAL)
+
+
+def canonicalize(target: str) -> str:
+    """Map full-width, simplified and variant characters to their canonical
+    Traditional forms, character by character, eg. `下周３点` -> `下週3點`."""
+    return target.translate(CANONICAL_TABLE)
 
 
 def cn2an(target: str) -> int:
@@ -55,8 +65,7 @@ def convert_chinese_numeral(target: str):
     target = replace_spans(target, spans)
 
     # `星期天` -> `星期7`
-    pattern = re.compile(r"(周|週|星期|禮拜)([天日])")
-    if pattern.search(target):
+    if RE_WEEKDAY_SUNDAY.search(target):
         target = target.replace("天", "7").replace("日", "7")
 
     return target
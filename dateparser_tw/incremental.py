@@ -0,0 +1,135 @@
+import bisect
+from functools import lru_cache
+from typing import List, Optional, Pattern, Union
+
+import arrow
+from loguru import logger
+
+from .dataclasses import Span, TimePoint
+from .helpers.str_common import DIGIT_MAP, PLACE_MAP
+from .normalizer import (
+    extract_span_positions,
+    resolve_span,
+    sanitize_date_with_offsets,
+)
+from .resource.pattern import PATTERN
+
+# characters whose meaning depends on their neighbours during sanitization,
+# a re-scanned region is never allowed to start or end inside a run of them
+CONTEXT_CHARS = frozenset(DIGIT_MAP) | frozenset(PLACE_MAP) | {"的"}
+
+
+class IncrementalExtractor:
+    """Keeps the spans of a text buffer up to date while it is being edited.
+
+    Every `edit` re-scans only the region around the change, widened by `window`
+    characters on each side (and further, as long as a match touches the edge of
+    the region). Spans outside of that region, and the parse results of the last
+    `cache_size` spans seen, are reused.
+
+    Note: the `星期天` rewrite of `convert_chinese_numeral` is applied to the
+    re-scanned region only, not to the whole buffer.
+    """
+
+    def __init__(
+        self,
+        text: str = "",
+        basetime: Union[arrow.Arrow, str] = None,
+        tz: str = "Asia/Taipei",
+        pattern: Pattern = PATTERN,
+        window: int = 32,
+        cache_size: int = 4096,
+    ):
+        self.basetime = (
+            arrow.now(tz) if basetime is None else arrow.get(basetime, tzinfo=tz)
+        )
+        self.pattern = pattern
+        self.window = window
+
+        self.text = ""
+        self.spans: List[Span] = []
+        self._result = lru_cache(maxsize=cache_size)(self._parse_span)
+
+        if text:
+            self.edit(0, 0, text)
+
+    @property
+    def results(self) -> List[Optional[TimePoint]]:
+        return [span.result for span in self.spans]
+
+    def edit(self, offset: int, deleted: int, inserted: str) -> List[Span]:
+        """Replace `deleted` characters at `offset` with `inserted`."""
+        if not 0 <= offset <= offset + deleted <= len(self.text):
+            raise ValueError(f"Invalid edit: ({offset}, {deleted}) on {len(self.text)}")
+
+        text = self.text[:offset] + inserted + self.text[offset + deleted :]
+        delta = len(inserted) - deleted
+
+        starts = [span.start for span in self.spans]
+        ends = [span.end for span in self.spans]
+
+        lo = offset - self.window
+        hi = offset + len(inserted) + self.window
+        while True:
+            lo, hi = self._widen(text, max(lo, 0), min(hi, len(text)))
+
+            # old spans touching the region are re-scanned with it, `lo` is before
+            # the edit and `hi` after it, so they map back to the old text directly
+            # and the region keeps a margin of `window` around them as well
+            first = bisect.bisect_left(ends, lo)
+            last = bisect.bisect_right(starts, hi - delta)
+            if first < last:
+                span_lo = max(starts[first] - self.window, 0)
+                span_hi = min(ends[last - 1] + delta + self.window, len(text))
+                if span_lo < lo or span_hi > hi:
+                    lo, hi = min(lo, span_lo), max(hi, span_hi)
+                    continue
+
+            sanitized, char_starts, char_ends = sanitize_date_with_offsets(text[lo:hi])
+            positions = extract_span_positions(sanitized, self.pattern)
+
+            # a match touching an edge of the region may continue past it
+            grown = False
+            if positions and lo > 0 and positions[0][0] == 0:
+                lo -= self.window
+                grown = True
+            if positions and hi < len(text) and positions[-1][1] == len(sanitized):
+                hi += self.window
+                grown = True
+            if not grown:
+                break
+
+        region = [
+            self._span(
+                lo + char_starts[start], lo + char_ends[end - 1], sanitized[start:end]
+            )
+            for start, end in positions
+        ]
+        tail = [
+            span._replace(start=span.start + delta, end=span.end + delta)
+            for span in self.spans[last:]
+        ]
+
+        logger.debug(f"Re-scanned [{lo}, {hi}): {[span.text for span in region]}")
+
+        self.text = text
+        self.spans = self.spans[:first] + region + tail
+
+        return self.spans
+
+    def _widen(self, text: str, lo: int, hi: int):
+        while lo > 0 and (text[lo - 1] in CONTEXT_CHARS or text[lo - 1].isspace()):
+            lo -= 1
+        while hi < len(text) and (text[hi] in CONTEXT_CHARS or text[hi].isspace()):
+            hi += 1
+        return lo, hi
+
+    def _span(self, start: int, end: int, span_text: str) -> Span:
+        return Span(start, end, span_text, self._result(span_text))
+
+    def _parse_span(self, span: str) -> Optional[TimePoint]:
+        try:
+            return resolve_span(span, self.basetime)
+        except (ValueError, KeyError) as e:
+            logger.debug(f"Failed to parse span {span}: {e!r}")
+            return None
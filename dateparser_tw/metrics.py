@@ -0,0 +1,175 @@
+"""Runtime metrics: counters and fixed-bucket latency histograms.
+
+Metrics are off by default and instrumented code only checks `metrics.enabled`
+before doing anything. Turn them on with `enable()`, optionally passing your
+own registry (any object with `counter`/`histogram` methods like
+`MetricsRegistry`), and read them with `registry.snapshot()` or
+`registry.to_prometheus()`.
+"""
+import bisect
+import threading
+from typing import Dict, Iterable, Tuple
+
+# seconds, from 10µs to 100ms
+LATENCY_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Counter:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1):
+        # `+=` is a read and a write, updates of other threads would be lost
+        with self._lock:
+            self.value += amount
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count", "_lock")
+
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # the last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        bucket = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[bucket] += 1
+            self.sum += value
+            self.count += 1
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.counters: Dict[Tuple[str, Labels], Counter] = {}
+        self.histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, **labels: str) -> Counter:
+        key = (name, tuple(sorted(labels.items())))
+        if (counter := self.counters.get(key)) is None:
+            with self._lock:
+                counter = self.counters.setdefault(key, Counter())
+        return counter
+
+    def histogram(
+        self, name: str, buckets: Iterable[float] = LATENCY_BUCKETS, **labels: str
+    ) -> Histogram:
+        key = (name, tuple(sorted(labels.items())))
+        if (histogram := self.histograms.get(key)) is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(key, Histogram(buckets))
+        return histogram
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def _items(self):
+        # a first insert from another thread resizes the dicts while iterating
+        with self._lock:
+            return sorted(self.counters.items()), sorted(self.histograms.items())
+
+    def snapshot(self) -> dict:
+        counters, histograms = self._items()
+        return {
+            "counters": [
+                {"name": name, "labels": dict(labels), "value": counter.value}
+                for (name, labels), counter in counters
+            ],
+            "histograms": [
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "buckets": dict(zip([*histogram.buckets, "+Inf"], histogram.counts)),
+                    "sum": histogram.sum,
+                    "count": histogram.count,
+                }
+                for (name, labels), histogram in histograms
+            ],
+        }
+
+    def to_prometheus(self, prefix: str = "dateparser_tw") -> str:
+        lines = []
+        counters, histograms = self._items()
+
+        seen = set()
+        for (name, labels), counter in counters:
+            if name not in seen:
+                lines.append(f"# TYPE {prefix}_{name} counter")
+                seen.add(name)
+            lines.append(f"{prefix}_{name}{format_labels(labels)} {counter.value}")
+
+        for (name, labels), histogram in histograms:
+            if name not in seen:
+                lines.append(f"# TYPE {prefix}_{name} histogram")
+                seen.add(name)
+            cumulative = 0
+            for bound, count in zip([*histogram.buckets, "+Inf"], histogram.counts):
+                cumulative += count
+                bucket_labels = format_labels((*labels, ("le", str(bound))))
+                lines.append(f"{prefix}_{name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{prefix}_{name}_sum{format_labels(labels)} {histogram.sum}")
+            lines.append(
+                f"{prefix}_{name}_count{format_labels(labels)} {histogram.count}"
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+def format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
+
+
+enabled = False
+registry = MetricsRegistry()
+
+
+def enable(custom_registry: MetricsRegistry = None) -> MetricsRegistry:
+    global enabled, registry
+    if custom_registry is not None:
+        registry = custom_registry
+    enabled = True
+    return registry
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+def get_registry() -> MetricsRegistry:
+    return registry
+
+
+def inc(name: str, amount: int = 1, **labels: str):
+    registry.counter(name, **labels).inc(amount)
+
+
+def observe(name: str, value: float, **labels: str):
+    registry.histogram(name, **labels).observe(value)
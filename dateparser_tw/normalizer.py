@@ -1,46 +1,62 @@
 import re
-from typing import List, Pattern, Union
+from array import array
+from time import perf_counter
+from typing import Iterable, List, Optional, Pattern, Tuple, Union
 
 import arrow
 from arrow.arrow import Arrow
 from loguru import logger
 
-from .dataclasses import TimePoint
-from .helpers.str_common import convert_chinese_numeral
+from . import metrics
+from .bounds import epoch_bounds, epoch_bounds_batch
+from .cache import ResultCache, resolves_by_date
+from .dataclasses import Interval, TimePoint, truncate
+from .dataclasses.timepoint import Granularity
+from .duration import Duration, parse_duration, parse_duration_batch
+from .handlers import SHAPE_STAGES, classify, dispatch
+from .helpers.str_common import (
+    RE_NUMERAL,
+    canonicalize,
+    cn2an,
+    convert_chinese_numeral,
+)
+from .numeric import numeric_prefix, parse_numeric
 from .parser import Parser
+from .phrases import lookup
 from .resource.pattern import PATTERN
 
 RE_SPACES = re.compile(r"\s+")
 RE_LANGUAGE_PARTICLES = re.compile(r"[的]+")
+RE_WEEK_SUNDAY = re.compile(r"(周|週|星期|禮拜)[天日]")
 
+# text between two spans that makes them a range
+CONNECTORS = {"到", "至", "~", "～", "-", "—"}
 
-def extract_spans(date_string: str, pattern: Pattern) -> List[str]:
-    matches = pattern.finditer(date_string)
-
-    start_position = -1
-    end_position = -1
-    match_index = 0
-    extracted_strings = []
 
-    for match in matches:
-        start_position = match.start()
+def extract_span_positions(date_string: str, pattern: Pattern) -> List[Tuple[int, int]]:
+    positions = []
 
-        if start_position == end_position:
+    for match in pattern.finditer(date_string):
+        if positions and positions[-1][1] == match.start():
             # If the start position is the same as the end position of the
             # previous match, merge with the previous entry
-            match_index -= 1
-            extracted_strings[match_index] += match.group()
+            positions[-1] = (positions[-1][0], match.end())
         else:
             # Otherwise, append the new match
-            extracted_strings.append(match.group())
+            positions.append(match.span())
 
-        end_position = match.end()
-        match_index += 1
+    return positions
 
-    return extracted_strings
+
+def extract_spans(date_string: str, pattern: Pattern) -> List[str]:
+    return [
+        date_string[start:end]
+        for start, end in extract_span_positions(date_string, pattern)
+    ]
 
 
 def sanitize_date(date_string: str) -> str:
+    date_string = canonicalize(date_string)  # full-width, simplified and variants
     date_string = RE_SPACES.sub("", date_string)  # clear spaces
     date_string = RE_LANGUAGE_PARTICLES.sub("", date_string)  # clear language particles
     date_string = convert_chinese_numeral(date_string)
@@ -48,36 +64,306 @@ def sanitize_date(date_string: str) -> str:
     return date_string
 
 
+def sanitize_date_with_offsets(
+    date_string: str, local: bool = False
+) -> Tuple[str, List[int], List[int]]:
+    """Same as `sanitize_date`, but also returns, for every sanitized character,
+    the start and end offsets of the original characters it was derived from.
+
+    With `local`, `星期天` is rewritten to `星期7` where it occurs, instead of every
+    `天` and `日` of the string, for long texts holding many expressions."""
+    date_string = canonicalize(date_string)  # one to one, offsets are unchanged
+    kept = [
+        i
+        for i, char in enumerate(date_string)
+        if not (RE_SPACES.match(char) or RE_LANGUAGE_PARTICLES.match(char))
+    ]
+    stripped = "".join(date_string[i] for i in kept)
+
+    pieces, starts, ends = [], [], []
+    position = 0
+    for match in RE_NUMERAL.finditer(stripped):
+        start, end = match.span()
+        pieces.append(stripped[position:start])
+        starts.extend(kept[position:start])
+        ends.extend(i + 1 for i in kept[position:start])
+
+        number = str(cn2an(match.group()))
+        pieces.append(number)
+        starts.extend([kept[start]] * len(number))
+        ends.extend([kept[end - 1] + 1] * len(number))
+        position = end
+
+    pieces.append(stripped[position:])
+    starts.extend(kept[position:])
+    ends.extend(i + 1 for i in kept[position:])
+
+    # numerals are already converted, only the one-to-one `星期天` rewrite is left
+    if local:
+        sanitized = RE_WEEK_SUNDAY.sub(r"\g<1>7", "".join(pieces))
+    else:
+        sanitized = convert_chinese_numeral("".join(pieces))
+
+    return sanitized, starts, ends
+
+
+def resolve_span(span: str, basetime: Arrow) -> TimePoint:
+    """The time of one extracted span: machine-formatted dates, the phrase
+    table, the handler of its shape (see `codegen.py`), then `Parser`."""
+    if (tp := parse_numeric(span, basetime)) is not None:
+        if metrics.enabled:
+            metrics.inc("fast_path_total", path="numeric", result="hit")
+        return tp
+    if (end := numeric_prefix(span)) and (
+        date := parse_numeric(span[:end], basetime)
+    ) is not None:
+        if metrics.enabled:
+            metrics.inc("fast_path_total", path="numeric", result="hit")
+        return resolve_after_date(date, span[end:], basetime)
+
+    tp = lookup(span, basetime) or dispatch(span, basetime)
+    if metrics.enabled:
+        result = "miss" if tp is None else "hit"
+        metrics.inc("fast_path_total", path="handler", result=result)
+    return Parser.parse(span, basetime) if tp is None else tp
+
+
+def resolve_after_date(date: TimePoint, rest: str, basetime: Arrow) -> TimePoint:
+    """A numeric date merged by sanitization with the words after it: the time
+    of that day, eg. `2024/7/15下午3點`, or else the date alone, eg. the first
+    time of `2024/7/15明天`."""
+    if date.granularity != Granularity.Date:
+        return date
+    try:
+        tp = Parser.parse(rest, basetime, context=date)
+    except (ValueError, KeyError) as e:
+        logger.debug(f"Failed to parse {rest} after {date}: {e!r}")
+        return date
+    if (tp.year, tp.month, tp.day) != (date.year, date.month, date.day):
+        return date
+    return tp
+
+
 class DateParser:
-    def __init__(self, tz="Asia/Taipei"):
+    def __init__(self, tz="Asia/Taipei", cache_size: int = 0):
+        """With `cache_size`, results are cached by text for the local day of
+        the basetime, see `cache.py`."""
         self.tz = tz
         self.pattern = PATTERN
+        self.max_granularity: Optional[Granularity] = None
+        self.cache = ResultCache(cache_size) if cache_size else None
+        # whether the last result only depends on the date of the basetime
+        self.date_only = False
 
-    def parse(self, text: str, basetime: Union[arrow.Arrow, str] = None):
+    def parse(
+        self,
+        text: str,
+        basetime: Union[arrow.Arrow, str] = None,
+        max_granularity: Union[Granularity, str] = None,
+    ):
+        """With `max_granularity`, eg. `"date"`, the result is truncated to that
+        granularity, after a full parse."""
         self.target = text
         self.basetime: Arrow = (
             arrow.now(self.tz)
             if basetime is None
             else arrow.get(basetime, tzinfo=self.tz)
         )
+        self.max_granularity = (
+            None if max_granularity is None else Granularity(max_granularity)
+        )
 
-        parsed_date = self.extract(text)
+        parsed_date = self.extract_cached(text)
+        if self.max_granularity is not None:
+            parsed_date = truncate(parsed_date, self.max_granularity)
 
         return parsed_date
 
+    def parse_batch(
+        self,
+        texts: Iterable[str],
+        basetime: Union[arrow.Arrow, str] = None,
+        max_granularity: Union[Granularity, str] = None,
+    ) -> List[Optional[TimePoint]]:
+        """Parse many texts against the same basetime, texts in which no time
+        can be recognized give `None`."""
+        self.basetime: Arrow = (
+            arrow.now(self.tz)
+            if basetime is None
+            else arrow.get(basetime, tzinfo=self.tz)
+        )
+        self.max_granularity = (
+            None if max_granularity is None else Granularity(max_granularity)
+        )
+
+        results = []
+        for text in texts:
+            self.target = text
+            try:
+                tp = self.extract_cached(text)
+            except (ValueError, KeyError, IndexError) as e:
+                logger.debug(f"Failed to parse {text}: {e!r}")
+                results.append(None)
+                continue
+            if self.max_granularity is not None:
+                tp = truncate(tp, self.max_granularity)
+            results.append(tp)
+
+        return results
+
+    def parse_intervals(
+        self, text: str, basetime: Union[arrow.Arrow, str] = None
+    ) -> List[Interval]:
+        """All the times in `text`, in one left-to-right pass. Each time is the
+        context of the next one, which reuses the fields it leaves out (the day
+        of `5點` in `週六3點到5點`), and spans joined by a connector (到, 至, ~, -)
+        become a range."""
+        self.target = text
+        self.basetime: Arrow = (
+            arrow.now(self.tz)
+            if basetime is None
+            else arrow.get(basetime, tzinfo=self.tz)
+        )
+
+        date_string = sanitize_date(text)
+        intervals: List[Interval] = []
+        context, previous_end = None, None
+        for start, end in extract_span_positions(date_string, self.pattern):
+            span = date_string[start:end]
+            try:
+                tp = self._parse_in_context(span, context)
+            except (ValueError, KeyError) as e:
+                logger.debug(f"Failed to parse span {span}: {e!r}")
+                context, previous_end = None, None
+                continue
+
+            connected = (
+                previous_end is not None
+                and date_string[previous_end:start] in CONNECTORS
+                and not intervals[-1].is_range
+            )
+            if connected:
+                intervals[-1].end = tp
+            else:
+                intervals.append(Interval(start=tp))
+
+            context = tp if tp.year is not None else None
+            previous_end = end
+
+        return intervals
+
+    def _parse_in_context(self, span: str, context: Optional[TimePoint]) -> TimePoint:
+        if context is None:
+            return resolve_span(span, self.basetime)
+
+        # time-only numeric spans, eg. `14:00-16:00`, take the date of the context
+        anchor = self.basetime.replace(
+            year=context.year, month=context.month, day=context.day
+        )
+        if (tp := parse_numeric(span, anchor)) is not None:
+            return tp
+
+        shape = classify(span)
+        stages = SHAPE_STAGES[shape] if shape is not None else None
+        return Parser.parse(span, self.basetime, stages=stages, context=context)
+
+    def parse_bounds(
+        self, text: str, basetime: Union[arrow.Arrow, str] = None
+    ) -> Tuple[int, int]:
+        """`[start, end)` in epoch seconds of the interval the parsed time stands
+        for, eg. the whole day for `明天`."""
+        return epoch_bounds(self.parse(text, basetime), self.tz)
+
+    def parse_bounds_batch(
+        self, texts: Iterable[str], basetime: Union[arrow.Arrow, str] = None
+    ) -> Tuple[array, array]:
+        """Bounds of many texts as int64 arrays of starts and ends, texts in which
+        no time can be recognized give the empty `[0, 0)`."""
+        return epoch_bounds_batch(self.parse_batch(texts, basetime), self.tz)
+
+    def parse_duration(self, text: str) -> Duration:
+        """`(months, seconds)` of a duration, eg. `三個半小時` or `一年半`, with no
+        basetime shift, see `duration.py`."""
+        return parse_duration(text)
+
+    def parse_duration_batch(self, texts: Iterable[str]) -> Tuple[array, array, array]:
+        return parse_duration_batch(texts)
+
+    def extract_cached(self, date_string: str) -> TimePoint:
+        if self.cache is None:
+            return self.extract(date_string)
+
+        self.cache.roll(self.basetime.date())
+        tp = self.cache.get(date_string)
+        if tp is None:
+            time_key = (date_string, self.basetime.time().replace(microsecond=0))
+            tp = self.cache.get(time_key)
+        if metrics.enabled:
+            metrics.inc("cache_total", result="miss" if tp is None else "hit")
+
+        if tp is None:
+            tp = self.extract(date_string)
+            self.cache.put(date_string if self.date_only else time_key, tp)
+        # results are mutable, the cached one stays as it was parsed
+        return tp.model_copy()
+
     def extract(self, date_string: str) -> TimePoint:
+        if not metrics.enabled:
+            return self._extract(date_string, timed=False)
+
+        metrics.inc("parses_total")
+        start = perf_counter()
+        try:
+            return self._extract(date_string, timed=True)
+        except Exception as e:
+            metrics.inc("parse_failures_total", error=type(e).__name__)
+            raise
+        finally:
+            metrics.observe("parse_seconds", perf_counter() - start)
+
+    def _extract(self, date_string: str, timed: bool) -> TimePoint:
         logger.debug(f"Original date string: {date_string}")
+
+        # whole phrases of the closed relative vocabulary, eg. `明天`, `下週五`
+        if (tp := lookup(date_string, self.basetime)) is not None:
+            logger.debug(f"Phrase table: {tp!r}")
+            self.date_only = True
+            if timed:
+                metrics.inc("fast_path_total", path="phrase", result="hit")
+            return tp
+        if timed:
+            metrics.inc("fast_path_total", path="phrase", result="miss")
+
+        # machine-formatted dates (ISO-8601, `2024/7/15`, `14:30`) skip the pipeline
+        if (tp := parse_numeric(date_string, self.basetime)) is not None:
+            logger.debug(f"Numeric fast path: {tp}")
+            self.date_only = True
+            if timed:
+                metrics.inc("fast_path_total", path="numeric", result="hit")
+            return tp
+        if timed:
+            metrics.inc("fast_path_total", path="numeric", result="miss")
+            start = perf_counter()
+
         date_string = sanitize_date(date_string)
+        if timed:
+            sanitized = perf_counter()
+            metrics.observe("stage_seconds", sanitized - start, stage="sanitize")
+
         extracted_spans = extract_spans(date_string, self.pattern)
+        if timed:
+            metrics.observe(
+                "stage_seconds", perf_counter() - sanitized, stage="extract"
+            )
 
         logger.debug(f"Santized date string: {date_string}")
         logger.debug(f"Extracted spans: {extracted_spans}")
 
-        # TODO: 时间上下文： 前一个识别出来的时间会是下一个时间的上下文，用于处理：周六3点到5点这样的多个时间的识别，第二个5点应识别到是周六的。
-        # contextTp = TimePoint()
+        # only the first time is returned, `parse_intervals` resolves every span
+        # with the previous one as its context
 
-        spans = []
-        for span in extracted_spans:
-            spans.append(Parser.parse(span, self.basetime))
+        spans = [resolve_span(span, self.basetime) for span in extracted_spans]
 
+        if self.cache is not None:
+            self.date_only = resolves_by_date(extracted_spans[0])
         return spans[0]
@@ -0,0 +1,75 @@
+import calendar
+import re
+from typing import Optional
+
+import arrow
+
+from .dataclasses import TimePoint
+from .dataclasses.timepoint import Granularity
+
+DIGITS = "0123456789"
+
+date_pattern = (
+    r"(?:(?P<year>\d{4})(?P<sep>[-/.])(?P<month>\d{1,2})(?P=sep)(?P<day>\d{1,2})"
+    r"|(?P<year8>\d{4})(?P<month8>\d{2})(?P<day8>\d{2}))"
+)
+time_pattern = r"(?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2})(?:\.\d+)?)?"
+
+# spans of a sanitized text lose the space between the date and the time
+RE_NUMERIC_DATETIME = re.compile(rf"{date_pattern}(?:(?:T|\s*){time_pattern})?")
+RE_NUMERIC_TIME = re.compile(time_pattern)
+
+
+def numeric_prefix(date_string: str) -> int:
+    """The length of the machine-formatted date a span starts with when other
+    words follow it, eg. `2024/7/15` in `2024/7/15下午3點`, else 0."""
+    if date_string[:1] not in DIGITS:
+        return 0
+    match = RE_NUMERIC_DATETIME.match(date_string)
+    if match is None or match.end() == len(date_string):
+        return 0
+    return match.end()
+
+
+def parse_numeric(date_string: str, basetime: arrow.Arrow) -> Optional[TimePoint]:
+    """Parse machine-formatted dates such as `2024-07-15 14:30`, `2024/7/15`,
+    `20240715` or `14:30` without going through the Chinese pipeline.
+
+    Returns `None` when the string is not entirely numeric date/time, or when the
+    fields are out of range, so that the caller can fall back to `Parser`.
+    """
+    date_string = date_string.strip()
+    if date_string[:1] not in DIGITS:
+        return None
+
+    if match := RE_NUMERIC_DATETIME.fullmatch(date_string):
+        groups = match.groupdict()
+        if groups["year"] is not None:
+            year, month, day = groups["year"], groups["month"], groups["day"]
+        else:
+            year, month, day = groups["year8"], groups["month8"], groups["day8"]
+        tp = TimePoint(year=int(year), month=int(month), day=int(day))
+    elif match := RE_NUMERIC_TIME.fullmatch(date_string):
+        groups = match.groupdict()
+        tp = TimePoint(year=basetime.year, month=basetime.month, day=basetime.day)
+    else:
+        return None
+
+    if not 1 <= tp.month <= 12:
+        return None
+    if not 1 <= tp.day <= calendar.monthrange(tp.year, tp.month)[1]:
+        return None
+
+    if groups["hour"] is None:
+        tp.granularity = Granularity.Date
+        tp.hour, tp.minute, tp.second = 0, 0, 0
+        return tp
+
+    tp.hour = int(groups["hour"])
+    tp.minute = int(groups["minute"])
+    tp.second = int(groups["second"]) if groups["second"] else 0
+    if tp.hour > 23 or tp.minute > 59 or tp.second > 59:
+        return None
+
+    tp.granularity = Granularity.DateTime
+    return tp
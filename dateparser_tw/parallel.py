@@ -0,0 +1,192 @@
+"""Parse with a process pool, workers writing the results straight into
+shared-memory columns instead of pickling them back to the parent.
+
+    with parse_parallel(texts, basetime="2024-07-15") as columns:
+        columns["year"], columns["status"]  # memoryviews over shared memory
+        columns.to_numpy()  # zero-copy arrays, with numpy installed
+
+A column holds one field per text: `year` is int16, the other fields int8,
+with -1 for a field left `None`. `granularity` and `period` hold the codes of
+`binary.py` (0 for `None`), and `status` is `OK`, `NOT_FOUND` (no time in the
+text) or `FAILED`.
+"""
+
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Sequence, Union
+
+import arrow
+
+from .binary import GRANULARITIES, GRANULARITY_CODES, PERIOD_CODES, PERIODS
+from .dataclasses import TimePoint
+from .normalizer import DateParser
+
+COLUMNS = (
+    ("year", "h"),
+    ("month", "b"),
+    ("day", "b"),
+    ("hour", "b"),
+    ("minute", "b"),
+    ("second", "b"),
+    ("granularity", "b"),
+    ("period", "b"),
+    ("status", "b"),
+)
+FIELDS = ("year", "month", "day", "hour", "minute", "second")
+ROW_BYTES = sum(struct.calcsize(typecode) for _, typecode in COLUMNS)
+
+NULL = -1
+OK, NOT_FOUND, FAILED = 0, 1, 2
+
+
+class ResultColumns:
+    def __init__(self, size: int, name: str = None):
+        """A new block for `size` results, or the existing block `name`. Only
+        the creator unlinks the block; the workers share its resource tracker,
+        so attaching doesn't register the block twice."""
+        self.size = size
+        self.owner = name is None
+        if self.owner:
+            self.shm = SharedMemory(create=True, size=max(size * ROW_BYTES, 1))
+        else:
+            self.shm = SharedMemory(name=name)
+
+        self.columns: Dict[str, memoryview] = {}
+        offset = 0
+        for column, typecode in COLUMNS:
+            width = size * struct.calcsize(typecode)
+            view = self.shm.buf[offset : offset + width]
+            self.columns[column] = view.cast(typecode)
+            view.release()
+            offset += width
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def __getitem__(self, column: str) -> memoryview:
+        return self.columns[column]
+
+    def __len__(self):
+        return self.size
+
+    def write(self, i: int, tp: Optional[TimePoint], status: int = OK):
+        columns = self.columns
+        columns["status"][i] = status
+        if tp is None:
+            for field in FIELDS:
+                columns[field][i] = NULL
+            columns["granularity"][i] = columns["period"][i] = 0
+            return
+
+        for field in FIELDS:
+            value = getattr(tp, field)
+            columns[field][i] = NULL if value is None else value
+        columns["granularity"][i] = (
+            0 if tp.granularity is None else GRANULARITY_CODES[tp.granularity]
+        )
+        columns["period"][i] = PERIOD_CODES.get(tp.period_of_day, 0)
+
+    def timepoint(self, i: int) -> Optional[TimePoint]:
+        columns = self.columns
+        if columns["status"][i] != OK:
+            return None
+
+        fields = {
+            field: None if columns[field][i] == NULL else columns[field][i]
+            for field in FIELDS
+        }
+        granularity, period = columns["granularity"][i], columns["period"][i]
+        return TimePoint(
+            **fields,
+            period_of_day=PERIODS[period - 1] if period else None,
+            granularity=GRANULARITIES[granularity - 1] if granularity else None,
+        )
+
+    def timepoints(self) -> List[Optional[TimePoint]]:
+        return [self.timepoint(i) for i in range(self.size)]
+
+    def to_numpy(self):
+        """The columns as numpy arrays over the shared memory, no copy made;
+        drop them before `close`."""
+        import numpy as np
+
+        return {column: np.asarray(view) for column, view in self.columns.items()}
+
+    def close(self):
+        for view in self.columns.values():
+            view.release()
+        self.columns = {}
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# state of a worker process
+_columns: ResultColumns = None
+_parser: DateParser = None
+
+
+def _init_worker(name: str, size: int, tz: str, cache_size: int):
+    global _columns, _parser
+    _columns = ResultColumns(size, name)
+    _parser = DateParser(tz, cache_size=cache_size)
+
+
+def _parse_chunk(
+    start: int, texts: Sequence[str], basetime: str, max_granularity: str = None
+) -> int:
+    basetime = arrow.get(basetime, tzinfo=_parser.tz)
+    for i, text in enumerate(texts, start):
+        try:
+            _columns.write(i, _parser.parse(text, basetime, max_granularity))
+        except IndexError:
+            _columns.write(i, None, NOT_FOUND)
+        except (ValueError, KeyError):
+            _columns.write(i, None, FAILED)
+    return len(texts)
+
+
+def parse_parallel(
+    texts: Sequence[str],
+    basetime: Union[arrow.Arrow, str] = None,
+    tz: str = "Asia/Taipei",
+    workers: int = None,
+    chunk_size: int = 2048,
+    max_granularity: str = None,
+    cache_size: int = 0,
+) -> ResultColumns:
+    """Parse `texts` against the same basetime in `workers` processes, each
+    with a result cache of `cache_size`. The caller owns the returned columns
+    and must `close` them."""
+    basetime = arrow.now(tz) if basetime is None else arrow.get(basetime, tzinfo=tz)
+    columns = ResultColumns(len(texts))
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(columns.name, len(texts), tz, cache_size),
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _parse_chunk,
+                    start,
+                    texts[start : start + chunk_size],
+                    basetime.isoformat(),
+                    max_granularity,
+                )
+                for start in range(0, len(texts), chunk_size)
+            ]
+            for future in futures:
+                future.result()
+    except BaseException:
+        columns.close()
+        raise
+    return columns
@@ -1,43 +1,144 @@
-import re
+from time import perf_counter
 
 import arrow
 from loguru import logger
 
+from . import metrics
+from .backend import compile_pattern
+from .business_day import shift_business_days
 from .dataclasses import Setting, TimePoint, get_granularity
 
+# absolute date
+RE_YEAR = compile_pattern(r"(?P<year>\d{4})年")
+RE_MONTH = compile_pattern(r"(?P<month>10|11|12|[1-9])月")
+RE_DAY = compile_pattern(r"(?P<day>[0-3][0-9]|[1-9])[日號]")
+
+# absolute time
+hour_pattern = r"(?P<hour>[0-2]?[0-9])[點時](?P<hour_half>半)?"
+minute_pattern = r"(?P<minute>[0-5]?[0-9])[分鐘](?P<minute_half>半)?"
+second_pattern = r"(?P<second>[0-5]?[0-9])[秒]?"
+
+RE_ABSOLUTE_TIME = compile_pattern(
+    rf"{hour_pattern}(?:{minute_pattern}(?:{second_pattern})?)?"
+)
+
+# hour notation
+RE_AM = compile_pattern(
+    r"(凌晨|清晨|早上|早晨|早間|晨間|今早|上午|白天|am|AM|a\.m\.|a\.m|A\.M\.|A\.M)"
+)
+RE_PM = compile_pattern(
+    r"(下午|中午|午後|晚上|夜間|夜裡|夜間|今晚|pm|PM|p\.m\.|p\.m|P\.M\.|P\.M)"
+)
+
+# relative expression
+SHIFTS = {
+    "前": -2,
+    "去": -1,
+    "昨": -1,
+    "今": 0,
+    "本": 0,
+    "明": 1,
+    "次": 1,
+    "隔": 1,
+    "後": 2,
+}
+
+RE_YEAR_RELATIVE = compile_pattern(r"(大*前|[去今本明隔次]|大*後)年")
+RE_MONTH_RELATIVE = compile_pattern(r"(上+個|下+個|這個|本)月")
+RE_DAY_RELATIVE = compile_pattern(r"(大*前|[昨今本明隔次]|大*後)[天日]")
+RE_WEEK_RELATIVE = compile_pattern(
+    r"(?P<dem>上+個?|下+個?|這個?|本)?(?:周|週|星期|禮拜)(?P<weekday>[1-7]?)"
+)
+RE_WORKDAY_RELATIVE = compile_pattern(r"(上+|下+)個?工作[日天]")
+
+# prepositional offsets
+PREPOSITIONS = {
+    "前": -1,
+    "後": 1,
+}
+
+HALF_NUMBERS = {
+    "year": {"value": 6, "unit": "個月"},  # 6 months
+    "month": {"value": 15, "unit": "天"},  # 15 days
+    "day": {"value": 12, "unit": "小時"},  # 12 hours
+    "hour": {"value": 30, "unit": "分鐘"},  # 30 minutes
+    "minute": {"value": 30, "unit": "秒"},  # 30 seconds
+}
+
+# `2個月前`, `2個半月前`, `半個月前`, `半月前`, TODO: `2月前` is `before February` or `2 months ago`?
+rule_base = r"(?P<value>(?P<int_part>\d+)?(?P<half_exp>個?半)?)(?P<unit>{})(?P<half_exp_after>半)?(?:[以之]?(?P<prep>[前後]))"
+
+PREP_RULES = {
+    "year": rule_base.format("年"),
+    "month": rule_base.format("個?月"),
+    "day": rule_base.format("(?<!工作)天"),
+    "week": rule_base.format("個?(?:周|週|星期|禮拜)"),
+    "workday": rule_base.format("個?工作[日天]"),
+    "hour": rule_base.format("個?(?:小時|鐘頭)"),
+    "minute": rule_base.format("(?:分|分鐘)"),
+    "second": rule_base.format("(?:分|秒鐘)"),
+}
+PREP_RULES = {key: compile_pattern(value) for key, value in PREP_RULES.items()}
+
 
 class Parser:
     def __init__(
-        self, date_string: str, basetime: arrow.Arrow, settings: Setting = None
+        self,
+        date_string: str,
+        basetime: arrow.Arrow,
+        settings: Setting = None,
+        stages: tuple = None,
+        context: TimePoint = None,
     ):
         self.date_string = date_string
         self.basetime = basetime
         self.settings = settings or {}
+        # the previous time of a multi-span text, it fills the fields the span
+        # leaves out instead of `basetime`, eg. the day of `5點` in `週六3點到5點`
+        self.context = context
         self.tp = TimePoint()
 
-        self._parse()
+        self._parse(self.STAGES if stages is None else stages)
 
     @classmethod
-    def parse(cls, date_string: str, basetime: arrow.Arrow, settings: Setting = None):
-        obj = cls(date_string, basetime, settings)
+    def parse(
+        cls,
+        date_string: str,
+        basetime: arrow.Arrow,
+        settings: Setting = None,
+        stages: tuple = None,
+        context: TimePoint = None,
+    ):
+        obj = cls(date_string, basetime, settings, stages, context)
         return obj.tp
 
-    def _parse(self):
-        self.norm_absolute_date()
-        self.norm_absolute_time()
-        self.norm_hour_notation()
-        self.norm_relative_expression()
-        self.norm_prep_related()
+    def _parse(self, stages: tuple):
+        if metrics.enabled:
+            return self._parse_timed(stages)
+
+        for stage in stages:
+            stage(self)
 
+        self.resolve()
+
+    def _parse_timed(self, stages: tuple):
+        for stage in stages:
+            start = perf_counter()
+            stage(self)
+            metrics.observe(
+                "stage_seconds", perf_counter() - start, stage=stage.__name__
+            )
+
+        start = perf_counter()
+        self.resolve()
+        metrics.observe("stage_seconds", perf_counter() - start, stage="resolution")
+
+    def resolve(self):
         self.fill_basetime()
         self.tp.granularity = get_granularity(self.tp)
         self.fill_empty_fields()
 
     def norm_absolute_date(self):
-        RE_YEAR = re.compile(r"(?P<year>\d{4})年")
-        RE_MONTH = re.compile(r"(?P<month>10|11|12|[1-9])月")
-        RE_DAY = re.compile(r"(?P<day>[0-3][0-9]|[1-9])[日號]")
-
         if match := RE_YEAR.search(self.date_string):
             self.tp.year = int(match.group("year"))
             logger.debug(f"Matched: (year, {self.tp.year})")
@@ -49,13 +150,6 @@ class Parser:
             logger.debug(f"Matched: (day, {self.tp.day})")
 
     def norm_absolute_time(self):
-        hour_pattern = r"(?P<hour>[0-2]?[0-9])[點時](?P<hour_half>半)?"
-        minute_pattern = r"(?P<minute>[0-5]?[0-9])[分鐘](?P<minute_half>半)?"
-        second_pattern = r"(?P<second>[0-5]?[0-9])[秒]?"
-
-        RE_ABSOLUTE_TIME = re.compile(
-            rf"{hour_pattern}(?:{minute_pattern}(?:{second_pattern})?)?"
-        )
         match = RE_ABSOLUTE_TIME.search(self.date_string)
 
         if not match:
@@ -76,13 +170,6 @@ class Parser:
 
     def norm_hour_notation(self):
         """Must be called after norm_absolute_time."""
-        RE_AM = re.compile(
-            r"(凌晨|清晨|早上|早晨|早間|晨間|今早|上午|白天|am|AM|a\.m\.|a\.m|A\.M\.|A\.M)"
-        )
-        RE_PM = re.compile(
-            r"(下午|中午|午後|晚上|夜間|夜裡|夜間|今晚|pm|PM|p\.m\.|p\.m|P\.M\.|P\.M)"
-        )
-
         if match := RE_AM.search(self.date_string):
             self.tp.period_of_day = match.group()
             if self.tp.hour and 12 <= self.tp.hour <= 23:
@@ -93,18 +180,6 @@ class Parser:
                 self.tp.hour += 12
 
     def norm_relative_expression(self):
-        SHIFTS = {
-            "前": -2,
-            "去": -1,
-            "昨": -1,
-            "今": 0,
-            "本": 0,
-            "明": 1,
-            "次": 1,
-            "隔": 1,
-            "後": 2,
-        }
-
         # whether to modify the year/month/day
         curr = self.basetime
         mod_flags = {
@@ -114,7 +189,6 @@ class Parser:
         }
 
         # year
-        RE_YEAR_RELATIVE = re.compile(r"(大*前|[去今本明隔次]|大*後)年")
         match = RE_YEAR_RELATIVE.search(self.date_string)
         if match is not None:
             mod_flags["year"] = True
@@ -126,7 +200,6 @@ class Parser:
                 curr = curr.shift(years=SHIFTS[match.group(1)] + extra_shift)
 
         # month
-        RE_MONTH_RELATIVE = re.compile(r"(上+個|下+個|這個|本)月")
         match = RE_MONTH_RELATIVE.search(self.date_string)
         if match is not None:
             mod_flags["month"] = True
@@ -139,7 +212,6 @@ class Parser:
                 curr = curr.shift(months=0)
 
         # day
-        RE_DAY_RELATIVE = re.compile(r"(大*前|[昨今本明隔次]|大*後)[天日]")
         match = RE_DAY_RELATIVE.search(self.date_string)
         if match is not None:
             mod_flags["day"] = True
@@ -151,31 +223,48 @@ class Parser:
                 curr = curr.shift(days=SHIFTS[match.group(1)] + extra_shift)
 
         # week
-        RE_WEEK_RELATIVE = re.compile(
-            r"(?P<dem>上+個?|下+個?|這個?|本)?(?:周|週|星期|禮拜)(?P<weekday>[1-7]?)"
-        )
         match = RE_WEEK_RELATIVE.search(self.date_string)
         if match:
+            # a bare weekday stays in the week of the context, eg. `下週1到週3`
+            if (
+                not match.group("dem")
+                and self.context is not None
+                and not any(mod_flags.values())
+            ):
+                curr = self.basetime.replace(
+                    year=self.context.year,
+                    month=self.context.month,
+                    day=self.context.day,
+                )
+
             mod_flags["day"] = True
 
             # set week
-            if match.group('dem'):
+            if match.group("dem"):
                 if "上" in match.group(1):
                     curr = curr.shift(weeks=-match.group(1).count("上"))
                 elif "下" in match.group(1):
                     curr = curr.shift(weeks=match.group(1).count("下"))
 
             # set day (eg. `這週3`)
-            if match.group('weekday'):
-                offset = (int(match.group('weekday')) - 1) - curr.weekday()
+            if match.group("weekday"):
+                offset = (int(match.group("weekday")) - 1) - curr.weekday()
                 curr = curr.shift(days=offset)
 
             # when demonstrative pronouns like `上個` are not used, eg., `周5`
             # in this case, should consider whether user prefer future time
-            if not match.group('dem'):
+            if not match.group("dem"):
                 # TODO:
                 pass
 
+        # business day, eg. `下個工作日`
+        match = RE_WORKDAY_RELATIVE.search(self.date_string)
+        if match:
+            mod_flags["day"] = True
+            curr = shift_business_days(
+                curr, match.group(1).count("下") - match.group(1).count("上")
+            )
+
         if any(mod_flags.values()):
             self.tp.year = int(curr.year)
         if mod_flags["month"] or mod_flags["day"]:
@@ -185,43 +274,17 @@ class Parser:
 
     def norm_prep_related(self):
         """設定以上文時間為基準的時間偏移計算"""
-        PREPOSITIONS = {
-            "前": -1,
-            "後": 1,
-        }
-
-        HALF_NUMBERS = {
-            "year": {"value": 6, "unit": "個月"},  # 6 months
-            "month": {"value": 15, "unit": "天"},  # 15 days
-            "day": {"value": 12, "unit": "小時"},  # 12 hours
-            "hour": {"value": 30, "unit": "分鐘"},  # 30 minutes
-            "minute": {"value": 30, "unit": "秒"},  # 30 seconds
-        }
-
-        # `2個月前`, `2個半月前`, `半個月前`, `半月前`, TODO: `2月前` is `before February` or `2 months ago`?
-        rule_base = r"(?P<value>(?P<int_part>\d+)?(?P<half_exp>個?半)?)(?P<unit>{})(?P<half_exp_after>半)?(?:[以之]?(?P<prep>[前後]))"
-
-        rules = {
-            "year": rule_base.format("年"),
-            "month": rule_base.format("個?月"),
-            "day": rule_base.format("天"),
-            "week": rule_base.format("個?(?:周|週|星期|禮拜)"),
-            "hour": rule_base.format("個?(?:小時|鐘頭)"),
-            "minute": rule_base.format("(?:分|分鐘)"),
-            "second": rule_base.format("(?:分|秒鐘)"),
-        }
-
-        rules = {key: re.compile(value) for key, value in rules.items()}
-
         # normalize `半` expression. eg. `半年前` -> `6個月前`
         # this is because `arrow` does not support 0.5 as a time unit
-        for key, pattern in rules.items():
+        for key, pattern in PREP_RULES.items():
             match = pattern.search(self.date_string)
             if match is None:
                 continue
             # note: `half_exp_after` is for years, eg. `3年半前`
             if not match.group("half_exp") and not match.group("half_exp_after"):
                 continue
+            if key not in HALF_NUMBERS:
+                continue
 
             match_dict = match.groupdict()
             match_dict.update(HALF_NUMBERS.get(key))
@@ -240,18 +303,23 @@ class Parser:
 
         # parse timepoint
         curr = self.basetime
-        mod_flags = {key: False for key in rules.keys() if key != "week"}
+        mod_flags = {
+            key: False for key in PREP_RULES.keys() if key not in ("week", "workday")
+        }
 
-        for key, pattern in rules.items():
+        for key, pattern in PREP_RULES.items():
             match = pattern.search(self.date_string)
             if match is None:
                 continue
 
             direction = PREPOSITIONS.get(match.group("prep"))
             value = direction * int(match.group("value"))
-            curr = curr.shift(**{key + "s": value})
+            if key == "workday":
+                curr = shift_business_days(curr, value)
+            else:
+                curr = curr.shift(**{key + "s": value})
 
-            if key == "week":
+            if key in ("week", "workday"):
                 mod_flags["day"] = True
             else:
                 mod_flags[key] = True
@@ -271,20 +339,42 @@ class Parser:
                 setattr(self.tp, key, getattr(curr, key))
 
     def fill_basetime(self):
+        base = self.basetime if self.context is None else self.context
+
+        if self.context is not None:
+            self.inherit_period()
+
+        # a period of day alone is that period of the day, eg. `今晚`
+        if self.tp.period_of_day and self.tp.month is None and not self.tp.day:
+            self.tp.day = base.day
+
         if self.tp.second and not self.tp.minute:
-            self.tp.minute = self.basetime.minute
+            self.tp.minute = base.minute
 
         if self.tp.minute and not self.tp.hour:
-            self.tp.hour = self.basetime.hour
+            self.tp.hour = base.hour
 
         if self.tp.hour and not self.tp.day:
-            self.tp.day = self.basetime.day
+            self.tp.day = base.day
 
         if self.tp.day and not self.tp.month:
-            self.tp.month = self.basetime.month
+            self.tp.month = base.month
 
         if self.tp.month and not self.tp.year:
-            self.tp.year = self.basetime.year
+            self.tp.year = base.year
+
+    def inherit_period(self):
+        """An hour without AM/PM after an afternoon context is in the afternoon
+        too, eg. `5點` in `下午3點到5點`."""
+        period = self.context.period_of_day
+        if self.tp.period_of_day or not period or not self.tp.hour:
+            return
+
+        if RE_PM.fullmatch(period) and self.tp.hour <= 11:
+            self.tp.period_of_day = period
+            self.tp.hour += 12
+        elif RE_AM.fullmatch(period):
+            self.tp.period_of_day = period
 
     def fill_empty_fields(self):
         for field in ["month", "day"]:
@@ -294,3 +384,11 @@ class Parser:
         for field in ["hour", "minute", "second"]:
             if getattr(self.tp, field) is None:
                 setattr(self.tp, field, 0)
+
+    STAGES = (
+        norm_absolute_date,
+        norm_absolute_time,
+        norm_hour_notation,
+        norm_relative_expression,
+        norm_prep_related,
+    )
@@ -0,0 +1,151 @@
+"""Generate `resource/phrase_table.py`: the recipes of the whole-span phrases
+of the closed relative vocabulary, see `phrases.py`.
+
+Candidates are built from the words of the relative rules of `Parser` (raw, eg.
+`下週五`, and sanitized, eg. `下週5`), each with the recipe its rule implies.
+A candidate is kept only if it is extracted as a single span and its recipe
+gives the same result as the reference pipeline at every probe basetime. Run
+`make phrases` (or `python -m dateparser_tw.phrasegen`) after changing the rules.
+"""
+
+import json
+import random
+from itertools import product
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import arrow
+
+from . import parser
+from .differential import Case, outcome, random_basetime, reference_engine
+from .normalizer import extract_spans, sanitize_date
+from .phrases import Recipe, resolve
+from .resource.pattern import PATTERN
+
+OUTPUT = Path(__file__).parent / "resource" / "phrase_table.py"
+
+HEADER = """\
+# Generated by `python -m dateparser_tw.phrasegen`, do not edit by hand.
+# phrase: (unit, shift, weekday, period), see `phrases.py`
+
+PHRASES = {
+"""
+
+# `大` adds one more year or day in the same direction
+EXTRA_SHIFTS = {"大前": -3, "大後": 3}
+MONTH_DEMONSTRATIVES = {
+    "上個": -1,
+    "上上個": -2,
+    "下個": 1,
+    "下下個": 2,
+    "這個": 0,
+    "本": 0,
+}
+WEEK_DEMONSTRATIVES = {
+    **{dem: shift for dem, shift in MONTH_DEMONSTRATIVES.items() if dem != "本"},
+    "上": -1,
+    "上上": -2,
+    "下": 1,
+    "下下": 2,
+    "這": 0,
+    "本": 0,
+    "": 0,  # a weekday alone, eg. `週五`, is in this week
+}
+WEEKS = ["週", "星期", "禮拜"]
+WEEKDAYS = {
+    **{str(i): i for i in range(1, 8)},
+    **dict(zip("一二三四五六日天", [1, 2, 3, 4, 5, 6, 7, 7])),
+}
+
+
+def vocabulary(*patterns) -> List[str]:
+    """The words of alternations like `(下午|中午|p\\.m\\.)`, in order."""
+    words = {}
+    for pattern in patterns:
+        for word in pattern.pattern.strip("()").split("|"):
+            words.setdefault(word.replace("\\", ""), None)
+    return list(words)
+
+
+# the Chinese words only, `pm` and the like are rare in whole spans
+PERIODS = [
+    word for word in vocabulary(parser.RE_AM, parser.RE_PM) if not word.isascii()
+]
+# periods naming their day, eg. `今晚`, stand alone and follow no day word
+DATED_PERIODS = [period for period in PERIODS if period.startswith("今")]
+
+PROBES = [
+    "2024-07-15 10:00:00",
+    "2024-02-29 00:00:00",
+    "2023-12-31 23:59:59",
+    "2025-01-01 00:00:00",
+    "2024-03-31 12:30:00",
+]
+
+
+def candidates() -> Iterator[Tuple[str, Recipe]]:
+    shifts = {**parser.SHIFTS, **EXTRA_SHIFTS}
+    relative_days = {word: shift for word, shift in shifts.items() if word != "去"}
+    for (word, shift), suffix in product(relative_days.items(), "天日"):
+        yield f"{word}{suffix}", ("day", shift, None, None)
+        for period in PERIODS:
+            if period not in DATED_PERIODS:
+                yield f"{word}{suffix}{period}", ("day", shift, None, period)
+
+    for word, shift in shifts.items():
+        if word != "昨":
+            yield f"{word}年", ("year", shift, None, None)
+
+    for dem, shift in MONTH_DEMONSTRATIVES.items():
+        yield f"{dem}月", ("month", shift, None, None)
+
+    for (dem, shift), week in product(WEEK_DEMONSTRATIVES.items(), WEEKS):
+        if dem:
+            yield f"{dem}{week}", ("week", shift, None, None)
+        for name, weekday in WEEKDAYS.items():
+            yield f"{dem}{week}{name}", ("week", shift, weekday, None)
+
+    for period in PERIODS:
+        yield period, (None, 0, None, period)
+
+
+def agrees(text: str, recipe: Recipe, basetimes: List[arrow.Arrow]) -> bool:
+    sanitized = sanitize_date(text)
+    if extract_spans(sanitized, PATTERN) != [sanitized]:
+        return False
+    return all(
+        outcome(reference_engine, Case(text, basetime)) == resolve(recipe, basetime)
+        for basetime in basetimes
+    )
+
+
+def generate(seed: int = 0) -> Dict[str, Recipe]:
+    rng = random.Random(seed)
+    basetimes = [arrow.get(probe, tzinfo="Asia/Taipei") for probe in PROBES]
+    basetimes += [random_basetime(rng) for _ in range(10)]
+
+    table = {}
+    for text, recipe in candidates():
+        if agrees(text, recipe, basetimes):
+            table[text] = recipe
+        # the span left by sanitization, as seen by `DateParser._extract`
+        sanitized = sanitize_date(text)
+        if sanitized not in table and agrees(sanitized, recipe, basetimes):
+            table[sanitized] = recipe
+    return table
+
+
+def render(table: Dict[str, Recipe]) -> str:
+    def literal(value):
+        return "None" if value is None else json.dumps(value, ensure_ascii=False)
+
+    rows = "".join(
+        f'    "{text}": ({", ".join(map(literal, recipe))}),\n'
+        for text, recipe in table.items()
+    )
+    return f"{HEADER}{rows}}}\n"
+
+
+if __name__ == "__main__":
+    OUTPUT.write_text(render(generate()), encoding="utf-8")
+    print(f"Wrote {OUTPUT}")
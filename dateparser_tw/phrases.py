@@ -0,0 +1,80 @@
+"""Whole-span phrases of the closed relative vocabulary, eg. `明天`, `上個月`,
+`下週五` or `今天晚上`, resolved from a precomputed recipe without running
+any regex.
+
+The table in `resource/phrase_table.py` is generated by `phrasegen.py` from the
+rules of `Parser`, and keeps only the phrases whose recipe gives the same
+result as the full pipeline. A recipe is `(unit, shift, weekday, period)`:
+shift the basetime by `shift` years, months, days or weeks, move to
+`weekday` (1 for Monday) within that week, and set the period of day. A
+period alone, eg. `今晚`, has no unit and stays on the day of the basetime.
+"""
+
+import datetime
+from typing import Optional, Tuple
+
+import arrow
+
+from .dataclasses import TimePoint
+from .dataclasses.timepoint import Granularity
+from .helpers.str_common import canonicalize
+from .resource.phrase_table import PHRASES
+
+Recipe = Tuple[Optional[str], int, Optional[int], Optional[str]]
+
+
+def resolve(recipe: Recipe, basetime: arrow.Arrow) -> TimePoint:
+    unit, shift, weekday, period = recipe
+
+    if unit == "year":
+        return TimePoint(
+            year=basetime.year + shift,
+            month=1,
+            day=1,
+            hour=0,
+            minute=0,
+            second=0,
+            granularity=Granularity.Year,
+        )
+
+    if unit == "month":
+        months = basetime.month - 1 + shift
+        return TimePoint(
+            year=basetime.year + months // 12,
+            month=months % 12 + 1,
+            day=1,
+            hour=0,
+            minute=0,
+            second=0,
+            granularity=Granularity.YearMonth,
+        )
+
+    date = datetime.date(basetime.year, basetime.month, basetime.day)
+    if unit == "day":
+        date += datetime.timedelta(days=shift)
+    elif unit == "week":
+        date += datetime.timedelta(weeks=shift)
+        if weekday is not None:
+            date += datetime.timedelta(days=weekday - 1 - date.weekday())
+
+    return TimePoint(
+        year=date.year,
+        month=date.month,
+        day=date.day,
+        period_of_day=period,
+        hour=0,
+        minute=0,
+        second=0,
+        granularity=(
+            Granularity.Date if period is None else Granularity.DateWithPeriod
+        ),
+    )
+
+
+def lookup(text: str, basetime: arrow.Arrow) -> Optional[TimePoint]:
+    """The result of a known phrase, `None` for anything else. Variants are
+    canonicalized first, eg. `下周五` is `下週五`."""
+    recipe = PHRASES.get(text) or PHRASES.get(canonicalize(text))
+    if recipe is None:
+        return None
+    return resolve(recipe, basetime)
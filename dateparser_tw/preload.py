@@ -0,0 +1,92 @@
+"""Build the shared state up front, before forking worker processes.
+
+Patterns and rule tables are compiled at import; `preload` also builds what is
+otherwise built on the first requests (the business day calendar, timezone
+clocks and offsets, the stage projections and the caches of `re`, arrow and
+dateutil) by parsing a phrase of every shape, then moves all the objects
+allocated so far to the permanent generation with `gc.freeze`. The garbage
+collector of a forked worker then never writes to (and copies) the pages it
+shares with the parent.
+
+    # gunicorn.conf.py, with `preload_app = True`
+    import dateparser_tw
+
+    dateparser_tw.preload()
+"""
+
+import gc
+from typing import List
+
+import arrow
+
+from . import metrics
+from .business_day import get_calendar
+from .normalizer import DateParser
+
+# a phrase for every handler shape, and for each of the other stages
+WARMUP = [
+    "明天",
+    "明天下午",
+    "明天下午3點半",
+    "下週5",
+    "下週5晚上8點",
+    "下個月",
+    "去年",
+    "下午3點",
+    "今天晚上",
+    "2024年5月3日",
+    "5月3日下午3點",
+    "3天後",
+    "3天半後",
+    "2個半月前",
+    "3個工作天後",
+    "下個工作日",
+    "三月初",
+    "今年聖誕節",
+    "2024-05-03 15:30",
+    "15:30",
+]
+WARMUP_RANGES = ["週六3點到5點", "7月1日至7月5日"]
+# within the business day calendar
+BASETIME = "2024-07-15 10:00:00"
+
+
+def warm_up(tz: str = "Asia/Taipei") -> List[str]:
+    """Parse `WARMUP` with every option, returns the phrases that failed."""
+    parser = DateParser(tz)
+    basetime = arrow.get(BASETIME, tzinfo=tz)
+    failed = []
+
+    for text in WARMUP:
+        try:
+            parser.parse(text, basetime)
+            parser.parse_bounds(text, basetime)
+        except (ValueError, KeyError, IndexError):
+            failed.append(text)
+
+    parser.parse_bounds_batch(WARMUP, basetime)
+    parser.parse_batch(WARMUP)  # against now, for the offsets of today
+    for text in WARMUP_RANGES:
+        parser.parse_intervals(text, basetime)
+
+    return failed
+
+
+def preload(tz: str = "Asia/Taipei", freeze: bool = True):
+    """Build all the state shared by parsers of timezone `tz`, and with `freeze`
+    move it out of reach of the garbage collector. Call it in the parent
+    process, right before forking."""
+    get_calendar()
+
+    # the warm-up parses are not requests
+    enabled = metrics.enabled
+    metrics.disable()
+    try:
+        warm_up(tz)
+    finally:
+        if enabled:
+            metrics.enable()
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
@@ -1,21 +1,23 @@
-import re
+from ..backend import compile_pattern
 
-r = r"""((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
+r = r"""(\d{4}-\d{1,2}-\d{1,2}(T?\d{1,2}:\d{2}(:\d{2})?)?)
+|(\d{4}/\d{1,2}/\d{1,2}(T?\d{1,2}:\d{2}(:\d{2})?)?)
+|((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
 |(\d+個?半?[年月日天][半]?[以之]?[前後])
 |(\d?.?\d+個?半?(小時|鐘頭|h|H))
 |(\d+個?半?(小時|鐘頭|h|H))
 |(半個?(小時|鐘頭))
 |(\d+(分鐘|min))
 |([13]刻鐘)
-|((上|這|本|下)+(周|星期|週|禮拜)([一二三四五六七天日]|[1-7])?)
-|((周|星期|週|禮拜)([一二三四五六七天日]|[1-7]))
+|((上|這|本|下)+(星期|週|禮拜)([一二三四五六七天日]|[1-7])?)
+|((星期|週|禮拜)([一二三四五六七天日]|[1-7]))
 |((早|晚)?([0-2]?[0-9](點|時)半)(am|AM|pm|PM)?)
-|((早|晚)?(\d+[:：]\d+([:：]\d+)*)\s*(am|AM|pm|PM)?)
+|((早|晚)?(\d+:\d+(:\d+)*)\s*(am|AM|pm|PM)?)
 |((早|晚)?([0-2]?[0-9](點|時)[13一三]刻)(am|AM|pm|PM)?)
 |((早|晚)?(\d+[時點](\d+)?分?(\d+秒?)?)\s*(am|AM|pm|PM)?)
 |(大+(前|後)天)
 |(([零一二三四五六七八九十百千萬]+|\d+)世)
-|([0-9]?[0-9]?[0-9]{2}\.((10)|(11)|(12)|([1-9]))\.((?<!\d))([0-3][0-9]|[1-9]))
+|([0-9]?[0-9]?[0-9]{2}\.((10)|(11)|(12)|([1-9]))\.([0-3][0-9]|[1-9]))
 |(現在)
 |(屆時)
 |(這個月)
@@ -34,7 +36,7 @@ r = r"""((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
 |(日(數|多|多少|好幾|幾|差不多|近|前|後|上|左右))
 |((\d+)點)
 |(今年([零一二三四五六七八九十百千萬]+|\d+))
-|(\d+[:：]\d+(分|))
+|(\d+:\d+(分|))
 |((\d+):(\d+))
 |(\d+/\d+/\d+)
 |(未來)
@@ -47,16 +49,16 @@ r = r"""((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
 |(小時)
 |(明天)
 |(([0-3][0-9]|[1-9])[日號])
-|((數|多|多少|好幾|幾|差不多|近|前|後|上|左右)周)
+|((數|多|多少|好幾|幾|差不多|近|前|後|上|左右)週)
 |((數|多|多少|好幾|幾|差不多|近|前|後|上|左右)([零一二三四五六七八九十百千萬]+|\d+)年)
-|([一二三四五六七八九十百千萬幾多]+[天日周月年][後前左右]*)
+|([一二三四五六七八九十百千萬幾多]+[天日週月年][後前左右]*)
 |(每[年月日天小時分秒鐘]+)|((\d+分)+(\d+秒)?)
-|([一二三四五六七八九十]+來?[岁年])
+|([一二三四五六七八九十]+來?[歲年])
 |([新?|\d*]世紀末?)
 |((\d+)時)
 |(世紀)
-|(([零一二三四五六七八九十百千萬]+|\d+)岁)
-|([星期周]+[一二三四五六七])
+|(([零一二三四五六七八九十百千萬]+|\d+)歲)
+|([星期週]+[一二三四五六七])
 |(星期([零一二三四五六七八九十百千萬]+|\d+))
 |(([零一二三四五六七八九十百千萬]+|\d+)年)
 |([本後昨當新後明今去前那這][一二三四五六七八九十]?[年月日天])
@@ -66,7 +68,7 @@ r = r"""((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
 |((\d+)年代)
 |(本月(\d+))
 |(第(\d+)天)
-|((\d+)岁)
+|((\d+)歲)
 |((\d+)年(\d+)月)
 |([去今明]?[年月](底|末))
 |(([零一二三四五六七八九十百千萬]+|\d+)世紀)
@@ -74,7 +76,7 @@ r = r"""((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
 |(年度)
 |((數|多|多少|好幾|幾|差不多|近|前|後|上|左右)星期)
 |(年底)
-|([下個本]+赛季)
+|([下個本]+賽季)
 |(今年(\d+)月(\d+)日)
 |((\d+)月(\d+)日(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)午(\d+)時)
 |(今年晚些時候)
@@ -92,7 +94,7 @@ r = r"""((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
 |(今(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)([零一二三四五六七八九十百千萬]+|\d+)年)
 |(早晨)
 |(一段時間)
-|([本上]周[一二三四五六七])
+|([本上]週[一二三四五六七])
 |(凌晨(\d+)點)
 |(去年(\d+)月(\d+)日)
 |(年關)
@@ -102,22 +104,21 @@ r = r"""((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
 |((\d+)日晚(\d+)時)
 |(([零一二三四五六七八九十百千萬]+|\d+)(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)午)
 |(每年(\d+)月(\d+)日)
-|(([零一二三四五六七八九十百千萬]+|\d+)周)
+|(([零一二三四五六七八九十百千萬]+|\d+)週)
 |((\d+)月)
 |(農曆)
 |(兩個小時)
-|(本周([零一二三四五六七八九十百千萬]+|\d+))
+|(本週([零一二三四五六七八九十百千萬]+|\d+))
 |(長久)
 |(清晨)
 |((\d+)號晚)
 |(春節)
 |(星期日)
-|(圣诞)
 |((數|多|多少|好幾|幾|差不多|近|前|後|上|左右)段)
 |(現年)
 |(當日)
 |((數|多|多少|好幾|幾|差不多|近|前|後|上|左右)分鐘)
-|(\d+(天|日|周|月|年)(後|前|))
+|(\d+(天|日|週|月|年)(後|前|))
 |((文藝復興|巴洛克|前蘇聯|前一|暴力和專制|成年時期|古羅馬|我們所處的敏感)+時期)
 |((\d+)[年月天])
 |(清早)
@@ -142,11 +143,11 @@ r = r"""((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
 |(晚(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)(\d+)時)
 |(連[年月日夜])
 |((\d+)年(\d+)月(\d+)日(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)午)
-|((一|二|兩|三|四|五|六|七|八|九|十|百|千|萬|幾|多|上|\d+)+個?(天|日|周|月|年)(後|前|半))
+|((一|二|兩|三|四|五|六|七|八|九|十|百|千|萬|幾|多|上|\d+)+個?(天|日|週|月|年)(後|前|半))
 |((數|多|多少|好幾|幾|差不多|近|前|後|上|左右)年)
 |(早(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)([零一二三四五六七八九十百千萬]+|\d+)點(數|多|多少|好幾|幾|差不多|近|前|後|上|左右))
 |([0-9]{4}年)
-|(周末)
+|(週末)
 |(([零一二三四五六七八九十百千萬]+|\d+)個(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)小時)
 |(([(小學)|初中?|高中?|大學?|研][一二三四五六七八九十]?(\d+)?)?[上下]半?學期)
 |(([零一二三四五六七八九十百千萬]+|\d+)時期)
@@ -161,7 +162,7 @@ r = r"""((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
 |((\d+)月(\d+)日(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)午)
 |(晚(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)(\d+)時(\d+)分)
 |(傍晚)
-|(周([零一二三四五六七八九十百千萬]+|\d+))
+|(週([零一二三四五六七八九十百千萬]+|\d+))
 |((數|多|多少|好幾|幾|差不多|近|前|後|上|左右)午(\d+)時(\d+)分)
 |(同日)
 |((\d+)年(\d+)月底)
@@ -207,8 +208,8 @@ r = r"""((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
 |(元宵)(節)?
 |(航海日)
 |(兒童節)
-|(國庆)(節)?
-|(植树節)
+|(國慶)(節)?
+|(植樹節)
 |(元旦)
 |(重陽節)
 |(婦女節)
@@ -217,34 +218,34 @@ r = r"""((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
 |(([零一二三四五六七八九十百千萬]+|\d+)年半)
 |(今年年底)
 |(新年)
-|(本周)
+|(本週)
 |(當地時間星期([零一二三四五六七八九十百千萬]+|\d+))
-|(([零一二三四五六七八九十百千萬]+|\d+)(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)岁)
+|(([零一二三四五六七八九十百千萬]+|\d+)(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)歲)
 |(半小時)
-|(每周)
-|(([零一二三四五六七八九十百千萬]+|\d+)周年)
+|(每週)
+|(([零一二三四五六七八九十百千萬]+|\d+)週年)
 |((重要|最後)?時刻)
 |(([零一二三四五六七八九十百千萬]+|\d+)期間)
-|(周日)
+|(週日)
 |(晚(數|多|多少|好幾|幾|差不多|近|前|後|上|左右))
 |(今後)
 |(([零一二三四五六七八九十百千萬]+|\d+)段時間)
 |(明年)
 |([12][09][0-9]{2}(年度)?)
-|(今年([零一二三四五六七八九十百千萬]+|\d+))|(\d+[:：]\d+(分|))
+|(今年([零一二三四五六七八九十百千萬]+|\d+))|(\d+:\d+(分|))
 |((\d+):(\d+))|(\d+/\d+/\d+)
 |(([0-3][0-9]|[1-9])(日|號))
 |(\d+)月
 |(\d+)月(\d+)日
 |(\d+)月(\d+)
 |(兩個星期)
-|(過去(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)周)
-|(本赛季)
+|(過去(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)週)
+|(本賽季)
 |(半個(數|多|多少|好幾|幾|差不多|近|前|後|上|左右))
 |(稍晚)
-|(\d+(天|日|周|月|年)(後|前))
+|(\d+(天|日|週|月|年)(後|前))
 |(([半一二兩三四五六七八九十百千萬]+|\d+)年)
-|((一|二|兩|三|四|五|六|七|八|九|十|百|千|萬|幾|多|上|\d+)+個?(天|日|周|月|年)(後|前|半|))
+|((一|二|兩|三|四|五|六|七|八|九|十|百|千|萬|幾|多|上|\d+)+個?(天|日|週|月|年)(後|前|半|))
 |((勝利的)日子)
 |(青春期)
 |([12][09][0-9]{2}(年度?))
@@ -256,14 +257,14 @@ r = r"""((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
 |([前去今明後新隔次]+年)
 |((\d+)月(\d+))
 |(夏天)
-|((\d+)日凌晨(\d+)時许)
+|((\d+)日凌晨(\d+)時許)
 |((\d+)月(\d+)日)
 |((\d+)點半)
 |(去年底)
 |(最後一[天刻])
 |(最(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)個月)
 |(聖誕節?)
-|(下?個?(星期|周)(一|二|三|四|五|六|七|天))
+|(下?個?(星期|週)(一|二|三|四|五|六|七|天))
 |((\d+)(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)年)
 |(當天(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)午)
 |(每年的(\d+)月(\d+)日)
@@ -272,18 +273,18 @@ r = r"""((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
 |(深夜)
 |(現如今)
 |([上中下]+午)
-|(第(一|二|三|四|五|六|七|八|九|十|百|千|萬|幾|多|\d+)+個?(天|日|周|月|年))
+|(第(一|二|三|四|五|六|七|八|九|十|百|千|萬|幾|多|\d+)+個?(天|日|週|月|年))
 |(昨晚)
 |(近年)
 |(今天清晨)
 |(中旬)
 |(星期([零一二三四五六七八九十百千萬]+|\d+)早)
-|(([零一二三四五六七八九十百千萬]+|\d+)战期間)
+|(([零一二三四五六七八九十百千萬]+|\d+)戰期間)
 |(星期)
 |(昨天晚(數|多|多少|好幾|幾|差不多|近|前|後|上|左右))
-|(较早時)
+|(較早時)
 |(個(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)小時)
-|(([零一二三四五六七八九十百千萬]+|\d+)個礼拜)
+|(([零一二三四五六七八九十百千萬]+|\d+)個禮拜)
 |(昨日)
 |([年月]初)
 |((\d+)年的(\d+)月)
@@ -305,22 +306,24 @@ r = r"""((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
 |(夜里)
 |(兩個(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)小時)
 |(昨天)
-|(罗马時代)
+|(羅馬時代)
 |(目(數|多|多少|好幾|幾|差不多|近|前|後|上|左右))
 |(([零一二三四五六七八九十百千萬]+|\d+)月)
 |((\d+)年(\d+)月(\d+)號)
 |(((10)|(11)|(12)|([1-9]))月份?)
 |([12][0-9]世紀)
 |((數|多|多少|好幾|幾|差不多|近|前|後|上|左右)([零一二三四五六七八九十百千萬]+|\d+)天)
+|((\d+)個?工作[日天][以之]?[前後])
+|((上+|下+)個?工作[日天])
 |(工作日)
 |(稍後)
 |((\d+)號(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)午)
 |(未來([零一二三四五六七八九十百千萬]+|\d+)年)
-|([0-9]+[天日周月年][後前左右]*)
+|([0-9]+[天日週月年][後前左右]*)
 |(([零一二三四五六七八九十百千萬]+|\d+)日(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)午)
 |(最(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)([零一二三四五六七八九十百千萬]+|\d+)刻)
 |(很久)
-|((\d+)(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)岁)
+|((\d+)(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)歲)
 |(去年(\d+)月(\d+)號)
 |(兩個月)
 |((數|多|多少|好幾|幾|差不多|近|前|後|上|左右)午(\d+)時)
@@ -328,25 +331,25 @@ r = r"""((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
 |(兩天)
 |(\d+個?(小時|星期))
 |((\d+)年半)
-|(较早)
+|(較早)
 |(([零一二三四五六七八九十百千萬]+|\d+)個小時)
-|([一二三四五六七八九十]+周年)
+|([一二三四五六七八九十]+週年)
 |(星期([零一二三四五六七八九十百千萬]+|\d+)(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)午)
 |(時刻)
 |((\d+天)+(\d+點)?(\d+分)?(\d+秒)?)
 |((\d+)日([零一二三四五六七八九十百千萬]+|\d+)時)
-|((\d+)周年)
+|((\d+)週年)
 |(([零一二三四五六七八九十百千萬]+|\d+)早)
 |(([零一二三四五六七八九十百千萬]+|\d+)日)
 |(去年(\d+)月)
 |(過去([零一二三四五六七八九十百千萬]+|\d+)年)
 |((\d+)個星期)
 |((數|多|多少|好幾|幾|差不多|近|前|後|上|左右)(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)天)
-|(执政期間)
+|(執政期間)
 |([當前昨今明後隔次春夏秋冬]+[天日])
 |(去年(\d+)月份)
 |(今(數|多|多少|好幾|幾|差不多|近|前|後|上|左右))
-|((\d+)周)
+|((\d+)週)
 |(兩星期)
 |(([零一二三四五六七八九十百千萬]+|\d+)年代)
 |((數|多|多少|好幾|幾|差不多|近|前|後|上|左右)天)
@@ -360,7 +363,7 @@ r = r"""((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
 |([長近多]年)
 |((\d+)日(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)午(\d+)時)
 |(那時)
-|(冷战時代)
+|(冷戰時代)
 |(([零一二三四五六七八九十百千萬]+|\d+)天)
 |(這個星期)
 |(去年)
@@ -408,11 +411,11 @@ r = r"""((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
 |(元月)|((\d+)月(\d+)日凌晨)
 |((\d+)月底)
 |(\d+個?(小時|星期))|((\d+)年半)
-|([一二三四五六七八九十]+周年)|(星期([零一二三四五六七八九十百千萬]+|\d+)(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)午)
+|([一二三四五六七八九十]+週年)|(星期([零一二三四五六七八九十百千萬]+|\d+)(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)午)
 |([長近多]年)|((\d+)日(數|多|多少|好幾|幾|差不多|近|前|後|上|左右)午(\d+)時)
 |((這|數|多|多少|好幾|幾|差不多|近|前|後|上|左右)兩個月)
 |(\d+大壽)
-|(周([零一二三四五六七八九十百千萬]+|\d+)早(數|多|多少|好幾|幾|差不多|近|前|後|上|左右))
+|(週([零一二三四五六七八九十百千萬]+|\d+)早(數|多|多少|好幾|幾|差不多|近|前|後|上|左右))
 |(半年)
 |(今日)
 |(末日)
@@ -436,4 +439,4 @@ r = r"""((前|昨|今|明|後|隔|次)(天|日)?(早|晚)(晨|上|間)?)
 )
 
 
-PATTERN = re.compile(r)
+PATTERN = compile_pattern(r)
@@ -0,0 +1,538 @@
+# Generated by `python -m dateparser_tw.phrasegen`, do not edit by hand.
+# phrase: (unit, shift, weekday, period), see `phrases.py`
+
+PHRASES = {
+    "前天": ("day", -2, None, None),
+    "前天凌晨": ("day", -2, None, "凌晨"),
+    "前天清晨": ("day", -2, None, "清晨"),
+    "前天早上": ("day", -2, None, "早上"),
+    "前天早晨": ("day", -2, None, "早晨"),
+    "前天早間": ("day", -2, None, "早間"),
+    "前天上午": ("day", -2, None, "上午"),
+    "前天下午": ("day", -2, None, "下午"),
+    "前天中午": ("day", -2, None, "中午"),
+    "前天午後": ("day", -2, None, "午後"),
+    "前天晚上": ("day", -2, None, "晚上"),
+    "前日": ("day", -2, None, None),
+    "前日凌晨": ("day", -2, None, "凌晨"),
+    "前日清晨": ("day", -2, None, "清晨"),
+    "前日早上": ("day", -2, None, "早上"),
+    "前日早晨": ("day", -2, None, "早晨"),
+    "前日早間": ("day", -2, None, "早間"),
+    "前日上午": ("day", -2, None, "上午"),
+    "前日下午": ("day", -2, None, "下午"),
+    "前日中午": ("day", -2, None, "中午"),
+    "前日午後": ("day", -2, None, "午後"),
+    "前日晚上": ("day", -2, None, "晚上"),
+    "昨天": ("day", -1, None, None),
+    "昨天凌晨": ("day", -1, None, "凌晨"),
+    "昨天清晨": ("day", -1, None, "清晨"),
+    "昨天早上": ("day", -1, None, "早上"),
+    "昨天早晨": ("day", -1, None, "早晨"),
+    "昨天早間": ("day", -1, None, "早間"),
+    "昨天上午": ("day", -1, None, "上午"),
+    "昨天下午": ("day", -1, None, "下午"),
+    "昨天中午": ("day", -1, None, "中午"),
+    "昨天午後": ("day", -1, None, "午後"),
+    "昨天晚上": ("day", -1, None, "晚上"),
+    "昨日": ("day", -1, None, None),
+    "昨日凌晨": ("day", -1, None, "凌晨"),
+    "昨日清晨": ("day", -1, None, "清晨"),
+    "昨日早上": ("day", -1, None, "早上"),
+    "昨日早晨": ("day", -1, None, "早晨"),
+    "昨日早間": ("day", -1, None, "早間"),
+    "昨日上午": ("day", -1, None, "上午"),
+    "昨日下午": ("day", -1, None, "下午"),
+    "昨日中午": ("day", -1, None, "中午"),
+    "昨日午後": ("day", -1, None, "午後"),
+    "昨日晚上": ("day", -1, None, "晚上"),
+    "今天": ("day", 0, None, None),
+    "今天凌晨": ("day", 0, None, "凌晨"),
+    "今天清晨": ("day", 0, None, "清晨"),
+    "今天早上": ("day", 0, None, "早上"),
+    "今天早晨": ("day", 0, None, "早晨"),
+    "今天早間": ("day", 0, None, "早間"),
+    "今天上午": ("day", 0, None, "上午"),
+    "今天下午": ("day", 0, None, "下午"),
+    "今天中午": ("day", 0, None, "中午"),
+    "今天午後": ("day", 0, None, "午後"),
+    "今天晚上": ("day", 0, None, "晚上"),
+    "今日": ("day", 0, None, None),
+    "今日凌晨": ("day", 0, None, "凌晨"),
+    "今日清晨": ("day", 0, None, "清晨"),
+    "今日早上": ("day", 0, None, "早上"),
+    "今日早晨": ("day", 0, None, "早晨"),
+    "今日早間": ("day", 0, None, "早間"),
+    "今日上午": ("day", 0, None, "上午"),
+    "今日下午": ("day", 0, None, "下午"),
+    "今日中午": ("day", 0, None, "中午"),
+    "今日午後": ("day", 0, None, "午後"),
+    "今日晚上": ("day", 0, None, "晚上"),
+    "本天": ("day", 0, None, None),
+    "本天凌晨": ("day", 0, None, "凌晨"),
+    "本天清晨": ("day", 0, None, "清晨"),
+    "本天早上": ("day", 0, None, "早上"),
+    "本天上午": ("day", 0, None, "上午"),
+    "本天下午": ("day", 0, None, "下午"),
+    "本天中午": ("day", 0, None, "中午"),
+    "本天午後": ("day", 0, None, "午後"),
+    "本天晚上": ("day", 0, None, "晚上"),
+    "本日": ("day", 0, None, None),
+    "本日凌晨": ("day", 0, None, "凌晨"),
+    "本日清晨": ("day", 0, None, "清晨"),
+    "本日早上": ("day", 0, None, "早上"),
+    "本日上午": ("day", 0, None, "上午"),
+    "本日下午": ("day", 0, None, "下午"),
+    "本日中午": ("day", 0, None, "中午"),
+    "本日午後": ("day", 0, None, "午後"),
+    "本日晚上": ("day", 0, None, "晚上"),
+    "明天": ("day", 1, None, None),
+    "明天凌晨": ("day", 1, None, "凌晨"),
+    "明天清晨": ("day", 1, None, "清晨"),
+    "明天早上": ("day", 1, None, "早上"),
+    "明天早晨": ("day", 1, None, "早晨"),
+    "明天早間": ("day", 1, None, "早間"),
+    "明天上午": ("day", 1, None, "上午"),
+    "明天下午": ("day", 1, None, "下午"),
+    "明天中午": ("day", 1, None, "中午"),
+    "明天午後": ("day", 1, None, "午後"),
+    "明天晚上": ("day", 1, None, "晚上"),
+    "明日": ("day", 1, None, None),
+    "明日凌晨": ("day", 1, None, "凌晨"),
+    "明日清晨": ("day", 1, None, "清晨"),
+    "明日早上": ("day", 1, None, "早上"),
+    "明日早晨": ("day", 1, None, "早晨"),
+    "明日早間": ("day", 1, None, "早間"),
+    "明日上午": ("day", 1, None, "上午"),
+    "明日下午": ("day", 1, None, "下午"),
+    "明日中午": ("day", 1, None, "中午"),
+    "明日午後": ("day", 1, None, "午後"),
+    "明日晚上": ("day", 1, None, "晚上"),
+    "次天": ("day", 1, None, None),
+    "次天凌晨": ("day", 1, None, "凌晨"),
+    "次天清晨": ("day", 1, None, "清晨"),
+    "次天早上": ("day", 1, None, "早上"),
+    "次天早晨": ("day", 1, None, "早晨"),
+    "次天早間": ("day", 1, None, "早間"),
+    "次天上午": ("day", 1, None, "上午"),
+    "次天下午": ("day", 1, None, "下午"),
+    "次天中午": ("day", 1, None, "中午"),
+    "次天午後": ("day", 1, None, "午後"),
+    "次天晚上": ("day", 1, None, "晚上"),
+    "次日": ("day", 1, None, None),
+    "次日凌晨": ("day", 1, None, "凌晨"),
+    "次日清晨": ("day", 1, None, "清晨"),
+    "次日早上": ("day", 1, None, "早上"),
+    "次日早晨": ("day", 1, None, "早晨"),
+    "次日早間": ("day", 1, None, "早間"),
+    "次日上午": ("day", 1, None, "上午"),
+    "次日下午": ("day", 1, None, "下午"),
+    "次日中午": ("day", 1, None, "中午"),
+    "次日午後": ("day", 1, None, "午後"),
+    "次日晚上": ("day", 1, None, "晚上"),
+    "隔天": ("day", 1, None, None),
+    "隔天凌晨": ("day", 1, None, "凌晨"),
+    "隔天清晨": ("day", 1, None, "清晨"),
+    "隔天早上": ("day", 1, None, "早上"),
+    "隔天早晨": ("day", 1, None, "早晨"),
+    "隔天早間": ("day", 1, None, "早間"),
+    "隔天上午": ("day", 1, None, "上午"),
+    "隔天下午": ("day", 1, None, "下午"),
+    "隔天中午": ("day", 1, None, "中午"),
+    "隔天午後": ("day", 1, None, "午後"),
+    "隔天晚上": ("day", 1, None, "晚上"),
+    "隔日": ("day", 1, None, None),
+    "隔日凌晨": ("day", 1, None, "凌晨"),
+    "隔日清晨": ("day", 1, None, "清晨"),
+    "隔日早上": ("day", 1, None, "早上"),
+    "隔日早晨": ("day", 1, None, "早晨"),
+    "隔日早間": ("day", 1, None, "早間"),
+    "隔日上午": ("day", 1, None, "上午"),
+    "隔日下午": ("day", 1, None, "下午"),
+    "隔日中午": ("day", 1, None, "中午"),
+    "隔日午後": ("day", 1, None, "午後"),
+    "隔日晚上": ("day", 1, None, "晚上"),
+    "後天": ("day", 2, None, None),
+    "後天凌晨": ("day", 2, None, "凌晨"),
+    "後天清晨": ("day", 2, None, "清晨"),
+    "後天早上": ("day", 2, None, "早上"),
+    "後天早晨": ("day", 2, None, "早晨"),
+    "後天早間": ("day", 2, None, "早間"),
+    "後天上午": ("day", 2, None, "上午"),
+    "後天下午": ("day", 2, None, "下午"),
+    "後天中午": ("day", 2, None, "中午"),
+    "後天午後": ("day", 2, None, "午後"),
+    "後天晚上": ("day", 2, None, "晚上"),
+    "後日": ("day", 2, None, None),
+    "後日凌晨": ("day", 2, None, "凌晨"),
+    "後日清晨": ("day", 2, None, "清晨"),
+    "後日早上": ("day", 2, None, "早上"),
+    "後日早晨": ("day", 2, None, "早晨"),
+    "後日早間": ("day", 2, None, "早間"),
+    "後日上午": ("day", 2, None, "上午"),
+    "後日下午": ("day", 2, None, "下午"),
+    "後日中午": ("day", 2, None, "中午"),
+    "後日午後": ("day", 2, None, "午後"),
+    "後日晚上": ("day", 2, None, "晚上"),
+    "前年": ("year", -2, None, None),
+    "去年": ("year", -1, None, None),
+    "今年": ("year", 0, None, None),
+    "本年": ("year", 0, None, None),
+    "明年": ("year", 1, None, None),
+    "次年": ("year", 1, None, None),
+    "隔年": ("year", 1, None, None),
+    "後年": ("year", 2, None, None),
+    "上個月": ("month", -1, None, None),
+    "上上個月": ("month", -2, None, None),
+    "下個月": ("month", 1, None, None),
+    "下下個月": ("month", 2, None, None),
+    "這個月": ("month", 0, None, None),
+    "本月": ("month", 0, None, None),
+    "上個週": ("week", -1, None, None),
+    "上個星期": ("week", -1, None, None),
+    "上上個週": ("week", -2, None, None),
+    "這個星期": ("week", 0, None, None),
+    "上週": ("week", -1, None, None),
+    "上週1": ("week", -1, 1, None),
+    "上週2": ("week", -1, 2, None),
+    "上週3": ("week", -1, 3, None),
+    "上週4": ("week", -1, 4, None),
+    "上週5": ("week", -1, 5, None),
+    "上週6": ("week", -1, 6, None),
+    "上週7": ("week", -1, 7, None),
+    "上週一": ("week", -1, 1, None),
+    "上週二": ("week", -1, 2, None),
+    "上週三": ("week", -1, 3, None),
+    "上週四": ("week", -1, 4, None),
+    "上週五": ("week", -1, 5, None),
+    "上週六": ("week", -1, 6, None),
+    "上週日": ("week", -1, 7, None),
+    "上週天": ("week", -1, 7, None),
+    "上星期": ("week", -1, None, None),
+    "上星期1": ("week", -1, 1, None),
+    "上星期2": ("week", -1, 2, None),
+    "上星期3": ("week", -1, 3, None),
+    "上星期4": ("week", -1, 4, None),
+    "上星期5": ("week", -1, 5, None),
+    "上星期6": ("week", -1, 6, None),
+    "上星期7": ("week", -1, 7, None),
+    "上星期一": ("week", -1, 1, None),
+    "上星期二": ("week", -1, 2, None),
+    "上星期三": ("week", -1, 3, None),
+    "上星期四": ("week", -1, 4, None),
+    "上星期五": ("week", -1, 5, None),
+    "上星期六": ("week", -1, 6, None),
+    "上星期日": ("week", -1, 7, None),
+    "上星期天": ("week", -1, 7, None),
+    "上禮拜": ("week", -1, None, None),
+    "上禮拜1": ("week", -1, 1, None),
+    "上禮拜2": ("week", -1, 2, None),
+    "上禮拜3": ("week", -1, 3, None),
+    "上禮拜4": ("week", -1, 4, None),
+    "上禮拜5": ("week", -1, 5, None),
+    "上禮拜6": ("week", -1, 6, None),
+    "上禮拜7": ("week", -1, 7, None),
+    "上禮拜一": ("week", -1, 1, None),
+    "上禮拜二": ("week", -1, 2, None),
+    "上禮拜三": ("week", -1, 3, None),
+    "上禮拜四": ("week", -1, 4, None),
+    "上禮拜五": ("week", -1, 5, None),
+    "上禮拜六": ("week", -1, 6, None),
+    "上禮拜日": ("week", -1, 7, None),
+    "上禮拜天": ("week", -1, 7, None),
+    "上上週": ("week", -2, None, None),
+    "上上週1": ("week", -2, 1, None),
+    "上上週2": ("week", -2, 2, None),
+    "上上週3": ("week", -2, 3, None),
+    "上上週4": ("week", -2, 4, None),
+    "上上週5": ("week", -2, 5, None),
+    "上上週6": ("week", -2, 6, None),
+    "上上週7": ("week", -2, 7, None),
+    "上上週一": ("week", -2, 1, None),
+    "上上週二": ("week", -2, 2, None),
+    "上上週三": ("week", -2, 3, None),
+    "上上週四": ("week", -2, 4, None),
+    "上上週五": ("week", -2, 5, None),
+    "上上週六": ("week", -2, 6, None),
+    "上上週日": ("week", -2, 7, None),
+    "上上週天": ("week", -2, 7, None),
+    "上上星期": ("week", -2, None, None),
+    "上上星期1": ("week", -2, 1, None),
+    "上上星期2": ("week", -2, 2, None),
+    "上上星期3": ("week", -2, 3, None),
+    "上上星期4": ("week", -2, 4, None),
+    "上上星期5": ("week", -2, 5, None),
+    "上上星期6": ("week", -2, 6, None),
+    "上上星期7": ("week", -2, 7, None),
+    "上上星期一": ("week", -2, 1, None),
+    "上上星期二": ("week", -2, 2, None),
+    "上上星期三": ("week", -2, 3, None),
+    "上上星期四": ("week", -2, 4, None),
+    "上上星期五": ("week", -2, 5, None),
+    "上上星期六": ("week", -2, 6, None),
+    "上上星期日": ("week", -2, 7, None),
+    "上上星期天": ("week", -2, 7, None),
+    "上上禮拜": ("week", -2, None, None),
+    "上上禮拜1": ("week", -2, 1, None),
+    "上上禮拜2": ("week", -2, 2, None),
+    "上上禮拜3": ("week", -2, 3, None),
+    "上上禮拜4": ("week", -2, 4, None),
+    "上上禮拜5": ("week", -2, 5, None),
+    "上上禮拜6": ("week", -2, 6, None),
+    "上上禮拜7": ("week", -2, 7, None),
+    "上上禮拜一": ("week", -2, 1, None),
+    "上上禮拜二": ("week", -2, 2, None),
+    "上上禮拜三": ("week", -2, 3, None),
+    "上上禮拜四": ("week", -2, 4, None),
+    "上上禮拜五": ("week", -2, 5, None),
+    "上上禮拜六": ("week", -2, 6, None),
+    "上上禮拜日": ("week", -2, 7, None),
+    "上上禮拜天": ("week", -2, 7, None),
+    "下週": ("week", 1, None, None),
+    "下週1": ("week", 1, 1, None),
+    "下週2": ("week", 1, 2, None),
+    "下週3": ("week", 1, 3, None),
+    "下週4": ("week", 1, 4, None),
+    "下週5": ("week", 1, 5, None),
+    "下週6": ("week", 1, 6, None),
+    "下週7": ("week", 1, 7, None),
+    "下週一": ("week", 1, 1, None),
+    "下週二": ("week", 1, 2, None),
+    "下週三": ("week", 1, 3, None),
+    "下週四": ("week", 1, 4, None),
+    "下週五": ("week", 1, 5, None),
+    "下週六": ("week", 1, 6, None),
+    "下週日": ("week", 1, 7, None),
+    "下週天": ("week", 1, 7, None),
+    "下星期": ("week", 1, None, None),
+    "下星期1": ("week", 1, 1, None),
+    "下星期2": ("week", 1, 2, None),
+    "下星期3": ("week", 1, 3, None),
+    "下星期4": ("week", 1, 4, None),
+    "下星期5": ("week", 1, 5, None),
+    "下星期6": ("week", 1, 6, None),
+    "下星期7": ("week", 1, 7, None),
+    "下星期一": ("week", 1, 1, None),
+    "下星期二": ("week", 1, 2, None),
+    "下星期三": ("week", 1, 3, None),
+    "下星期四": ("week", 1, 4, None),
+    "下星期五": ("week", 1, 5, None),
+    "下星期六": ("week", 1, 6, None),
+    "下星期日": ("week", 1, 7, None),
+    "下星期天": ("week", 1, 7, None),
+    "下禮拜": ("week", 1, None, None),
+    "下禮拜1": ("week", 1, 1, None),
+    "下禮拜2": ("week", 1, 2, None),
+    "下禮拜3": ("week", 1, 3, None),
+    "下禮拜4": ("week", 1, 4, None),
+    "下禮拜5": ("week", 1, 5, None),
+    "下禮拜6": ("week", 1, 6, None),
+    "下禮拜7": ("week", 1, 7, None),
+    "下禮拜一": ("week", 1, 1, None),
+    "下禮拜二": ("week", 1, 2, None),
+    "下禮拜三": ("week", 1, 3, None),
+    "下禮拜四": ("week", 1, 4, None),
+    "下禮拜五": ("week", 1, 5, None),
+    "下禮拜六": ("week", 1, 6, None),
+    "下禮拜日": ("week", 1, 7, None),
+    "下禮拜天": ("week", 1, 7, None),
+    "下下週": ("week", 2, None, None),
+    "下下週1": ("week", 2, 1, None),
+    "下下週2": ("week", 2, 2, None),
+    "下下週3": ("week", 2, 3, None),
+    "下下週4": ("week", 2, 4, None),
+    "下下週5": ("week", 2, 5, None),
+    "下下週6": ("week", 2, 6, None),
+    "下下週7": ("week", 2, 7, None),
+    "下下週一": ("week", 2, 1, None),
+    "下下週二": ("week", 2, 2, None),
+    "下下週三": ("week", 2, 3, None),
+    "下下週四": ("week", 2, 4, None),
+    "下下週五": ("week", 2, 5, None),
+    "下下週六": ("week", 2, 6, None),
+    "下下週日": ("week", 2, 7, None),
+    "下下週天": ("week", 2, 7, None),
+    "下下星期": ("week", 2, None, None),
+    "下下星期1": ("week", 2, 1, None),
+    "下下星期2": ("week", 2, 2, None),
+    "下下星期3": ("week", 2, 3, None),
+    "下下星期4": ("week", 2, 4, None),
+    "下下星期5": ("week", 2, 5, None),
+    "下下星期6": ("week", 2, 6, None),
+    "下下星期7": ("week", 2, 7, None),
+    "下下星期一": ("week", 2, 1, None),
+    "下下星期二": ("week", 2, 2, None),
+    "下下星期三": ("week", 2, 3, None),
+    "下下星期四": ("week", 2, 4, None),
+    "下下星期五": ("week", 2, 5, None),
+    "下下星期六": ("week", 2, 6, None),
+    "下下星期日": ("week", 2, 7, None),
+    "下下星期天": ("week", 2, 7, None),
+    "下下禮拜": ("week", 2, None, None),
+    "下下禮拜1": ("week", 2, 1, None),
+    "下下禮拜2": ("week", 2, 2, None),
+    "下下禮拜3": ("week", 2, 3, None),
+    "下下禮拜4": ("week", 2, 4, None),
+    "下下禮拜5": ("week", 2, 5, None),
+    "下下禮拜6": ("week", 2, 6, None),
+    "下下禮拜7": ("week", 2, 7, None),
+    "下下禮拜一": ("week", 2, 1, None),
+    "下下禮拜二": ("week", 2, 2, None),
+    "下下禮拜三": ("week", 2, 3, None),
+    "下下禮拜四": ("week", 2, 4, None),
+    "下下禮拜五": ("week", 2, 5, None),
+    "下下禮拜六": ("week", 2, 6, None),
+    "下下禮拜日": ("week", 2, 7, None),
+    "下下禮拜天": ("week", 2, 7, None),
+    "這週": ("week", 0, None, None),
+    "這週1": ("week", 0, 1, None),
+    "這週2": ("week", 0, 2, None),
+    "這週3": ("week", 0, 3, None),
+    "這週4": ("week", 0, 4, None),
+    "這週5": ("week", 0, 5, None),
+    "這週6": ("week", 0, 6, None),
+    "這週7": ("week", 0, 7, None),
+    "這週一": ("week", 0, 1, None),
+    "這週二": ("week", 0, 2, None),
+    "這週三": ("week", 0, 3, None),
+    "這週四": ("week", 0, 4, None),
+    "這週五": ("week", 0, 5, None),
+    "這週六": ("week", 0, 6, None),
+    "這週日": ("week", 0, 7, None),
+    "這週天": ("week", 0, 7, None),
+    "這星期": ("week", 0, None, None),
+    "這星期1": ("week", 0, 1, None),
+    "這星期2": ("week", 0, 2, None),
+    "這星期3": ("week", 0, 3, None),
+    "這星期4": ("week", 0, 4, None),
+    "這星期5": ("week", 0, 5, None),
+    "這星期6": ("week", 0, 6, None),
+    "這星期7": ("week", 0, 7, None),
+    "這星期一": ("week", 0, 1, None),
+    "這星期二": ("week", 0, 2, None),
+    "這星期三": ("week", 0, 3, None),
+    "這星期四": ("week", 0, 4, None),
+    "這星期五": ("week", 0, 5, None),
+    "這星期六": ("week", 0, 6, None),
+    "這星期日": ("week", 0, 7, None),
+    "這星期天": ("week", 0, 7, None),
+    "這禮拜": ("week", 0, None, None),
+    "這禮拜1": ("week", 0, 1, None),
+    "這禮拜2": ("week", 0, 2, None),
+    "這禮拜3": ("week", 0, 3, None),
+    "這禮拜4": ("week", 0, 4, None),
+    "這禮拜5": ("week", 0, 5, None),
+    "這禮拜6": ("week", 0, 6, None),
+    "這禮拜7": ("week", 0, 7, None),
+    "這禮拜一": ("week", 0, 1, None),
+    "這禮拜二": ("week", 0, 2, None),
+    "這禮拜三": ("week", 0, 3, None),
+    "這禮拜四": ("week", 0, 4, None),
+    "這禮拜五": ("week", 0, 5, None),
+    "這禮拜六": ("week", 0, 6, None),
+    "這禮拜日": ("week", 0, 7, None),
+    "這禮拜天": ("week", 0, 7, None),
+    "本週": ("week", 0, None, None),
+    "本週1": ("week", 0, 1, None),
+    "本週2": ("week", 0, 2, None),
+    "本週3": ("week", 0, 3, None),
+    "本週4": ("week", 0, 4, None),
+    "本週5": ("week", 0, 5, None),
+    "本週6": ("week", 0, 6, None),
+    "本週7": ("week", 0, 7, None),
+    "本週一": ("week", 0, 1, None),
+    "本週二": ("week", 0, 2, None),
+    "本週三": ("week", 0, 3, None),
+    "本週四": ("week", 0, 4, None),
+    "本週五": ("week", 0, 5, None),
+    "本週六": ("week", 0, 6, None),
+    "本週日": ("week", 0, 7, None),
+    "本週天": ("week", 0, 7, None),
+    "本星期": ("week", 0, None, None),
+    "本星期1": ("week", 0, 1, None),
+    "本星期2": ("week", 0, 2, None),
+    "本星期3": ("week", 0, 3, None),
+    "本星期4": ("week", 0, 4, None),
+    "本星期5": ("week", 0, 5, None),
+    "本星期6": ("week", 0, 6, None),
+    "本星期7": ("week", 0, 7, None),
+    "本星期一": ("week", 0, 1, None),
+    "本星期二": ("week", 0, 2, None),
+    "本星期三": ("week", 0, 3, None),
+    "本星期四": ("week", 0, 4, None),
+    "本星期五": ("week", 0, 5, None),
+    "本星期六": ("week", 0, 6, None),
+    "本星期日": ("week", 0, 7, None),
+    "本星期天": ("week", 0, 7, None),
+    "本禮拜": ("week", 0, None, None),
+    "本禮拜1": ("week", 0, 1, None),
+    "本禮拜2": ("week", 0, 2, None),
+    "本禮拜3": ("week", 0, 3, None),
+    "本禮拜4": ("week", 0, 4, None),
+    "本禮拜5": ("week", 0, 5, None),
+    "本禮拜6": ("week", 0, 6, None),
+    "本禮拜7": ("week", 0, 7, None),
+    "本禮拜一": ("week", 0, 1, None),
+    "本禮拜二": ("week", 0, 2, None),
+    "本禮拜三": ("week", 0, 3, None),
+    "本禮拜四": ("week", 0, 4, None),
+    "本禮拜五": ("week", 0, 5, None),
+    "本禮拜六": ("week", 0, 6, None),
+    "本禮拜日": ("week", 0, 7, None),
+    "本禮拜天": ("week", 0, 7, None),
+    "週1": ("week", 0, 1, None),
+    "週2": ("week", 0, 2, None),
+    "週3": ("week", 0, 3, None),
+    "週4": ("week", 0, 4, None),
+    "週5": ("week", 0, 5, None),
+    "週6": ("week", 0, 6, None),
+    "週7": ("week", 0, 7, None),
+    "週一": ("week", 0, 1, None),
+    "週二": ("week", 0, 2, None),
+    "週三": ("week", 0, 3, None),
+    "週四": ("week", 0, 4, None),
+    "週五": ("week", 0, 5, None),
+    "週六": ("week", 0, 6, None),
+    "週日": ("week", 0, 7, None),
+    "週天": ("week", 0, 7, None),
+    "星期1": ("week", 0, 1, None),
+    "星期2": ("week", 0, 2, None),
+    "星期3": ("week", 0, 3, None),
+    "星期4": ("week", 0, 4, None),
+    "星期5": ("week", 0, 5, None),
+    "星期6": ("week", 0, 6, None),
+    "星期7": ("week", 0, 7, None),
+    "星期一": ("week", 0, 1, None),
+    "星期二": ("week", 0, 2, None),
+    "星期三": ("week", 0, 3, None),
+    "星期四": ("week", 0, 4, None),
+    "星期五": ("week", 0, 5, None),
+    "星期六": ("week", 0, 6, None),
+    "星期日": ("week", 0, 7, None),
+    "星期天": ("week", 0, 7, None),
+    "禮拜1": ("week", 0, 1, None),
+    "禮拜2": ("week", 0, 2, None),
+    "禮拜3": ("week", 0, 3, None),
+    "禮拜4": ("week", 0, 4, None),
+    "禮拜5": ("week", 0, 5, None),
+    "禮拜6": ("week", 0, 6, None),
+    "禮拜7": ("week", 0, 7, None),
+    "禮拜一": ("week", 0, 1, None),
+    "禮拜二": ("week", 0, 2, None),
+    "禮拜三": ("week", 0, 3, None),
+    "禮拜四": ("week", 0, 4, None),
+    "禮拜五": ("week", 0, 5, None),
+    "禮拜六": ("week", 0, 6, None),
+    "禮拜日": ("week", 0, 7, None),
+    "禮拜天": ("week", 0, 7, None),
+    "凌晨": (None, 0, None, "凌晨"),
+    "清晨": (None, 0, None, "清晨"),
+    "早上": (None, 0, None, "早上"),
+    "今早": (None, 0, None, "今早"),
+    "上午": (None, 0, None, "上午"),
+    "下午": (None, 0, None, "下午"),
+    "中午": (None, 0, None, "中午"),
+    "午後": (None, 0, None, "午後"),
+    "晚上": (None, 0, None, "晚上"),
+    "今晚": (None, 0, None, "今晚"),
+}
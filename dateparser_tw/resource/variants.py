@@ -0,0 +1,74 @@
+# one-to-one character replacements applied before matching, so that
+# `PATTERN` and the parser rules only need the canonical Traditional forms
+
+FULL_WIDTH = {
+    **{chr(0xFF10 + i): str(i) for i in range(10)},  # ０-９
+    **{chr(0xFF21 + i): chr(ord("A") + i) for i in range(26)},  # Ａ-Ｚ
+    **{chr(0xFF41 + i): chr(ord("a") + i) for i in range(26)},  # ａ-ｚ
+    "：": ":",
+    "／": "/",
+    "－": "-",
+    "．": ".",
+    "～": "~",
+    "　": " ",
+}
+
+SIMPLIFIED = {
+    # numerals
+    "两": "兩",
+    "万": "萬",
+    "亿": "億",
+    "几": "幾",
+    # units and time words
+    "岁": "歲",
+    "时": "時",
+    "点": "點",
+    "钟": "鐘",
+    "个": "個",
+    "号": "號",
+    "后": "後",
+    "礼": "禮",
+    "间": "間",
+    "头": "頭",
+    "这": "這",
+    "来": "來",
+    "过": "過",
+    "现": "現",
+    "当": "當",
+    "长": "長",
+    "届": "屆",
+    "纪": "紀",
+    "较": "較",
+    "许": "許",
+    "历": "曆",
+    "农": "農",
+    "闰": "閏",
+    "阳": "陽",
+    # holidays and events
+    "节": "節",
+    "圣": "聖",
+    "诞": "誕",
+    "国": "國",
+    "庆": "慶",
+    "劳": "勞",
+    "动": "動",
+    "儿": "兒",
+    "妇": "婦",
+    "师": "師",
+    "树": "樹",
+    "赛": "賽",
+    "战": "戰",
+    "执": "執",
+    "罗": "羅",
+    "马": "馬",
+    "龙": "龍",
+    "鸡": "雞",
+    "猪": "豬",
+}
+
+VARIANTS = {
+    "周": "週",
+    "裏": "裡",
+}
+
+CANONICAL = {**FULL_WIDTH, **SIMPLIFIED, **VARIANTS}
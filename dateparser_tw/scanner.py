@@ -0,0 +1,188 @@
+"""Scan large UTF-8 files for time expressions, chunk by chunk.
+
+Files are read through `mmap` (or in buffered chunks for streams), and the
+text of a chunk is only scanned up to `overlap` characters before its end; the
+rest is carried over to the next chunk, so a match crossing a chunk boundary
+is found whole as long as it is shorter than `overlap`. A longer run of
+adjacent matches, eg. `明天明天…`, is split at the end of the scanned part
+instead of being carried over whole. Spans are yielded with
+byte offsets into the file, in order, in time linear in the file size and with
+memory bounded by `chunk_size` and `overlap`.
+
+Usage: python -m dateparser_tw.scanner dump.txt --basetime 2024-07-15
+"""
+
+import argparse
+import codecs
+import json
+import mmap
+import os
+import re
+from functools import lru_cache
+from typing import BinaryIO, Iterable, Iterator, Optional, Pattern, Union
+
+import arrow
+from loguru import logger
+
+from .dataclasses import Span, TimePoint
+from .incremental import CONTEXT_CHARS
+from .normalizer import (
+    extract_span_positions,
+    resolve_span,
+    sanitize_date_with_offsets,
+)
+from .resource.pattern import PATTERN
+
+# invalid bytes are kept as lone surrogates, so they encode back to the same
+# number of bytes and offsets stay exact
+ERRORS = "surrogateescape"
+
+# RE2 matches UTF-8 and can't take those surrogates, `re` and `regex` can
+SCAN_PATTERN = (
+    re.compile(PATTERN.pattern)
+    if type(PATTERN).__module__.startswith("re2")
+    else PATTERN
+)
+
+
+def byte_length(text: str) -> int:
+    return len(text.encode("utf-8", ERRORS))
+
+
+class Scanner:
+    def __init__(
+        self,
+        basetime: Union[arrow.Arrow, str] = None,
+        tz: str = "Asia/Taipei",
+        pattern: Pattern = SCAN_PATTERN,
+        chunk_size: int = 1 << 20,
+        overlap: int = 1024,
+        cache_size: int = 4096,
+    ):
+        if overlap <= 0 or chunk_size <= 0:
+            raise ValueError("chunk_size and overlap must be positive")
+
+        self.basetime = (
+            arrow.now(tz) if basetime is None else arrow.get(basetime, tzinfo=tz)
+        )
+        self.pattern = pattern
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self._result = lru_cache(maxsize=cache_size)(self._parse_span)
+
+    def scan_file(self, path: Union[str, os.PathLike], use_mmap: bool = True):
+        with open(path, "rb") as f:
+            if use_mmap and os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    size, step = len(mm), self.chunk_size
+                    yield from self.scan_chunks(
+                        mm[i : i + step] for i in range(0, size, step)
+                    )
+            else:
+                yield from self.scan_stream(f)
+
+    def scan_stream(self, stream: BinaryIO) -> Iterator[Span]:
+        return self.scan_chunks(iter(lambda: stream.read(self.chunk_size), b""))
+
+    def scan_chunks(self, chunks: Iterable[bytes]) -> Iterator[Span]:
+        """Yields a `Span` per expression, `start` and `end` being byte offsets."""
+        decoder = codecs.getincrementaldecoder("utf-8")(errors=ERRORS)
+
+        text, base = "", 0
+        for chunk in chunks:
+            text += decoder.decode(chunk)
+            if len(text) > self.overlap:
+                base, text = yield from self._scan(text, base, final=False)
+
+        text += decoder.decode(b"", final=True)
+        yield from self._scan(text, base, final=True)
+
+    def _scan(self, text: str, base: int, final: bool):
+        """Yield the spans ending before the overlap, returns the byte offset and
+        the text of the part carried over to the next chunk."""
+        sanitized, starts, ends = sanitize_date_with_offsets(text, local=True)
+        limit = len(text) if final else len(text) - self.overlap
+
+        cut = limit
+        position = last_end = 0
+        for lo, hi in extract_span_positions(sanitized, self.pattern):
+            start, end = starts[lo], ends[hi - 1]
+            split = end > limit
+            if split:
+                # only a run longer than `overlap` is split, after its last match
+                # ending in the scanned part, so the carried text stays under
+                # twice `overlap`
+                hi = self._split(sanitized, ends, lo, hi, limit)
+                if start + self.overlap >= limit or hi == lo:
+                    cut = start
+                    break
+                end = cut = ends[hi - 1]
+
+            base += byte_length(text[position:start])
+            byte_start = base
+            base += byte_length(text[start:end])
+            position = last_end = end
+
+            span_text = sanitized[lo:hi]
+            yield Span(byte_start, base, span_text, self._result(span_text))
+            if split:
+                break
+
+        if final:
+            return base + byte_length(text[position:]), ""
+
+        # don't cut inside a run whose sanitization depends on its neighbours,
+        # eg. a Chinese numeral, but don't carry more than `overlap` either
+        floor = max(last_end, cut - self.overlap)
+        while cut > floor and (
+            text[cut - 1] in CONTEXT_CHARS or text[cut - 1].isspace()
+        ):
+            cut -= 1
+
+        return base + byte_length(text[position:cut]), text[cut:]
+
+    def _split(self, sanitized: str, ends: list, lo: int, hi: int, limit: int) -> int:
+        """The end of the last match of the run `[lo, hi)` ending by `limit`."""
+        split = lo
+        for match in self.pattern.finditer(sanitized, lo, hi):
+            if ends[match.end() - 1] > limit:
+                break
+            split = match.end()
+        return split
+
+    def _parse_span(self, span: str) -> Optional[TimePoint]:
+        try:
+            return resolve_span(span, self.basetime)
+        except (ValueError, KeyError) as e:
+            # `KeyError` for relative words missing from `SHIFTS`, eg. `大前天`
+            logger.debug(f"Failed to parse span {span}: {e!r}")
+            return None
+
+
+def scan_file(
+    path: Union[str, os.PathLike], basetime: Union[arrow.Arrow, str] = None, **kwargs
+) -> Iterator[Span]:
+    return Scanner(basetime, **kwargs).scan_file(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scan a file for time expressions")
+    parser.add_argument("path")
+    parser.add_argument("--basetime", help="defaults to now")
+    parser.add_argument("--chunk-size", type=int, default=1 << 20)
+    parser.add_argument("--overlap", type=int, default=1024)
+    args = parser.parse_args()
+
+    scanner = Scanner(args.basetime, chunk_size=args.chunk_size, overlap=args.overlap)
+    for span in scanner.scan_file(args.path):
+        record = {
+            "offset": span.start,
+            "length": span.end - span.start,
+            "span": span.text,
+            "result": span.result and span.result.model_dump(mode="json"),
+        }
+        print(json.dumps(record, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
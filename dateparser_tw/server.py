@@ -0,0 +1,270 @@
+"""A local parsing daemon keeping a warm `DateParser`.
+
+Frames are a 4-byte big-endian length followed by a UTF-8 JSON object:
+
+    request:  {"id": 1, "text": "明天下午三點", "basetime": "2024-07-15"}
+              {"id": 2, "op": "stats"}
+    response: {"id": 1, "result": {"year": 2024, ...}}
+              {"id": 1, "error": "ValueError: year is required"}
+
+Requests arriving within `batch_window` seconds of each other, on any
+connection, are parsed together in one batch on a single worker thread. The
+window is only waited for when several requests are already queued.
+
+Responses are written by a task of their connection, so a client that doesn't
+read its responses never holds up the batches of the others. Once it has
+`max_pending` responses waiting, its requests are no longer read.
+
+Usage: python -m dateparser_tw.server --unix /tmp/dateparser-tw.sock
+       python -m dateparser_tw.server --host 127.0.0.1 --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import struct
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from loguru import logger
+
+from .normalizer import DateParser
+
+HEADER = struct.Struct(">I")
+MAX_FRAME = 1 << 20
+
+
+def encode_frame(message: dict) -> bytes:
+    payload = json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode()
+    return HEADER.pack(len(payload)) + payload
+
+
+async def read_frame(reader: asyncio.StreamReader) -> dict:
+    (size,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+    if size > MAX_FRAME:
+        raise ValueError(f"Frame too large: {size} bytes")
+    return json.loads(await reader.readexactly(size))
+
+
+def validate(request) -> Optional[str]:
+    """What is wrong with a request, `None` when nothing is."""
+    if not isinstance(request, dict):
+        return "a request must be an object"
+    if request.get("op") == "stats":
+        return None
+    if not isinstance(request.get("text"), str):
+        return "text is required"
+    if not isinstance(request.get("basetime"), (str, int, float, type(None))):
+        return "basetime must be a string or an epoch timestamp"
+    return None
+
+
+class ParseServer:
+    def __init__(
+        self,
+        parser: DateParser = None,
+        batch_window: float = 0.002,
+        max_batch: int = 256,
+        max_pending: int = 1024,
+    ):
+        self.parser = parser or DateParser()
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+
+        # a single thread, `DateParser` keeps per-call state
+        self.executor = ThreadPoolExecutor(1, thread_name_prefix="dateparser-tw")
+        self.queue: asyncio.Queue = None
+        self.connections = set()
+        self.started = time.time()
+        self.counters = {
+            "connections": 0,
+            "requests": 0,
+            "errors": 0,
+            "batches": 0,
+            "max_batch_size": 0,
+        }
+
+    @property
+    def stats(self) -> dict:
+        batches = self.counters["batches"]
+        return {
+            **self.counters,
+            "mean_batch_size": self.counters["requests"] / batches if batches else 0.0,
+            "uptime_s": time.time() - self.started,
+        }
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        self._start_batcher()
+        return await asyncio.start_unix_server(self._handle, path=path)
+
+    async def start_tcp(
+        self, host: str = "127.0.0.1", port: int = 8765
+    ) -> asyncio.AbstractServer:
+        self._start_batcher()
+        return await asyncio.start_server(self._handle, host=host, port=port)
+
+    async def close(self):
+        if self.queue is not None:
+            self._batcher.cancel()
+        for task in self.connections:
+            task.cancel()
+        self.executor.shutdown(wait=False)
+
+    def _start_batcher(self):
+        if self.queue is None:
+            self.queue = asyncio.Queue()
+            self._batcher = asyncio.get_running_loop().create_task(self._batch_loop())
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.counters["connections"] += 1
+        self.connections.add(asyncio.current_task())
+        outbox: asyncio.Queue = asyncio.Queue()
+        pending = asyncio.Semaphore(self.max_pending)
+        writing = asyncio.get_running_loop().create_task(
+            self._write_loop(writer, outbox, pending)
+        )
+        try:
+            while True:
+                request = await read_frame(reader)
+                await pending.acquire()
+                if (error := validate(request)) is not None:
+                    self.counters["errors"] += 1
+                    request_id = (
+                        request.get("id") if isinstance(request, dict) else None
+                    )
+                    outbox.put_nowait(
+                        {"id": request_id, "error": f"ValueError: {error}"}
+                    )
+                elif request.get("op") == "stats":
+                    outbox.put_nowait({"id": request.get("id"), **self.stats})
+                else:
+                    await self.queue.put((request, outbox))
+        except asyncio.IncompleteReadError:
+            pass
+        except (ValueError, ConnectionError) as e:
+            logger.warning(f"Closing connection: {e!r}")
+        finally:
+            self.connections.discard(asyncio.current_task())
+            writing.cancel()
+            writer.close()
+
+    async def _write_loop(
+        self,
+        writer: asyncio.StreamWriter,
+        outbox: asyncio.Queue,
+        pending: asyncio.Semaphore,
+    ):
+        try:
+            while True:
+                responses = [await outbox.get()]
+                while not outbox.empty():
+                    responses.append(outbox.get_nowait())
+                writer.write(b"".join(map(encode_frame, responses)))
+                await writer.drain()
+                for _ in responses:
+                    pending.release()
+        except ConnectionError:
+            pass
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            await asyncio.sleep(0)  # let pending reads enqueue their requests
+            while len(batch) < self.max_batch and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            # only wait for more when requests are coming in concurrently, a lone
+            # request is parsed right away
+            deadline = loop.time() + (self.batch_window if len(batch) > 1 else 0)
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            responses = await loop.run_in_executor(
+                self.executor, self._parse_batch, [request for request, _ in batch]
+            )
+
+            for (_, outbox), response in zip(batch, responses):
+                outbox.put_nowait(response)
+
+    def _parse_batch(self, requests: List[dict]) -> List[dict]:
+        self.counters["batches"] += 1
+        self.counters["requests"] += len(requests)
+        self.counters["max_batch_size"] = max(
+            self.counters["max_batch_size"], len(requests)
+        )
+
+        # one `parse_batch` per basetime, clients mostly send "now" (`None`)
+        groups = defaultdict(list)
+        for i, request in enumerate(requests):
+            groups[request.get("basetime")].append(i)
+
+        responses = [None] * len(requests)
+        for basetime, indices in groups.items():
+            try:
+                tps = self.parser.parse_batch(
+                    [requests[i]["text"] for i in indices], basetime
+                )
+            except Exception as e:  # eg. an invalid basetime
+                tps = [e] * len(indices)
+
+            for i, tp in zip(indices, tps):
+                if tp is None:
+                    tp = self._failure(requests[i]["text"], basetime)
+                if isinstance(tp, Exception):
+                    self.counters["errors"] += 1
+                    error = f"{type(tp).__name__}: {tp}"
+                    responses[i] = {"id": requests[i].get("id"), "error": error}
+                else:
+                    result = tp.model_dump(mode="json")
+                    responses[i] = {"id": requests[i].get("id"), "result": result}
+
+        return responses
+
+    def _failure(self, text: str, basetime) -> Exception:
+        """The error of a text `parse_batch` gave up on, for the response."""
+        try:
+            self.parser.parse(text, basetime)
+        except Exception as e:
+            return e
+        return ValueError("No time recognized")
+
+
+async def serve(args: argparse.Namespace):
+    server = ParseServer(batch_window=args.window_ms / 1000, max_batch=args.max_batch)
+    if args.unix:
+        listener = await server.start_unix(args.unix)
+        logger.info(f"Listening on {args.unix}")
+    else:
+        listener = await server.start_tcp(args.host, args.port)
+        logger.info(f"Listening on {args.host}:{args.port}")
+
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="dateparser-tw parsing daemon")
+    parser.add_argument("--unix", help="unix socket path, instead of TCP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--window-ms", type=float, default=2.0)
+    parser.add_argument("--max-batch", type=int, default=256)
+
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""SQLite functions parsing time expressions inside queries.
+
+    connection = sqlite3.connect("tickets.db")
+    register(connection)
+    connection.execute(
+        "UPDATE tickets SET due = tw_epoch_start(body, created_at) WHERE due IS NULL"
+    )
+
+Every function takes the text and the basetime (text accepted by `arrow.get`,
+or epoch seconds), gives `NULL` when either is `NULL` or when nothing can be
+parsed, and is registered as deterministic so SQLite can use it in indexes and
+skip repeated calls. Results are cached per connection by `(text, basetime)`,
+so the four functions share a single parse of a row, and repeated values in a
+column are parsed once.
+
+- `tw_parse(text, basetime)`: the formatted result, ISO 8601 by default
+- `tw_epoch_start(text, basetime)`, `tw_epoch_end(text, basetime)`: the
+  `[start, end)` epoch seconds of the interval the result stands for
+- `tw_granularity(text, basetime)`: eg. `date` or `datetime`
+"""
+
+import sqlite3
+from functools import lru_cache
+from typing import Optional, Union
+
+from loguru import logger
+
+from .bounds import clock_bounds, get_clock
+from .dataclasses import TimePoint
+from .formatting import format_with, get_formatters
+from .normalizer import DateParser
+
+Basetime = Union[str, int, float]
+
+
+class ParserFunctions:
+    """The functions registered on one connection, with their result cache."""
+
+    def __init__(
+        self, tz: str = "Asia/Taipei", style: str = "iso", cache_size: int = 65536
+    ):
+        self.parser = DateParser(tz)
+        self.clock = get_clock(tz)
+        self.formatters = get_formatters(style)
+        self.result = lru_cache(maxsize=cache_size)(self._parse)
+
+    def _parse(self, text: str, basetime: Basetime) -> Optional[TimePoint]:
+        try:
+            tp = self.parser.parse(text, basetime)
+        except (ValueError, KeyError, IndexError) as e:
+            logger.debug(f"Failed to parse {text}: {e!r}")
+            return None
+        return tp if tp.year is not None else None
+
+    def tw_parse(self, text: str, basetime: Basetime) -> Optional[str]:
+        if text is None or basetime is None:
+            return None
+        tp = self.result(text, basetime)
+        return None if tp is None else format_with(tp, *self.formatters)
+
+    def tw_epoch_start(self, text: str, basetime: Basetime) -> Optional[int]:
+        if text is None or basetime is None:
+            return None
+        tp = self.result(text, basetime)
+        return None if tp is None else clock_bounds(tp, self.clock)[0]
+
+    def tw_epoch_end(self, text: str, basetime: Basetime) -> Optional[int]:
+        if text is None or basetime is None:
+            return None
+        tp = self.result(text, basetime)
+        return None if tp is None else clock_bounds(tp, self.clock)[1]
+
+    def tw_granularity(self, text: str, basetime: Basetime) -> Optional[str]:
+        if text is None or basetime is None:
+            return None
+        tp = self.result(text, basetime)
+        return None if tp is None else tp.granularity.value
+
+
+FUNCTIONS = ("tw_parse", "tw_epoch_start", "tw_epoch_end", "tw_granularity")
+
+
+def register(
+    connection: sqlite3.Connection,
+    tz: str = "Asia/Taipei",
+    style: str = "iso",
+    cache_size: int = 65536,
+) -> ParserFunctions:
+    """Register the `tw_*` functions on `connection`, `style` being `iso` or
+    `zh` for `tw_parse`. Returns the functions, eg. to inspect
+    `functions.result.cache_info()`."""
+    functions = ParserFunctions(tz, style, cache_size)
+    for name in FUNCTIONS:
+        connection.create_function(
+            name, 2, getattr(functions, name), deterministic=True
+        )
+    return functions
@@ -1,8 +1,24 @@
+import os
+
 import pytest
 
 from dateparser_tw import DateParser
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--differential-budget",
+        type=float,
+        default=float(os.environ.get("DATEPARSER_TW_DIFFERENTIAL_BUDGET", 2.0)),
+        help="seconds spent on random cases per engine in test_differential.py",
+    )
+
+
 @pytest.fixture(scope="session", autouse=True)
 def parser():
     return DateParser()
+
+
+@pytest.fixture(scope="session")
+def differential_budget(request):
+    return request.config.getoption("--differential-budget")
@@ -0,0 +1,134 @@
+import platform
+import sys
+import tracemalloc
+
+import pytest
+
+from dateparser_tw import metrics
+from dateparser_tw.allocations import format_profile, profile_allocations
+from dateparser_tw.metrics import MetricsRegistry
+from dateparser_tw.parser import Parser
+
+BASETIME = "2024-07-15 10:00:00"
+
+# every path of the pipeline: phrase table, numeric fast path, handlers, the
+# stages of `Parser`, several spans and no time at all
+CORPUS = [
+    "明天",
+    "下週五晚上",
+    "2024-07-15T14:30:00",
+    "2024/7/15",
+    "上週五下午三點",
+    "下個月3號晚上8點半",
+    "三天後",
+    "2個半月前",
+    "2024年5月3日下午3點",
+    "週六3點到5點",
+    "我們約明天晚上七點在台北車站見面",
+    "沒有時間",
+]
+
+# allocation sizes change between interpreters, so the budgets are only held
+# on the one they were measured with
+CALIBRATED = ("CPython", (3, 11))
+calibrated = pytest.mark.skipif(
+    (platform.python_implementation(), sys.version_info[:2]) != CALIBRATED,
+    reason="allocation budgets are calibrated for CPython 3.11",
+)
+
+# peak bytes per stage, about 1.5x what CPython 3.11 allocates on the corpus;
+# lower a budget when a stage gets leaner, raise it only for a reason
+BUDGETS = {
+    "basetime": 9_500,
+    "phrase": 3_500,
+    "numeric": 6_500,
+    "sanitize": 3_500,
+    "extract": 90_000,  # the match state of `re` over the alternatives of PATTERN
+    "handler": 5_000,
+    # the first stage a handler runs also builds its `Parser`
+    "norm_absolute_date": 12_000,
+    "norm_absolute_time": 8_000,
+    "norm_hour_notation": 2_000,
+    "norm_relative_expression": 3_500,
+    "norm_prep_related": 8_000,
+    "resolution": 1_000,
+    "total": 90_000,
+}
+# bytes still allocated after a whole parse
+RETAINED_BUDGET = 2_000
+
+
+@pytest.fixture(scope="module")
+def profiles():
+    return {text: profile_allocations(text, BASETIME) for text in CORPUS}
+
+
+@calibrated
+@pytest.mark.parametrize("text", CORPUS)
+def test_stage_budgets(profiles, text):
+    profile = profiles[text]
+    over = {
+        stage: allocations.peak
+        for stage, allocations in [*profile.stages.items(), ("total", profile.total)]
+        if allocations.peak > BUDGETS[stage]
+    }
+    assert not over, format_profile(profile)
+
+
+@calibrated
+@pytest.mark.parametrize("text", CORPUS)
+def test_retained_budget(profiles, text):
+    assert profiles[text].total.retained <= RETAINED_BUDGET
+
+
+def test_result_agrees_with_parser(parser, profiles):
+    for text, profile in profiles.items():
+        try:
+            expected = parser.parse(text, BASETIME)
+        except (IndexError, ValueError, KeyError):
+            expected = None
+        assert profile.result == expected, text
+
+
+def test_stages(profiles):
+    assert list(profiles["明天"].stages) == ["basetime", "phrase"]
+    assert list(profiles["2024/7/15"].stages) == ["basetime", "phrase", "numeric"]
+
+    stages = profiles["下個月3號晚上8點半"].stages
+    assert {stage.__name__ for stage in Parser.STAGES} <= set(stages)
+    assert stages["norm_absolute_date"].calls == 1
+    assert stages["resolution"].calls == 1
+
+    assert stages["extract"].peak > stages["sanitize"].peak > 0
+
+
+def test_options(parser):
+    profile = profile_allocations(
+        "明天下午三點", BASETIME, max_granularity="date", cache_size=16
+    )
+    # warmed up, the result comes from the cache
+    assert list(profile.stages) == ["cache"]
+    assert profile.result == parser.parse("明天下午三點", BASETIME, "date")
+
+
+def test_metrics_left_as_they_were():
+    registry = metrics.enable(MetricsRegistry())
+    try:
+        profile_allocations("明天", BASETIME)
+        assert metrics.enabled and metrics.get_registry() is registry
+    finally:
+        metrics.disable()
+    profile_allocations("明天", BASETIME)
+    assert not metrics.enabled
+
+
+def test_tracing_left_as_it_was():
+    profile_allocations("明天", BASETIME, warm_up=False)
+    assert not tracemalloc.is_tracing()
+
+    tracemalloc.start()
+    try:
+        profile_allocations("明天", BASETIME, warm_up=False)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,72 @@
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from dateparser_tw import handlers, parser
+from dateparser_tw.backend import ENV, compile_pattern, load_engine
+from dateparser_tw.helpers.corpus import generate_corpus
+from dateparser_tw.normalizer import extract_span_positions, sanitize_date
+from dateparser_tw.resource.pattern import PATTERN
+
+CORPUS = [sanitize_date(message) for message in generate_corpus(300, seed=3)]
+
+
+def rules():
+    patterns = {
+        name: value for name, value in vars(parser).items() if name.startswith("RE_")
+    }
+    patterns.update(
+        {f"PREP_RULES[{key}]": value for key, value in parser.PREP_RULES.items()}
+    )
+    patterns["RE_SHAPE"] = handlers.RE_SHAPE
+    return {name: value.pattern for name, value in patterns.items()}
+
+
+@pytest.fixture(params=["regex", "re2"])
+def engine(request):
+    return pytest.importorskip(request.param)
+
+
+def test_same_spans(engine):
+    reference = re.compile(PATTERN.pattern)
+    pattern = compile_pattern(PATTERN.pattern, module=engine)
+    for text in CORPUS:
+        assert extract_span_positions(text, pattern) == extract_span_positions(
+            text, reference
+        )
+
+
+def test_same_rule_matches(engine):
+    spans = [
+        text[start:end]
+        for text in CORPUS
+        for start, end in extract_span_positions(text, PATTERN)
+    ]
+    for name, source in rules().items():
+        reference, pattern = re.compile(source), compile_pattern(source, module=engine)
+        for span in spans:
+            expected, match = reference.search(span), pattern.search(span)
+            if expected is None:
+                assert match is None, (name, span)
+            else:
+                assert match.span() == expected.span(), (name, span)
+                assert match.groupdict() == expected.groupdict(), (name, span)
+
+
+def test_load_engine(monkeypatch):
+    assert load_engine("re") is re
+    assert load_engine("no_such_engine") is re
+
+    monkeypatch.setenv(ENV, "re")
+    assert load_engine() is re
+
+
+def test_falls_back_to_re():
+    def compile(pattern, flags=0):
+        raise ValueError("unsupported")
+
+    broken = SimpleNamespace(__name__="broken", compile=compile)
+    pattern = compile_pattern(r"(?<!工作)天", module=broken)
+    assert isinstance(pattern, re.Pattern)
+    assert pattern.search("3天後") and not pattern.search("工作天")
@@ -0,0 +1,106 @@
+import pytest
+
+from dateparser_tw import binary
+from dateparser_tw.binary import SIZE, decode, decode_batch, encode, encode_batch
+from dateparser_tw.dataclasses import TimePoint
+from dateparser_tw.dataclasses.timepoint import Granularity
+from dateparser_tw.parser import RE_AM, RE_PM
+from dateparser_tw.phrasegen import vocabulary
+
+from .test_handlers import BASETIMES, PHRASES
+
+
+@pytest.mark.parametrize("basetime", BASETIMES)
+def test_round_trip(parser, basetime):
+    tps = []
+    for text in PHRASES:
+        try:
+            tps.append(parser.parse(text, basetime))
+        except (ValueError, KeyError, IndexError):
+            tps.append(None)
+    for tp in tps:
+        data = encode(tp)
+        assert len(data) == SIZE
+        assert decode(data) == tp
+
+    data = encode_batch(tps)
+    assert len(data) == SIZE * len(tps)
+    assert decode_batch(data) == tps
+    assert decode_batch(memoryview(data)) == tps
+
+
+@pytest.mark.parametrize(
+    "tp",
+    [
+        TimePoint(),
+        TimePoint(year=2024, month=2, day=29, hour=0, minute=0, second=0),
+        TimePoint(period_of_day="晚上", granularity=Granularity.DateWithPeriod),
+        TimePoint(year=-1, month=12, day=31, hour=23, minute=59, second=59),
+        None,
+    ],
+)
+def test_round_trip_edges(tp):
+    assert decode(encode(tp)) == tp
+
+
+def test_periods_are_fixed():
+    # new words go at the end, any other change needs a new `binary.VERSION`
+    assert binary.PERIODS == (
+        "凌晨",
+        "清晨",
+        "早上",
+        "早晨",
+        "早間",
+        "晨間",
+        "今早",
+        "上午",
+        "白天",
+        "am",
+        "AM",
+        "a.m.",
+        "a.m",
+        "A.M.",
+        "A.M",
+        "下午",
+        "中午",
+        "午後",
+        "晚上",
+        "夜間",
+        "夜裡",
+        "今晚",
+        "pm",
+        "PM",
+        "p.m.",
+        "p.m",
+        "P.M.",
+        "P.M",
+    )
+    assert len(binary.PERIODS) == len(set(binary.PERIODS))
+
+
+def test_periods_cover_parser():
+    assert set(vocabulary(RE_AM, RE_PM)) <= set(binary.PERIODS)
+
+
+@pytest.mark.parametrize(
+    "tp",
+    [
+        TimePoint(year=2024, period_of_day="黃昏"),
+        TimePoint(year=40000),
+        TimePoint(month=300),
+    ],
+)
+def test_unencodable(tp):
+    with pytest.raises(ValueError):
+        encode(tp)
+
+
+def test_rejects_other_versions_and_sizes():
+    data = bytearray(encode(TimePoint(year=2024)))
+    data[0] = binary.VERSION + 1
+    with pytest.raises(ValueError, match="version"):
+        decode(data)
+    with pytest.raises(ValueError):
+        decode(b"\x01" * (SIZE - 1))
+    with pytest.raises(ValueError):
+        decode_batch(b"\x01" * (SIZE + 1))
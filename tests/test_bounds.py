@@ -0,0 +1,72 @@
+import itertools
+
+import arrow
+import pytest
+
+from dateparser_tw.bounds import epoch_bounds, epoch_bounds_batch
+from dateparser_tw.dataclasses import TimePoint
+
+BASETIME = "2024-07-15 09:00:00"
+
+
+def local(text: str, tz: str = "Asia/Taipei") -> int:
+    return arrow.get(text, tzinfo=tz).int_timestamp
+
+
+@pytest.mark.parametrize(
+    "target, start, end",
+    [
+        ("2024年", "2024-01-01", "2025-01-01"),
+        ("12月", "2024-12-01", "2025-01-01"),
+        ("2月", "2024-02-01", "2024-03-01"),
+        ("明天", "2024-07-16", "2024-07-17"),
+        ("明天晚上", "2024-07-16 18:00", "2024-07-17"),
+        ("今晚", "2024-07-15 18:00", "2024-07-16"),
+        ("今天凌晨", "2024-07-15 00:00", "2024-07-15 06:00"),
+        ("下午3點", "2024-07-15 15:00", "2024-07-15 16:00"),
+        ("下午3點半", "2024-07-15 15:30", "2024-07-15 15:31"),
+        ("12點12分57秒", "2024-07-15 12:12:57", "2024-07-15 12:12:58"),
+    ],
+)
+def test_parse_bounds(parser, target, start, end):
+    assert parser.parse_bounds(target, BASETIME) == (local(start), local(end))
+
+
+def test_parse_bounds_batch(parser):
+    starts, ends = parser.parse_bounds_batch(
+        ["明天", "沒有時間", "晚上", "大前天"], BASETIME
+    )
+
+    assert starts.typecode == ends.typecode == "q"
+    assert list(starts) == [local("2024-07-16"), 0, local("2024-07-15 18:00"), 0]
+    assert list(ends) == [local("2024-07-17"), 0, local("2024-07-16"), 0]
+
+
+@pytest.mark.parametrize("tz", ["America/New_York", "Europe/London", "UTC"])
+def test_transitions(tz):
+    # every hour of the days around the DST changes of 2024
+    days = ["2024-03-10", "2024-03-31", "2024-11-03", "2024-10-27"]
+    tps = [
+        TimePoint(
+            year=2024,
+            month=int(day[5:7]),
+            day=int(day[8:]),
+            hour=hour,
+            minute=30,
+            second=0,
+            granularity="datetime",
+        )
+        for day, hour in itertools.product(days, range(24))
+    ]
+
+    starts, _ = epoch_bounds_batch(tps, tz)
+    expected = [
+        arrow.Arrow(tp.year, tp.month, tp.day, tp.hour, tp.minute, tzinfo=tz)
+        for tp in tps
+    ]
+    assert list(starts) == [moment.int_timestamp for moment in expected]
+
+
+def test_requires_year():
+    with pytest.raises(ValueError):
+        epoch_bounds(TimePoint(month=1, day=1, period_of_day="晚上"))
@@ -0,0 +1,182 @@
+import datetime
+
+import arrow
+import pytest
+from loguru import logger
+
+from dateparser_tw.business_day import BusinessCalendar, load_calendar
+
+# weekdays off and weekend workdays of the DGPA calendars
+EXCEPTIONS = {
+    2024: {
+        "off": [
+            "01-01",
+            "02-08",
+            "02-09",
+            "02-12",
+            "02-13",
+            "02-14",
+            "02-28",
+            "04-04",
+            "04-05",
+            "06-10",
+            "09-17",
+            "10-10",
+        ],
+        "work": ["02-17"],
+    },
+    2025: {
+        "off": [
+            "01-01",
+            "01-27",
+            "01-28",
+            "01-29",
+            "01-30",
+            "01-31",
+            "02-28",
+            "04-03",
+            "04-04",
+            "05-30",
+            "09-29",
+            "10-06",
+            "10-10",
+            "10-24",
+            "12-25",
+        ],
+        "work": ["02-08"],
+    },
+    2026: {
+        "off": [
+            "01-01",
+            "02-16",
+            "02-17",
+            "02-18",
+            "02-19",
+            "02-20",
+            "02-27",
+            "04-03",
+            "04-06",
+            "05-01",
+            "06-19",
+            "09-25",
+            "09-28",
+            "10-09",
+            "10-26",
+            "12-25",
+        ],
+        "work": [],
+    },
+}
+
+
+def date(text: str) -> datetime.date:
+    return datetime.date.fromisoformat(text)
+
+
+@pytest.fixture(scope="module")
+def calendar():
+    return load_calendar()
+
+
+@pytest.mark.parametrize("year", EXCEPTIONS)
+def test_calendar(calendar, year):
+    off, work = [], []
+    day = datetime.date(year, 1, 1)
+    while day.year == year:
+        weekend = day.weekday() >= 5
+        if not weekend and not calendar.is_business_day(day):
+            off.append(day.strftime("%m-%d"))
+        if weekend and calendar.is_business_day(day):
+            work.append(day.strftime("%m-%d"))
+        day += datetime.timedelta(days=1)
+
+    assert {"off": off, "work": work} == EXCEPTIONS[year]
+
+
+@pytest.mark.parametrize(
+    "day, n, expected",
+    [
+        ("2024-02-07", 1, "2024-02-15"),
+        ("2024-02-07", 3, "2024-02-17"),
+        ("2024-02-15", -1, "2024-02-07"),
+        ("2024-02-10", 0, "2024-02-10"),
+        ("2024-12-31", 1, "2025-01-02"),
+        ("2025-01-02", -1, "2024-12-31"),
+    ],
+)
+def test_shift(calendar, day, n, expected):
+    assert calendar.shift(date(day), n) == date(expected)
+
+
+def test_count(calendar):
+    assert calendar.count(date("2024-02-05"), date("2024-02-19")) == 6
+    assert calendar.count(date("2024-01-01"), date("2025-01-01")) == 251
+
+
+def test_substitute_skips_holidays(calendar):
+    # 兒童節 on Sunday 2027/4/4 and 清明 on Monday 4/5
+    assert not calendar.is_business_day(date("2027-04-05"))
+    assert not calendar.is_business_day(date("2027-04-06"))
+    assert calendar.is_business_day(date("2027-04-07"))
+
+
+def test_out_of_range(calendar):
+    # weekends only, across the ends of the calendar too
+    assert calendar.is_business_day(date("2023-12-29"))
+    assert not calendar.is_business_day(date("2023-12-31"))
+    assert calendar.is_business_day(date("2028-01-03"))
+    assert calendar.shift(date("2027-12-30"), 2) == date("2028-01-03")
+    assert calendar.shift(date("2024-01-02"), -2) == date("2023-12-28")
+    assert calendar.shift(date("2023-12-29"), 1) == date("2024-01-02")
+    assert calendar.count(date("2023-12-25"), date("2024-01-08")) == 9
+
+
+def test_out_of_range_is_not_logged_to_stdout(calendar):
+    messages = []
+    sink = logger.add(messages.append, level="INFO")
+    try:
+        calendar.is_business_day(date("2040-06-01"))
+    finally:
+        logger.remove(sink)
+    assert messages == []
+
+
+def test_from_file(tmp_path):
+    path = tmp_path / "calendar.json"
+    path.write_text(
+        '{"solar": {"元旦": {"date": "01-01", "since": 1912}}, "lunar": ["春節"],'
+        ' "years": {"2030": {"lunar_months": {"1": "02-03"}, "qingming": "04-05",'
+        ' "adjusted": [], "makeup": []}}}',
+        encoding="utf-8",
+    )
+    calendar = BusinessCalendar.from_file(path)
+
+    # 除夕 on Saturday 2/2 to 初3 on 2/5, the weekend is made up on 2/6 and 2/7
+    assert [
+        calendar.is_business_day(datetime.date(2030, 2, day)) for day in range(1, 9)
+    ] == [True, False, False, False, False, False, False, True]
+
+
+@pytest.mark.parametrize(
+    "target, expected",
+    [
+        ("3個工作日後", "2024年02月17日"),
+        ("三個工作天後", "2024年02月17日"),
+        ("10個工作日後", "2024年02月27日"),
+        ("2個工作日前交件", "2024年02月05日"),
+        ("下個工作日", "2024年02月15日"),
+        ("下下個工作日", "2024年02月16日"),
+        ("上個工作日", "2024年02月06日"),
+    ],
+)
+def test_parse(parser, target, expected):
+    tp = parser.parse(target, basetime=arrow.get("2024-02-07 10:00:00"))
+    assert str(tp) == expected
+
+
+@pytest.mark.parametrize("target", ["下個工作日", "3個工作日後", "上個工作日"])
+def test_parse_now(parser, target):
+    tp = parser.parse(target)
+    day = datetime.date(tp.year, tp.month, tp.day)
+    assert day != arrow.now("Asia/Taipei").date()
+    assert load_calendar().is_business_day(day)
@@ -0,0 +1,111 @@
+import arrow
+import pytest
+
+from dateparser_tw import DateParser, metrics
+from dateparser_tw.cache import ResultCache, resolves_by_date
+from dateparser_tw.metrics import MetricsRegistry
+
+from .test_handlers import PHRASES
+
+TEXTS = [
+    *PHRASES,
+    "明天下午三點開會",
+    "3天半後",
+    "凌晨12點半",
+    "2024-07-15T10:30",
+    "14:30",
+]
+BASETIMES = [
+    "2024-07-15 10:00:00",
+    "2024-07-15 15:30:20",
+    "2024-07-15 23:59:59",
+    "2024-07-16 00:00:00",
+    "2024-07-16 09:15:00",
+]
+
+
+def outcome(parser, text, basetime):
+    try:
+        return parser.parse(text, basetime)
+    except Exception as e:
+        return type(e)
+
+
+@pytest.fixture
+def cached():
+    return DateParser(cache_size=1024)
+
+
+def test_same_as_uncached(parser, cached):
+    for basetime in BASETIMES:
+        for _ in range(2):
+            for text in TEXTS:
+                assert outcome(cached, text, basetime) == outcome(
+                    parser, text, basetime
+                )
+
+
+def test_date_only_results_are_shared_within_a_day(cached):
+    registry = metrics.enable(MetricsRegistry())
+    try:
+        for basetime in BASETIMES[:3]:
+            assert str(cached.parse("明天下午三點", basetime)) == "2024年07月16日15點"
+    finally:
+        metrics.disable()
+
+    assert registry.counter("cache_total", result="hit").value == 2
+    assert len(cached.cache) == 1
+
+
+def test_time_dependent_results_are_keyed_by_time(cached):
+    assert str(cached.parse("3天半後", "2024-07-15 10:00:00")) == "2024年07月18日22點"
+    assert str(cached.parse("3天半後", "2024-07-15 15:00:00")) == "2024年07月19日03點"
+    assert len(cached.cache) == 2
+
+
+def test_cleared_on_another_day(cached):
+    cached.parse("明天", "2024-07-15 10:00:00")
+    cached.parse("下週一", "2024-07-15 10:00:00")
+    assert str(cached.parse("明天", "2024-07-16 00:00:01")) == "2024年07月17日"
+    assert len(cached.cache) == 1
+    assert cached.cache.day == arrow.get("2024-07-16").date()
+
+
+def test_returns_copies(cached):
+    tp = cached.parse("明天", "2024-07-15 10:00:00")
+    tp.day = 1
+    assert cached.parse("明天", "2024-07-15 11:00:00").day == 16
+
+
+def test_max_granularity_truncates_the_cached_result(cached):
+    basetime = "2024-07-15 10:00:00"
+    assert str(cached.parse("明天下午三點", basetime, max_granularity="date")) == (
+        "2024年07月16日"
+    )
+    assert str(cached.parse("明天下午三點", basetime)) == "2024年07月16日15點"
+
+
+@pytest.mark.parametrize(
+    "span, expected",
+    [
+        ("明天", True),
+        ("今晚", True),
+        ("下午3點", True),
+        ("3天後", True),
+        ("2個月後", True),
+        ("3天半後", False),
+        ("3小時後", False),
+        ("5分鐘後", False),
+        ("30分", False),
+    ],
+)
+def test_resolves_by_date(span, expected):
+    assert resolves_by_date(span) is expected
+
+
+def test_lru_eviction():
+    cache = ResultCache(maxsize=2)
+    cache.roll(arrow.get("2024-07-15").date())
+    for key in "abc":
+        cache.put(key, key)
+    assert len(cache) == 2 and cache.get("a") is None
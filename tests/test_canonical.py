@@ -0,0 +1,59 @@
+import pytest
+
+from dateparser_tw.helpers.str_common import CANONICAL_TABLE, canonicalize
+from dateparser_tw.normalizer import (
+    extract_spans,
+    sanitize_date,
+    sanitize_date_with_offsets,
+)
+from dateparser_tw.resource.pattern import PATTERN
+from dateparser_tw.resource.variants import CANONICAL
+
+BASETIME = "2024-07-15 09:00:00"  # Monday
+
+
+@pytest.mark.parametrize(
+    "target, canonical",
+    [
+        ("明天下午３：３０", "明天下午3:30"),
+        ("下周一", "下週一"),
+        ("国庆节", "國慶節"),
+        ("两个礼拜后", "兩個禮拜後"),
+        ("夜裏", "夜裡"),
+        ("２０２４／７／１５", "2024/7/15"),
+    ],
+)
+def test_canonicalize(target, canonical):
+    assert canonicalize(target) == canonical
+
+
+@pytest.mark.parametrize(
+    "variant, canonical",
+    [
+        ("明天下午３：３０", "明天下午3:30"),
+        ("下周一", "下週一"),
+        ("两个礼拜后", "兩個禮拜後"),
+        ("明天晚上８点", "明天晚上8點"),
+        ("明年国庆节", "明年國慶節"),
+    ],
+)
+def test_variants_parse_as_canonical(parser, variant, canonical):
+    assert parser.parse(variant, BASETIME) == parser.parse(canonical, BASETIME)
+
+
+@pytest.mark.parametrize("variant, span", [("国庆节", "國慶節"), ("圣诞节", "聖誕節")])
+def test_variants_extract_as_canonical(variant, span):
+    assert extract_spans(sanitize_date(variant), PATTERN) == [span]
+
+
+def test_table_is_one_to_one():
+    # a single character each way keeps the offsets of `sanitize_date_with_offsets`
+    assert all(len(k) == 1 and len(v) == 1 for k, v in CANONICAL.items())
+    assert all(ord(k) in CANONICAL_TABLE for k in CANONICAL)
+
+
+def test_offsets_of_variants():
+    text = "我们下周三下午３点见"
+    sanitized, starts, ends = sanitize_date_with_offsets(text)
+    position = sanitized.index("下週3")
+    assert text[starts[position] : ends[position + 2]] == "下周三"
@@ -0,0 +1,26 @@
+import random
+
+import pytest
+
+from dateparser_tw import DateParser
+from dateparser_tw.helpers.corpus import chinese_number, date_phrase, generate_corpus
+from dateparser_tw.helpers.str_common import cn2an
+
+
+@pytest.mark.parametrize("n", [1, 9, 10, 11, 20, 23, 99])
+def test_chinese_number(n):
+    assert cn2an(chinese_number(n)) == n
+
+
+def test_generate_corpus():
+    corpus = generate_corpus(50, length=60, density=0.5, seed=1)
+
+    assert corpus == generate_corpus(50, length=60, density=0.5, seed=1)
+    assert all(len(message) >= 60 for message in corpus)
+
+
+def test_date_phrases_parse():
+    parser = DateParser()
+    rng = random.Random(0)
+    for _ in range(500):
+        parser.parse(date_phrase(rng), "2024-07-15 10:00:00")
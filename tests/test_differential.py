@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from dateparser_tw import DateParser
+from dateparser_tw.differential import (
+    Case,
+    differential,
+    disagree,
+    outcome,
+    random_basetime,
+    reference_engine,
+    shrink,
+)
+from dateparser_tw.numeric import parse_numeric
+
+ENGINES = {
+    "parse": lambda text, basetime: DateParser().parse(text, basetime),
+    "projected": lambda text, basetime: DateParser().parse(
+        text, basetime, max_granularity="datetime"
+    ),
+}
+
+
+@pytest.mark.parametrize("name", ENGINES)
+def test_matches_reference(name, differential_budget):
+    mismatches = differential(ENGINES[name], budget=differential_budget)
+    assert mismatches == []
+
+
+def broken(text, basetime):
+    tp = reference_engine(text, basetime)
+    if tp.hour == 15:
+        tp.hour = 3
+    return tp
+
+
+def test_finds_and_shrinks():
+    mismatches = differential(broken, budget=5.0, max_cases=300)
+    assert mismatches
+    for mismatch in mismatches:
+        assert len(mismatch.text) <= 4  # eg. `下午3點`
+        assert mismatch.basetime.time().isoformat() == "00:00:00"
+
+
+def test_shrink():
+    case = Case("記得明天下午三點開會", random_basetime(random.Random(0)))
+    mismatch = shrink(
+        broken, reference_engine, disagree(broken, reference_engine, case)
+    )
+
+    assert mismatch.text == "下午三點"
+    assert (mismatch.expected.hour, mismatch.actual.hour) == (15, 3)
+
+
+@pytest.mark.parametrize("text", ["14:30", "2024-07-15T14:30", "2024/7/15下午3點"])
+def test_fast_path_difference(text):
+    case = Case(f"會議 {text}", random_basetime(random.Random(0)))
+
+    assert outcome(reference_engine, case) != outcome(ENGINES["parse"], case)
+    assert disagree(ENGINES["parse"], reference_engine, case) is None
+
+
+def broken_numeric(text, basetime):
+    tp = DateParser().parse(text, basetime)
+    if parse_numeric(text, basetime) is not None:
+        tp.day = 1
+    return tp
+
+
+def test_finds_numeric_fast_path_bugs():
+    mismatches = differential(broken_numeric, budget=5.0, max_cases=300)
+    assert mismatches
+    assert all(parse_numeric(m.text, m.basetime) for m in mismatches)
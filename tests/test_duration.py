@@ -0,0 +1,55 @@
+import pytest
+
+from dateparser_tw.duration import Duration, parse_duration, parse_duration_batch
+
+DAY = 86400
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("三個半小時", (0, 3 * 3600 + 1800)),
+        ("兩週", (0, 14 * DAY)),
+        ("一年半", (18, 0)),
+        ("半年", (6, 0)),
+        ("3個月", (3, 0)),
+        ("兩個半月", (2, 15 * DAY)),
+        ("半個月", (0, 15 * DAY)),
+        ("半小時", (0, 1800)),
+        ("半天", (0, 12 * 3600)),
+        ("十五分鐘", (0, 900)),
+        ("1小時30分鐘", (0, 5400)),
+        ("兩天三小時", (0, 2 * DAY + 3 * 3600)),
+        ("三個禮拜", (0, 21 * DAY)),
+        ("一個半星期", (0, 10 * DAY + 12 * 3600)),
+        ("2 個鐘頭", (0, 7200)),
+        ("1.5小時", (0, 5400)),
+        ("0.25年", (3, 0)),
+        ("2年3個月", (27, 0)),
+        ("處理了四十五秒鐘", (0, 45)),
+        ("兩个小时", (0, 7200)),
+    ],
+)
+def test_parse_duration(parser, text, expected):
+    assert parse_duration(text) == expected
+    assert parser.parse_duration(text) == expected
+
+
+@pytest.mark.parametrize("text", ["沒有", "3月", "2024年", "下午"])
+def test_no_duration(text):
+    with pytest.raises(ValueError):
+        parse_duration(text)
+
+
+def test_is_exact():
+    assert Duration(0, 60).is_exact
+    assert not Duration(1, 0).is_exact
+
+
+def test_parse_duration_batch(parser):
+    months, seconds, found = parser.parse_duration_batch(["兩週", "沒有", "一年半"])
+    assert months.typecode == seconds.typecode == "q"
+    assert list(months) == [0, 0, 18]
+    assert list(seconds) == [14 * DAY, 0, 0]
+    assert list(found) == [1, 0, 1]
+    assert parse_duration_batch(["兩週", "沒有", "一年半"]) == (months, seconds, found)
@@ -0,0 +1,51 @@
+import arrow
+import pytest
+
+from dateparser_tw.dataclasses import TimePoint
+from dateparser_tw.formatting import format_batch, format_timepoint
+
+TARGETS = [
+    "2024年",
+    "2024年5月",
+    "5月12號",
+    "明天",
+    "明天晚上",
+    "下午3點",
+    "12點12分57秒",
+    "凌晨三點半",
+    "上週五",
+    "3個月後",
+]
+
+
+@pytest.mark.parametrize("target", TARGETS)
+def test_same_as_str(parser, target):
+    tp = parser.parse(target, basetime=arrow.get("2024-07-15 09:05:00"))
+    assert format_timepoint(tp) == str(tp)
+
+
+def test_minutes_only():
+    tp = TimePoint(year=2024, month=7, day=5, hour=9, minute=3, granularity="datetime")
+    assert format_timepoint(tp) == "2024年07月05日09點03分"
+    assert format_timepoint(tp, "iso") == "2024-07-05T09:03"
+
+
+@pytest.mark.parametrize(
+    "target, expected",
+    [
+        ("2024年", "2024"),
+        ("2024年5月", "2024-05"),
+        ("5月12號", "2024-05-12"),
+        ("明天晚上", "2024-07-16"),
+        ("下午3點", "2024-07-15T15"),
+        ("12點12分57秒", "2024-07-15T12:12:57"),
+    ],
+)
+def test_iso(parser, target, expected):
+    tp = parser.parse(target, basetime=arrow.get("2024-07-15 09:05:00"))
+    assert format_timepoint(tp, style="iso") == expected
+
+
+def test_batch(parser):
+    tps = parser.parse_batch(TARGETS + ["沒有時間"], basetime="2024-07-15")
+    assert format_batch(tps) == [str(tp) for tp in tps[:-1]] + [None]
@@ -0,0 +1,62 @@
+import itertools
+from pathlib import Path
+
+import arrow
+import pytest
+
+from dateparser_tw import codegen, handlers
+from dateparser_tw.parser import Parser
+
+RELATIVE_DAYS = ["前天", "大前天", "昨天", "今天", "本日", "明天", "明日", "隔天", "大後天"]
+RELATIVE_WEEKS = ["週", "上週", "下下週", "這週3", "本週7", "上個星期5", "下個禮拜1"]
+ABSOLUTE_DATES = ["2024年", "2024年5月", "5月", "5月12號", "12月31日", "2024年2月29日"]
+PERIODS = ["", "下午", "晚上", "凌晨", "早上", "中午", "今早"]
+CLOCKS = ["3點", "12點半", "7點5分", "23點59分59秒", "0點"]
+
+PHRASES = [
+    *RELATIVE_DAYS,
+    *RELATIVE_WEEKS,
+    *ABSOLUTE_DATES,
+    *[period for period in PERIODS if period],
+    *["上個月", "下下個月", "這個月", "本月", "去年", "明年", "大前年", "後年", "今年"],
+    *["3天前", "2個月後", "半年前", "3年半後", "2個半月前", "1週後", "3個星期前"],
+    *["5小時後", "半小時前", "30分鐘後", "10分前", "2個鐘頭後"],
+    *[
+        "".join(parts)
+        for prefix in (["", "今天", "大後天"], ["上週", "這週3"], ["2024年5月3日", "5月"])
+        for parts in itertools.product(prefix, PERIODS, CLOCKS)
+    ],
+]
+
+BASETIMES = [
+    "2024-01-01 00:00:00",
+    "2024-02-29 12:30:00",
+    "2023-12-31 23:59:59",
+    "2024-03-31 08:00:00",
+    "2025-01-31 18:45:10",
+]
+
+
+def outcome(func, *args):
+    try:
+        return func(*args)
+    except Exception as e:
+        return type(e)
+
+
+def test_generated_module_is_up_to_date():
+    assert Path(handlers.__file__).read_text(encoding="utf-8") == codegen.render()
+
+
+@pytest.mark.parametrize("phrase", PHRASES)
+def test_classified(phrase):
+    assert handlers.classify(phrase) is not None
+
+
+@pytest.mark.parametrize("basetime", BASETIMES)
+def test_matches_generic_pipeline(basetime):
+    basetime = arrow.get(basetime)
+    for phrase in PHRASES:
+        assert outcome(handlers.dispatch, phrase, basetime) == outcome(
+            Parser.parse, phrase, basetime
+        ), phrase
@@ -0,0 +1,94 @@
+import random
+
+import arrow
+import pytest
+
+from dateparser_tw.incremental import IncrementalExtractor
+from dateparser_tw.normalizer import (
+    extract_span_positions,
+    sanitize_date,
+    sanitize_date_with_offsets,
+)
+from dateparser_tw.resource.pattern import PATTERN
+
+FRAGMENTS = [
+    "我們",
+    "明天",
+    "下午三點",
+    "開會",
+    "的",
+    " ",
+    "二十",
+    "三號",
+    "上週五",
+    "兩年前",
+    "去年",
+    "七月",
+    "十五號",
+    "，然後",
+    "晚上",
+    "12點半",
+    "abc",
+    "隔天",
+    "5月",
+]
+
+
+def full_scan(text):
+    sanitized, starts, ends = sanitize_date_with_offsets(text)
+    return [
+        (starts[start], ends[end - 1], sanitized[start:end])
+        for start, end in extract_span_positions(sanitized, PATTERN)
+    ]
+
+
+@pytest.mark.parametrize(
+    "text", ["明天 下午 三點", "我的 二 十 三號", "兩年前的七月十五號", "abc"]
+)
+def test_sanitize_with_offsets(text):
+    sanitized, starts, ends = sanitize_date_with_offsets(text)
+    assert sanitized == sanitize_date(text)
+    assert len(starts) == len(ends) == len(sanitized)
+
+
+def test_typing(parser):
+    basetime = arrow.get("2024-07-15")
+    extractor = IncrementalExtractor(basetime=basetime)
+    for i, char in enumerate("我們明天下午三點開會"):
+        extractor.edit(i, 0, char)
+
+    assert [span.text for span in extractor.spans] == ["明天下午3點"]
+    assert extractor.results[0] == parser.parse("明天下午三點", basetime=basetime)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_edits(seed):
+    rng = random.Random(seed)
+    extractor = IncrementalExtractor(basetime="2024-07-15", window=8)
+
+    for _ in range(40):
+        text = extractor.text
+        offset = rng.randint(0, len(text))
+        deleted = (
+            rng.randint(0, min(3, len(text) - offset)) if rng.random() < 0.3 else 0
+        )
+        extractor.edit(offset, deleted, rng.choice(FRAGMENTS))
+
+        assert [span[:3] for span in extractor.spans] == full_scan(extractor.text)
+
+
+def test_unparsable_span():
+    extractor = IncrementalExtractor(basetime="2024-07-15")
+    for i, char in enumerate("大前天和明天"):
+        extractor.edit(i, 0, char)
+
+    assert [span.text for span in extractor.spans] == ["大前天", "明天"]
+    assert extractor.results[0] is None
+    assert extractor.results[1] is not None
+
+
+def test_numeric_span(parser):
+    basetime = arrow.get("2024-07-01")
+    extractor = IncrementalExtractor("會議 2024/7/15", basetime=basetime)
+    assert [span.text for span in extractor.spans] == ["2024/7/15"]
+    assert extractor.results == [parser.parse("會議 2024/7/15", basetime)]
@@ -0,0 +1,38 @@
+import pytest
+
+BASETIME = "2024-07-15 09:00:00"  # Monday
+
+
+@pytest.mark.parametrize(
+    "target, expected",
+    [
+        ("週六3點到5點", ["2024年07月20日03點 ~ 2024年07月20日05點"]),
+        ("明天下午3點到5點", ["2024年07月16日15點 ~ 2024年07月16日17點"]),
+        ("週六下午3點至晚上8點", ["2024年07月20日15點 ~ 2024年07月20日20點"]),
+        ("3點~5點", ["2024年07月15日03點 ~ 2024年07月15日05點"]),
+        ("7月1日至7月5日", ["2024年07月01日 ~ 2024年07月05日"]),
+        ("2024/7/1-2024/7/5", ["2024年07月01日 ~ 2024年07月05日"]),
+        ("14:00-16:00", ["2024年07月15日14點00分00秒 ~ 2024年07月15日16點00分00秒"]),
+        ("下週一到週三", ["2024年07月22日 ~ 2024年07月24日"]),
+        ("明天到後天", ["2024年07月16日 ~ 2024年07月17日"]),
+        ("3月到5月", ["2024年3月 ~ 2024年5月"]),
+        ("明天開會，3點出發", ["2024年07月16日", "2024年07月16日03點"]),
+        ("明天和後天", ["2024年07月16日", "2024年07月17日"]),
+        ("沒有時間", []),
+    ],
+)
+def test_parse_intervals(parser, target, expected):
+    assert [str(interval) for interval in parser.parse_intervals(target, BASETIME)] == (
+        expected
+    )
+
+
+def test_single_times_are_not_ranges(parser):
+    intervals = parser.parse_intervals("明天和後天", BASETIME)
+    assert not any(interval.is_range for interval in intervals)
+    assert intervals[0].start == parser.parse("明天", BASETIME)
+
+
+def test_first_time_matches_parse(parser):
+    (interval,) = parser.parse_intervals("明天下午3點到5點", BASETIME)
+    assert interval.start == parser.parse("明天下午3點", BASETIME)
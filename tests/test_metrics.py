@@ -0,0 +1,131 @@
+import sys
+import threading
+
+import arrow
+import pytest
+
+from dateparser_tw import metrics
+from dateparser_tw.metrics import Histogram, MetricsRegistry
+
+BASETIME = arrow.get("2024-07-15 10:00:00")
+
+
+@pytest.fixture
+def registry():
+    registry = metrics.enable(MetricsRegistry())
+    yield registry
+    metrics.disable()
+
+
+def counter_value(registry, name, **labels):
+    return registry.counter(name, **labels).value
+
+
+def test_disabled_by_default(parser):
+    assert not metrics.enabled
+    before = metrics.get_registry().snapshot()
+    parser.parse("明天下午三點", basetime=BASETIME)
+    assert metrics.get_registry().snapshot() == before
+
+
+def test_counts_parses_and_failures(parser, registry):
+    parser.parse("明天下午三點", basetime=BASETIME)
+    parser.parse("2024-07-15", basetime=BASETIME)
+    with pytest.raises(IndexError):
+        parser.parse("沒有時間", basetime=BASETIME)
+
+    assert counter_value(registry, "parses_total") == 3
+    assert counter_value(registry, "parse_failures_total", error="IndexError") == 1
+    assert registry.histogram("parse_seconds").count == 3
+
+    hits = counter_value(registry, "fast_path_total", path="numeric", result="hit")
+    assert hits == 1
+
+
+def test_parse_batch_failures(parser, registry):
+    assert parser.parse_batch(["明天", "沒有時間"], basetime=BASETIME)[1] is None
+
+    assert counter_value(registry, "parses_total") == 2
+    assert counter_value(registry, "parse_failures_total", error="IndexError") == 1
+
+
+def test_stage_histograms(parser, registry):
+    parser.parse("上週五下午三點", basetime=BASETIME)
+
+    stages = {
+        labels["stage"]
+        for name, labels in registry.histograms
+        if name == "stage_seconds"
+        for labels in [dict(labels)]
+    }
+    assert {"sanitize", "extract", "resolution"} <= stages
+
+
+def test_generic_parser_stages(registry):
+    from dateparser_tw.parser import Parser
+
+    Parser.parse("2024年5月12號", BASETIME)
+
+    for stage in Parser.STAGES:
+        assert registry.histogram("stage_seconds", stage=stage.__name__).count == 1
+
+
+@pytest.mark.parametrize(
+    "value, index", [(0.0, 0), (0.00001, 0), (0.00002, 1), (0.002, 7), (1.0, 13)]
+)
+def test_histogram_buckets(value, index):
+    histogram = Histogram()
+    histogram.observe(value)
+    assert histogram.counts[index] == 1
+    assert histogram.count == 1 and histogram.sum == value
+
+
+def test_prometheus_text():
+    registry = MetricsRegistry()
+    registry.counter("parse_failures_total", error="ValueError").inc(2)
+    registry.histogram("parse_seconds", buckets=(0.001, 0.01)).observe(0.005)
+
+    assert registry.to_prometheus() == (
+        "# TYPE dateparser_tw_parse_failures_total counter\n"
+        'dateparser_tw_parse_failures_total{error="ValueError"} 2\n'
+        "# TYPE dateparser_tw_parse_seconds histogram\n"
+        'dateparser_tw_parse_seconds_bucket{le="0.001"} 0\n'
+        'dateparser_tw_parse_seconds_bucket{le="0.01"} 1\n'
+        'dateparser_tw_parse_seconds_bucket{le="+Inf"} 1\n'
+        "dateparser_tw_parse_seconds_sum 0.005\n"
+        "dateparser_tw_parse_seconds_count 1\n"
+    )
+
+
+def test_snapshot():
+    registry = MetricsRegistry()
+    registry.counter("parses_total").inc()
+
+    assert registry.snapshot() == {
+        "counters": [{"name": "parses_total", "labels": {}, "value": 1}],
+        "histograms": [],
+    }
+
+
+def test_concurrent_updates():
+    registry = MetricsRegistry()
+    counter = registry.counter("parses_total")
+    histogram = registry.histogram("parse_seconds")
+
+    def work():
+        for _ in range(20_000):
+            counter.inc()
+            histogram.observe(0.001)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads as often as possible
+    try:
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert counter.value == histogram.count == sum(histogram.counts) == 160_000
@@ -0,0 +1,56 @@
+import arrow
+import pytest
+
+from dateparser_tw.dataclasses.timepoint import Granularity
+from dateparser_tw.numeric import parse_numeric
+
+
+@pytest.mark.parametrize(
+    "target, expected, granularity",
+    [
+        ("2024-07-15", "2024-07-15", Granularity.Date),
+        ("2024/7/15", "2024-07-15", Granularity.Date),
+        ("2024.7.5", "2024-07-05", Granularity.Date),
+        ("20240715", "2024-07-15", Granularity.Date),
+        ("2024-07-15 14:30", "2024-07-15 14:30:00", Granularity.DateTime),
+        ("2024-07-15T14:30:15", "2024-07-15 14:30:15", Granularity.DateTime),
+        ("2024/02/29 00:00", "2024-02-29 00:00:00", Granularity.DateTime),
+        ("14:30", "2024-07-15 14:30:00", Granularity.DateTime),
+        (" 09:05:07 ", "2024-07-15 09:05:07", Granularity.DateTime),
+    ],
+)
+def test_numeric(parser, target, expected, granularity):
+    res = parser.parse(target, basetime=arrow.get("2024-07-15 00:00:00"))
+    assert res.to_arrow() == arrow.get(expected)
+    assert res.granularity == granularity
+
+
+@pytest.mark.parametrize("target", ["2024-13-01", "2023-02-29", "25:00"])
+def test_numeric_out_of_range(target):
+    assert parse_numeric(target, arrow.get("2024-07-15")) is None
+
+
+@pytest.mark.parametrize(
+    "target, expected, granularity",
+    [
+        ("會議 2024/7/15", "2024-07-15", Granularity.Date),
+        ("會議 2024-07-15 14:30", "2024-07-15 14:30:00", Granularity.DateTime),
+        ("交貨日：2024-07-15T14:30:05", "2024-07-15 14:30:05", Granularity.DateTime),
+        ("請在2024/7/15 9:05前回覆", "2024-07-15 09:05:00", Granularity.DateTime),
+        # merged by sanitization with the words after them
+        ("2024/7/15下午3點", "2024-07-15 15:00:00", Granularity.DateHour),
+        ("2024/7/15 晚上", "2024-07-15", Granularity.DateWithPeriod),
+        ("會議 2024/7/15 明天", "2024-07-15", Granularity.Date),
+        ("2024-07-15 14:30明天", "2024-07-15 14:30:00", Granularity.DateTime),
+    ],
+)
+def test_numeric_within_text(parser, target, expected, granularity):
+    res = parser.parse(target, basetime=arrow.get("2024-07-01 00:00:00"))
+    assert res.to_arrow() == arrow.get(expected)
+    assert res.granularity == granularity
+
+
+def test_numeric_within_text_projected(parser):
+    res = parser.parse("會議 2024-07-15 14:30", "2024-07-01", max_granularity="date")
+    assert res.granularity == Granularity.Date
+    assert (res.year, res.month, res.day, res.hour) == (2024, 7, 15, 0)
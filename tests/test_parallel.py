@@ -0,0 +1,101 @@
+import os
+
+import pytest
+
+from dateparser_tw.dataclasses import TimePoint
+from dateparser_tw.dataclasses.timepoint import Granularity
+from dateparser_tw.parallel import (
+    FAILED,
+    NOT_FOUND,
+    NULL,
+    OK,
+    ROW_BYTES,
+    ResultColumns,
+    parse_parallel,
+)
+
+from .test_handlers import PHRASES
+
+BASETIME = "2024-07-15 10:00:00"
+TEXTS = PHRASES + ["沒有時間", "大前天", "晚上", "2024-05-03 15:30"]
+
+
+def expected(parser, text):
+    try:
+        return parser.parse(text, BASETIME), OK
+    except IndexError:
+        return None, NOT_FOUND
+    except (ValueError, KeyError):
+        return None, FAILED
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 4096), (2, 7)])
+def test_columns_agree_with_parser(parser, workers, chunk_size):
+    with parse_parallel(
+        TEXTS, BASETIME, workers=workers, chunk_size=chunk_size
+    ) as columns:
+        assert len(columns) == len(TEXTS)
+        for i, text in enumerate(TEXTS):
+            tp, status = expected(parser, text)
+            assert columns["status"][i] == status
+            assert columns.timepoint(i) == tp
+        assert list(columns["year"]) == [
+            NULL if tp is None or tp.year is None else tp.year
+            for tp in columns.timepoints()
+        ]
+
+
+def test_columns_are_typed_views():
+    with ResultColumns(3) as columns:
+        assert columns["year"].format == "h"
+        assert columns["month"].format == "b"
+        assert columns.shm.size >= 3 * ROW_BYTES
+        columns["year"][2] = 2024
+        assert columns["year"].tolist() == [0, 0, 2024]
+
+
+def test_write_round_trip():
+    tps = [
+        TimePoint(year=2024, month=7, day=16, granularity=Granularity.Date),
+        TimePoint(
+            year=1999,
+            month=12,
+            day=31,
+            hour=23,
+            minute=59,
+            second=59,
+            period_of_day="晚上",
+            granularity=Granularity.DateTime,
+        ),
+        TimePoint(hour=20, period_of_day="晚上"),
+    ]
+    with ResultColumns(len(tps) + 1) as columns:
+        for i, tp in enumerate(tps):
+            columns.write(i, tp)
+        columns.write(len(tps), None, NOT_FOUND)
+        assert columns.timepoints() == tps + [None]
+        assert columns["hour"][0] == NULL
+
+
+def test_attach_shares_memory():
+    with ResultColumns(2) as owner:
+        attached = ResultColumns(2, owner.name)
+        attached.write(1, TimePoint(year=2024, month=1, day=1))
+        attached.close()
+        assert owner["year"][1] == 2024
+        assert os.path.exists(f"/dev/shm/{owner.name.lstrip('/')}")
+    assert not os.path.exists(f"/dev/shm/{owner.name.lstrip('/')}")
+
+
+def test_empty():
+    with parse_parallel([], BASETIME, workers=1) as columns:
+        assert columns.timepoints() == []
+
+
+def test_to_numpy():
+    np = pytest.importorskip("numpy")
+    with parse_parallel(["明天", "沒有時間"], BASETIME, workers=1) as columns:
+        arrays = columns.to_numpy()
+        assert arrays["year"].dtype == np.int16
+        assert arrays["status"].tolist() == [OK, NOT_FOUND]
+        del arrays
@@ -0,0 +1,79 @@
+import arrow
+import pytest
+
+from dateparser_tw import metrics
+from dateparser_tw.metrics import MetricsRegistry
+from dateparser_tw.normalizer import sanitize_date
+from dateparser_tw.parser import Parser
+from dateparser_tw.phrasegen import OUTPUT, generate, render
+from dateparser_tw.phrases import PHRASES, lookup
+
+from .test_handlers import BASETIMES
+
+
+@pytest.mark.parametrize("basetime", BASETIMES)
+def test_table_agrees_with_parser(basetime):
+    basetime = arrow.get(basetime, tzinfo="Asia/Taipei")
+    for text in PHRASES:
+        assert lookup(text, basetime) == Parser.parse(
+            sanitize_date(text), basetime
+        ), text
+
+
+def test_table_is_up_to_date():
+    assert OUTPUT.read_text(encoding="utf-8") == render(generate())
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "今天",
+        "明天",
+        "後天",
+        "上個月",
+        "下下週",
+        "明年",
+        "去年",
+        "本週五",
+        "週五",
+        "今晚",
+        "明天晚上",
+    ],
+)
+def test_common_phrases_are_listed(text):
+    assert text in PHRASES
+
+
+@pytest.mark.parametrize("text", ["前天今晚", "昨日今早", "明天今晚"])
+def test_day_and_dated_period_are_not_listed(text):
+    assert text not in PHRASES
+
+
+def test_variants_are_looked_up():
+    basetime = arrow.get("2024-07-15")
+    assert lookup("下周五", basetime) == lookup("下週五", basetime)
+    assert lookup("礼拜天", basetime) == lookup("禮拜天", basetime)
+
+
+def test_period_alone_is_today(parser):
+    assert str(parser.parse("今晚", "2024-07-15 10:00:00")) == "2024年07月15日今晚"
+    assert str(parser.parse("晚上", "2024-07-15 10:00:00")) == "2024年07月15日晚上"
+
+
+def test_parse_skips_the_pipeline(parser):
+    registry = metrics.enable(MetricsRegistry())
+    try:
+        assert str(parser.parse("下週五", "2024-07-15")) == "2024年07月26日"
+        assert str(parser.parse("下週五開會", "2024-07-15")) == "2024年07月26日"
+    finally:
+        metrics.disable()
+
+    hits = registry.counter("fast_path_total", path="phrase", result="hit").value
+    misses = registry.counter("fast_path_total", path="phrase", result="miss").value
+    assert (hits, misses) == (1, 1)
+
+
+def test_other_texts_are_not_looked_up():
+    basetime = arrow.get("2024-07-15")
+    assert lookup("明天下午3點", basetime) is None
+    assert lookup("大前天", basetime) is None
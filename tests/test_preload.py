@@ -0,0 +1,84 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from dateparser_tw import metrics
+from dateparser_tw.metrics import MetricsRegistry
+from dateparser_tw.preload import preload, warm_up
+
+# a worker forked after an optional `preload`, reporting the memory its first
+# request stopped sharing with the parent; benchmarks/bench_preload.py times it
+WORKER = textwrap.dedent("""
+    import gc, json, os, sys
+
+    import dateparser_tw
+
+    if sys.argv[1] == "preload":
+        dateparser_tw.preload()
+    parser = dateparser_tw.DateParser()
+
+
+    def private_kb():
+        with open("/proc/self/smaps_rollup") as f:
+            return sum(
+                int(line.split()[1])
+                for line in f
+                if line.startswith(("Private_Clean", "Private_Dirty"))
+            )
+
+
+    r, w = os.pipe()
+    if os.fork() == 0:
+        before = private_kb()
+        parser.parse("下週5晚上8點", "2024-07-15 10:00:00")
+        gc.collect()
+        report = {"private_kb": private_kb() - before}
+        os.write(w, json.dumps(report).encode())
+        os._exit(0)
+    os.wait()
+    print(os.read(r, 1024).decode())
+    """)
+
+
+def fork_worker(mode):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-c", WORKER, mode],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        check=True,
+        cwd=root,
+        text=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_warm_up_parses_every_phrase():
+    assert warm_up() == []
+
+
+def test_warm_up_is_not_counted():
+    registry = metrics.enable(MetricsRegistry())
+    try:
+        preload(freeze=False)
+        assert registry.snapshot() == MetricsRegistry().snapshot()
+        assert metrics.enabled
+    finally:
+        metrics.disable()
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "fork") or not os.path.exists("/proc/self/smaps_rollup"),
+    reason="needs fork and /proc/self/smaps_rollup",
+)
+def test_forked_worker_shares_preloaded_state():
+    cold = [fork_worker("cold") for _ in range(2)]
+    warm = [fork_worker("preload") for _ in range(2)]
+
+    # without frozen state, the first collection in the child alone touches
+    # (and copies) the pages of every object of the parent
+    assert max(w["private_kb"] for w in warm) < min(c["private_kb"] for c in cold) / 2
@@ -0,0 +1,91 @@
+import arrow
+import pytest
+
+from dateparser_tw.dataclasses import TimePoint, truncate
+from dateparser_tw.dataclasses.timepoint import Granularity
+
+from .test_handlers import BASETIMES, PHRASES
+
+SENTENCES = [
+    "明天下午三點開會",
+    "記得上週五晚上8點的那個案子",
+    "2024-07-15T10:30",
+    "2024/2/29",
+    "三個月後要交報告",
+    "5小時後提醒你",
+]
+CAPS = [
+    Granularity.Year,
+    Granularity.YearMonth,
+    Granularity.Date,
+    Granularity.DateWithPeriod,
+    Granularity.DateHour,
+]
+
+
+def outcome(func, *args, **kwargs):
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        return type(e)
+
+
+@pytest.mark.parametrize("basetime", BASETIMES)
+@pytest.mark.parametrize("max_granularity", CAPS)
+def test_same_as_truncated(parser, basetime, max_granularity):
+    for text in [*PHRASES, *SENTENCES]:
+        full = outcome(parser.parse, text, basetime)
+        expected = (
+            truncate(full, max_granularity) if isinstance(full, TimePoint) else full
+        )
+        projected = outcome(parser.parse, text, basetime, max_granularity)
+        assert projected == expected, text
+
+
+def test_parse_batch(parser):
+    results = parser.parse_batch(
+        ["明天晚上8點", "沒有時間"], basetime="2024-07-15", max_granularity="date"
+    )
+    assert results == [
+        TimePoint(
+            year=2024, month=7, day=16, hour=0, minute=0, second=0, granularity="date"
+        ),
+        None,
+    ]
+
+
+@pytest.mark.parametrize(
+    "max_granularity, expected",
+    [
+        ("year", "2024年"),
+        ("year_month", "2024年7月"),
+        ("date", "2024年07月16日"),
+        ("date_with_period", "2024年07月16日晚上"),
+        ("date_hour", "2024年07月16日20點"),
+        ("datetime", "2024年07月16日20點30分00秒"),
+    ],
+)
+def test_truncate(max_granularity, expected):
+    tp = TimePoint(
+        year=2024,
+        month=7,
+        day=16,
+        period_of_day="晚上",
+        hour=20,
+        minute=30,
+        second=0,
+        granularity="datetime",
+    )
+    assert str(truncate(tp, Granularity(max_granularity))) == expected
+
+
+def test_truncate_without_period():
+    tp = TimePoint(
+        year=2024, month=7, day=16, hour=20, minute=0, second=0, granularity="date_hour"
+    )
+    assert truncate(tp, Granularity.DateWithPeriod).granularity == Granularity.Date
+
+
+def test_keeps_coarser(parser):
+    tp = parser.parse("2024年5月", basetime=arrow.get("2024-07-15"))
+    assert parser.parse("2024年5月", "2024-07-15", "date_hour") == tp
@@ -70,3 +70,10 @@ def test_relative_year(parser, target, expected):
 def test_relative_week(parser, target, expected):
     res = parser.parse(target, basetime="2024-07-15")
     assert res.to_arrow() == arrow.get(expected)
+
+
+def test_parse_batch_failing_texts(parser):
+    # `大前天` raises a KeyError and `沒有時間` an IndexError
+    results = parser.parse_batch(["大前天", "明天", "沒有時間"], "2024-07-15")
+    assert [tp is None for tp in results] == [True, False, True]
+    assert results[1].to_arrow() == arrow.get("2024-07-16")
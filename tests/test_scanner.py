@@ -0,0 +1,88 @@
+import arrow
+import pytest
+
+from dateparser_tw.helpers.corpus import generate_corpus
+from dateparser_tw.normalizer import sanitize_date_with_offsets
+from dateparser_tw import scanner
+from dateparser_tw.scanner import Scanner
+
+BASETIME = arrow.get("2024-07-15 10:00:00")
+DATA = "\n".join(generate_corpus(8, length=60, density=0.4, seed=3)).encode()
+
+
+def chunked(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.fixture(scope="module")
+def reference():
+    return list(Scanner(BASETIME, chunk_size=len(DATA)).scan_chunks([DATA]))
+
+
+@pytest.mark.parametrize("chunk_size", [3, 17, 64, 250])
+def test_same_as_single_chunk(reference, chunk_size):
+    scanner = Scanner(BASETIME, chunk_size=chunk_size, overlap=32)
+    assert list(scanner.scan_chunks(chunked(DATA, chunk_size))) == reference
+
+
+def test_byte_offsets(reference):
+    assert reference
+    for span in reference:
+        original = DATA[span.start : span.end].decode()
+        assert sanitize_date_with_offsets(original, local=True)[0] == span.text
+
+
+def test_invalid_bytes():
+    data = "會議".encode() + b"\xff\xfe" + "明天下午三點".encode()
+    (span,) = Scanner(BASETIME, overlap=4).scan_chunks(chunked(data, 5))
+
+    assert data[span.start : span.end].decode() == "明天下午三點"
+    assert str(span.result) == "2024年07月16日15點"
+
+
+def test_sunday_rewrite_is_local():
+    spans = list(Scanner(BASETIME).scan_chunks(["星期天開會，明天見".encode()]))
+    assert [span.text for span in spans] == ["星期7", "明天"]
+    assert str(spans[1].result) == "2024年07月16日"
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_scan_file(tmp_path, reference, use_mmap):
+    path = tmp_path / "dump.txt"
+    path.write_bytes(DATA)
+
+    scanner = Scanner(BASETIME, chunk_size=100, overlap=32)
+    assert list(scanner.scan_file(path, use_mmap=use_mmap)) == reference
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    assert list(Scanner(BASETIME).scan_file(path)) == []
+
+
+def test_numeric_span():
+    (span,) = Scanner(BASETIME).scan_chunks(["會議 2024/7/15".encode()])
+    assert str(span.result) == "2024年07月15日"
+
+
+def test_long_run_of_matches(monkeypatch):
+    sanitized = []
+
+    def counted(text, local=False):
+        sanitized.append(len(text))
+        return sanitize_date_with_offsets(text, local)
+
+    monkeypatch.setattr(scanner, "sanitize_date_with_offsets", counted)
+    data = ("明天" * 4000).encode()
+    spans = list(
+        Scanner(BASETIME, chunk_size=64, overlap=32).scan_chunks(chunked(data, 64))
+    )
+
+    # split into pieces covering the run, each chunk scanned with a bounded carry
+    assert spans[0].start == 0 and spans[-1].end == len(data)
+    assert all(a.end == b.start for a, b in zip(spans, spans[1:]))
+    assert max(len(span.text) for span in spans) <= 64
+    assert max(sanitized) <= 64 + 2 * 32
+    # about 5x for 21 characters a chunk, a run carried whole would be ~800x
+    assert sum(sanitized) <= 5 * len("明天" * 4000)
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import socket
+import threading
+
+import arrow
+import pytest
+
+from dateparser_tw.client import ParseClient
+from dateparser_tw.server import HEADER, ParseServer, encode_frame
+
+
+@pytest.fixture(scope="module")
+def running():
+    loop = asyncio.new_event_loop()
+    server = ParseServer(batch_window=0.005)
+    listener = loop.run_until_complete(server.start_tcp("127.0.0.1", 0))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    yield loop, server, listener
+
+    async def shutdown():
+        listener.close()
+        await server.close()
+
+    asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def address(running):
+    _, _, listener = running
+    return listener.sockets[0].getsockname()
+
+
+@pytest.fixture(scope="module")
+def unix_path(running, tmp_path_factory):
+    # unix sockets have small buffers, a client not reading fills them quickly
+    loop, server, _ = running
+    path = str(tmp_path_factory.mktemp("server") / "parse.sock")
+    listener = asyncio.run_coroutine_threadsafe(server.start_unix(path), loop).result()
+    yield path
+    loop.call_soon_threadsafe(listener.close)
+
+
+def test_parse(parser, address):
+    host, port = address
+    with ParseClient(host=host, port=port) as client:
+        res = client.parse("明天下午三點", basetime="2024-07-15")
+
+    assert res == parser.parse("明天下午三點", basetime="2024-07-15")
+
+
+def test_parse_many(parser, address):
+    host, port = address
+    texts = ["今天", "上週五", "2024年5月3日", "三天前"] * 25
+    basetime = arrow.get("2024-07-15")
+
+    with ParseClient(host=host, port=port) as client:
+        results = client.parse_many(texts, basetime=basetime)
+        stats = client.stats()
+
+    assert results == [parser.parse(text, basetime=basetime) for text in texts]
+    assert stats["max_batch_size"] > 1
+
+
+def test_error(address):
+    host, port = address
+    with ParseClient(host=host, port=port) as client:
+        with pytest.raises(ValueError, match="IndexError"):
+            client.parse("沒有時間", basetime="2024-07-15")
+        assert client.parse("今天", basetime="2024-07-15").day == 15
+
+
+def exchange(address, frames: bytes, count: int) -> list:
+    """Send raw frames on one connection, the server batches them together."""
+    with socket.create_connection(address, timeout=5) as sock:
+        sock.sendall(frames)
+        file = sock.makefile("rb")
+        responses = []
+        for _ in range(count):
+            (size,) = HEADER.unpack(file.read(HEADER.size))
+            responses.append(json.loads(file.read(size)))
+    return responses
+
+
+def test_invalid_requests(address):
+    payload = b"[1, 2]"
+    frames = HEADER.pack(len(payload)) + payload
+    frames += encode_frame({"id": 1, "basetime": "2024-07-15"})
+    frames += encode_frame({"id": 2, "text": "今天", "basetime": ["2024-07-15"]})
+    frames += encode_frame({"id": 3, "text": "今天", "basetime": "2024-07-15"})
+    responses = exchange(address, frames, 4)
+
+    assert "must be an object" in responses[0]["error"]
+    assert responses[1] == {"id": 1, "error": "ValueError: text is required"}
+    assert "basetime must be" in responses[2]["error"]
+    assert responses[3]["result"]["day"] == 15
+
+
+def test_basetimes_in_one_batch(address):
+    frames = b"".join(
+        encode_frame({"id": i, "text": text, "basetime": basetime})
+        for i, (text, basetime) in enumerate(
+            [
+                ("今天", "2024-07-15"),
+                ("今天", "2023-01-01"),
+                ("沒有時間", "2024-07-15"),
+                ("今天", "not a time"),
+            ]
+        )
+    )
+    responses = {response["id"]: response for response in exchange(address, frames, 4)}
+
+    assert responses[0]["result"]["year"] == 2024
+    assert responses[1]["result"]["year"] == 2023
+    assert responses[2]["error"].startswith("IndexError")
+    assert "error" in responses[3]
+
+
+def test_client_not_reading(parser, unix_path):
+    """A client pipelining requests without reading the responses doesn't hold
+    up the others."""
+    request = encode_frame({"id": 0, "text": "明天", "basetime": "2024-07-15"})
+    stalled = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stalled.connect(unix_path)
+
+    def send():
+        try:
+            stalled.sendall(request * 20_000)  # blocks once the server stops reading
+        except OSError:
+            pass  # closed by the test
+
+    threading.Thread(target=send, daemon=True).start()
+    try:
+        with ParseClient(unix_path, timeout=5) as client:
+            res = client.parse("明天", basetime="2024-07-15")
+        assert res == parser.parse("明天", basetime="2024-07-15")
+    finally:
+        stalled.close()
@@ -0,0 +1,79 @@
+import sqlite3
+
+import pytest
+
+from dateparser_tw.bounds import epoch_bounds
+from dateparser_tw.formatting import format_timepoint
+from dateparser_tw.sqlite import register
+
+BASETIME = "2024-07-15 10:00:00"
+TEXTS = ["明天下午三點", "下週五", "上個月", "2024年5月3日", "三天後", "去年"]
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE tickets (body TEXT, created TEXT)")
+    yield connection
+    connection.close()
+
+
+def test_functions_agree_with_parser(parser, connection):
+    register(connection)
+    query = (
+        "SELECT tw_parse(?1, ?2), tw_epoch_start(?1, ?2), tw_epoch_end(?1, ?2),"
+        " tw_granularity(?1, ?2)"
+    )
+    for text in TEXTS:
+        tp = parser.parse(text, BASETIME)
+        row = connection.execute(query, (text, BASETIME)).fetchone()
+        assert row == (
+            format_timepoint(tp, "iso"),
+            *epoch_bounds(tp),
+            tp.granularity.value,
+        )
+
+
+@pytest.mark.parametrize(
+    "text, basetime",
+    [("沒有時間", BASETIME), (None, BASETIME), ("明天", None), ("大前天", BASETIME)],
+)
+def test_null_when_nothing_is_parsed(connection, text, basetime):
+    register(connection)
+    row = connection.execute(
+        "SELECT tw_parse(?1, ?2), tw_epoch_start(?1, ?2), tw_granularity(?1, ?2)",
+        (text, basetime),
+    ).fetchone()
+    assert row == (None, None, None)
+
+
+def test_zh_style_and_epoch_basetime(parser, connection):
+    register(connection, style="zh")
+    epoch = parser.parse("2024-07-15 10:00:00").to_arrow().int_timestamp
+    (result,) = connection.execute("SELECT tw_parse('明天', ?)", (epoch,)).fetchone()
+    assert result == "2024年07月16日"
+
+
+def test_update_parses_repeated_values_once(connection):
+    functions = register(connection)
+    rows = [(TEXTS[i % len(TEXTS)], BASETIME) for i in range(600)]
+    connection.executemany("INSERT INTO tickets VALUES (?, ?)", rows)
+    connection.execute("ALTER TABLE tickets ADD COLUMN due INTEGER")
+    connection.execute("ALTER TABLE tickets ADD COLUMN until INTEGER")
+    connection.execute(
+        "UPDATE tickets SET due = tw_epoch_start(body, created),"
+        " until = tw_epoch_end(body, created)"
+    )
+
+    assert functions.result.cache_info().misses == len(TEXTS)
+    (count,) = connection.execute(
+        "SELECT count(*) FROM tickets WHERE due < until"
+    ).fetchone()
+    assert count == len(rows)
+
+
+def test_connections_have_their_own_cache():
+    first, second = sqlite3.connect(":memory:"), sqlite3.connect(":memory:")
+    functions = register(first), register(second)
+    first.execute("SELECT tw_parse('明天', ?)", (BASETIME,)).fetchone()
+    assert [f.result.cache_info().currsize for f in functions] == [1, 0]